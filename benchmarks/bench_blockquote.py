@@ -0,0 +1,76 @@
+import sys
+import time
+import argparse
+
+from html2txt import parsers
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program compares the time of rendering email threads with deeply
+# nested quoted replies in one pass (QuoteBuffer.render) and by quoting
+# the lines of each blockquote again in every enclosing one
+# (QuoteBuffer.render_nested).
+#
+
+def email_thread(depth, lines):
+  html = ''
+  for level in range(depth):
+    body = '<br>'.join('reply %d line %d of the quoted message' % (level, line) for line in range(lines))
+    html = '<p>%s</p><blockquote>%s</blockquote>' % (body, html)
+  return '<div>%s</div>' % (html,)
+
+def measure(root, repeat):
+  start = time.perf_counter()
+  for i in range(repeat):
+    m = parsers.MarkdownVisitor()
+    m.visit(root)
+  return (time.perf_counter() - start) / repeat, len(m.text)
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_blockquote")
+  parser.add_argument("--lines", help="Number of lines of each reply", type=int, default=20)
+  parser.add_argument("--repeat", help="Number of times each thread is rendered", type=int, default=3)
+
+  args = vars(parser.parse_args())
+
+  render = parsers.QuoteBuffer.render
+  print("depth  output chars  one pass  nested")
+  for depth in [5, 10, 20, 50]:
+    root = parsers.HtmlParser().parse(email_thread(depth, args['lines']))
+    one_pass, size = measure(root, args['repeat'])
+    parsers.QuoteBuffer.render = parsers.QuoteBuffer.render_nested
+    try:
+      nested, size = measure(root, args['repeat'])
+    finally:
+      parsers.QuoteBuffer.render = render
+    print("%5d  %12d  %7.3fs  %6.3fs" % (depth, size, one_pass, nested,))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
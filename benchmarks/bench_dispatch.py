@@ -0,0 +1,106 @@
+import os
+import sys
+import argparse
+import timeit
+
+from html2txt import parsers
+from html2txt.parsers import visitor as v
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program measures the per-node cost of visitor dispatch and of the
+# markdown conversion of the parsed breakdance fixtures.
+#
+
+class CountingVisitor:
+  def __init__(self):
+    self.count_ = 0
+
+  @v.on('node')
+  def visit(self, node):
+    pass
+
+  @visit.when(parsers.Node)
+  def visit(self, node):
+    self.count_ += 1
+    for n in node.children_:
+      self.visit(n)
+
+def parse_files(basePath):
+  trees = []
+  for path, subdirs, files in os.walk(basePath):
+    for x in sorted(files):
+      if x.endswith('.html'):
+        with open(os.path.join(path, x), 'r', errors='replace') as f:
+          data = f.read()
+        # Skip the fixtures that fail to convert
+        try:
+          tree = parsers.HtmlParser().parse(data)
+          parsers.MarkdownVisitor().visit(tree)
+        except Exception:
+          continue
+        trees.append(tree)
+  return trees
+
+def dispatch(trees):
+  c = CountingVisitor()
+  for tree in trees:
+    c.visit(tree)
+  return c.count_
+
+def convert(trees):
+  for tree in trees:
+    parsers.MarkdownVisitor().visit(tree)
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_dispatch")
+  parser.add_argument("--path", help="Path of the HTML files to convert", default="tests/breakdance/fixtures")
+  parser.add_argument("--repeat", help="Number of timing runs", type=int, default=5)
+
+  args = vars(parser.parse_args())
+
+  basePath = os.path.abspath(os.path.expanduser(args['path']))
+
+  trees = parse_files(basePath)
+  nodes = dispatch(trees)
+  if nodes == 0:
+    print("no nodes found in %s" % (basePath,))
+    return 1
+
+  dispatch_time = min(timeit.repeat(lambda: dispatch(trees), number=1, repeat=args['repeat']))
+  convert_time = min(timeit.repeat(lambda: convert(trees), number=1, repeat=args['repeat']))
+
+  print("documents         = %d" % (len(trees),))
+  print("nodes             = %d" % (nodes,))
+  print("dispatch per node = %.0f ns" % (1e9 * dispatch_time / nodes,))
+  print("convert per node  = %.0f ns" % (1e9 * convert_time / nodes,))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import argparse
+
+from html2txt import converters
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program compares the time of converting the svgweb and mathml
+# corpora with the content of svg and math elements kept as XmlIslandNode
+# events (xml_islands=True) and as ast.Node trees, and checks that the
+# markdown is the same.
+#
+
+def load_documents(path):
+  documents = []
+  for dirpath, subdirs, files in os.walk(path):
+    subdirs.sort()
+    for x in sorted(files):
+      if x.endswith('.html') or x.endswith('.svg'):
+        with open(os.path.join(dirpath, x), 'r', encoding='utf-8', errors='replace') as f:
+          documents.append(f.read())
+  return documents
+
+def convert_all(documents, xml_islands):
+  h = converters.Html2Markdown(xml_islands=xml_islands)
+  texts = []
+  for data in documents:
+    try:
+      texts.append(h.convert(data))
+    except Exception as e:
+      texts.append(type(e).__name__)
+  return texts
+
+def measure(documents, xml_islands, repeat):
+  best = None
+  for i in range(repeat):
+    start = time.perf_counter()
+    texts = convert_all(documents, xml_islands)
+    elapsed = time.perf_counter() - start
+    if best is None or elapsed < best:
+      best = elapsed
+  return best, texts
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_islands")
+  parser.add_argument("--path", help="Path of the test corpora", default="tests")
+  parser.add_argument("--repeat", help="Number of runs (the best is kept)", type=int, default=5)
+
+  args = vars(parser.parse_args())
+
+  status = 0
+  print("corpus   documents     nodes   islands  same output")
+  for corpus in ['svgweb', 'mathml']:
+    documents = load_documents(os.path.join(args['path'], corpus))
+    nodes, node_texts = measure(documents, False, args['repeat'])
+    islands, island_texts = measure(documents, True, args['repeat'])
+    same = node_texts == island_texts
+    if not same:
+      status = 1
+    print("%-7s  %9d  %7.3fs  %7.3fs  %s" % (corpus, len(documents), nodes, islands, same,))
+  return status
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,89 @@
+import sys
+import gc
+import argparse
+import tracemalloc
+
+from html2txt import parsers
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program measures the memory retained per ast.Node for a large
+# generated document (a table of links, inline markup and images), as an
+# ast.Node tree and as a ColumnarTree.
+#
+
+ROW = '<tr><td><a href="/x">link</a></td><td><b>bold</b> text<br></td><td><img src="a.png"></td></tr>'
+
+def count_nodes(root):
+  count = 0
+  stack = [root]
+  while len(stack) > 0:
+    node = stack.pop()
+    count += 1
+    stack.extend(node.children_)
+  return count
+
+def measure(method, data):
+  gc.collect()
+  tracemalloc.start()
+  tree = method(data)
+  gc.collect()
+  current, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  del tree
+  return current, peak
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_memory")
+  parser.add_argument("--rows", help="Number of table rows in the document", type=int, default=50000)
+
+  args = vars(parser.parse_args())
+
+  data = '<table>' + ROW * args['rows'] + '</table>'
+
+  # Loads the parser tables before measuring
+  parsers.HtmlParser().parse('<p>warm up</p>')
+  parsers.HtmlParser().parse_columnar('<p>warm up</p>')
+
+  node_current, node_peak = measure(parsers.HtmlParser().parse, data)
+  columnar_current, columnar_peak = measure(parsers.HtmlParser().parse_columnar, data)
+
+  nodes = count_nodes(parsers.HtmlParser().parse(data))
+
+  print("nodes               = %d" % (nodes,))
+  print("ast retained        = %.1f MB" % (node_current / 1e6,))
+  print("ast peak            = %.1f MB" % (node_peak / 1e6,))
+  print("ast bytes/node      = %.1f" % (node_current / nodes,))
+  print("columnar retained   = %.1f MB" % (columnar_current / 1e6,))
+  print("columnar peak       = %.1f MB" % (columnar_peak / 1e6,))
+  print("columnar bytes/node = %.1f" % (columnar_current / nodes,))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+from html2txt import parsers
+from html2txt.parsers.etreehtmlparser import ETreeHTMLParser
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program compares peak memory and time of building the ast.Node tree
+# through an intermediate ElementTree and directly with AstTreeBuilder.
+#
+
+def parse_etree(data):
+  etree_parser = ETreeHTMLParser()
+  etree_parser.feed(data)
+  p = parsers.HtmlParser()
+  p.namespace_map_ = etree_parser.namespace_uri_map()
+  return p.parse_tree(etree_parser.getFragment())
+
+def parse_direct(data):
+  return parsers.HtmlParser().parse(data)
+
+def measure(method, documents):
+  tracemalloc.start()
+  start = time.perf_counter()
+  for data in documents:
+    try:
+      method(data)
+    except Exception:
+      pass
+  elapsed = time.perf_counter() - start
+  current, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return elapsed, peak
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_parse")
+  parser.add_argument("--path", help="Path of the HTML files to parse", default="tests")
+  parser.add_argument("--repeat", help="Number of copies of the input to parse", type=int, default=1)
+
+  args = vars(parser.parse_args())
+
+  basePath = os.path.abspath(os.path.expanduser(args['path']))
+
+  documents = []
+  for path, subdirs, files in os.walk(basePath):
+    for x in sorted(files):
+      if x.endswith('.html') or x.endswith('.svg'):
+        with open(os.path.join(path, x), 'r', errors='replace') as f:
+          documents.append(f.read())
+  documents = documents * args['repeat']
+  if len(documents) == 0:
+    print("no documents found in %s" % (basePath,))
+    return 1
+
+  etree_time, etree_peak = measure(parse_etree, documents)
+  direct_time, direct_peak = measure(parse_direct, documents)
+
+  print("documents         = %d" % (len(documents),))
+  print("etree time        = %.3f s" % (etree_time,))
+  print("direct time       = %.3f s" % (direct_time,))
+  # Peak is the largest single document (intermediate trees included)
+  print("etree peak        = %.1f MB" % (etree_peak / 1e6,))
+  print("direct peak       = %.1f MB" % (direct_peak / 1e6,))
+  print("peak reduction    = %.1f%%" % (100.0 * (etree_peak - direct_peak) / etree_peak,))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,121 @@
+import os
+import sys
+import time
+import argparse
+import re
+
+from html2txt import converters
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program compares the time of converting the pages of the breakdance
+# and html2txt corpora that have script or style elements with the content
+# of the ignored elements skipped by the parser (prune_ignored=True) and
+# kept as ast.Node trees. Only the pages with the same markdown both ways
+# are timed. Pages where the markdown with pruning has all the text of the
+# markdown without it and more (the content after an unclosed <meta> or
+# <link>, which the tree nests in the void element) are counted as kept,
+# and any other difference is counted as lost and is an error.
+#
+
+IGNORED_CONTENT = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+WHITESPACE = re.compile(r'\s+')
+
+def load_documents(path, min_share):
+  # Returns the documents with at least min_share of their characters in
+  # script and style elements
+  documents = []
+  for dirpath, subdirs, files in os.walk(path):
+    subdirs.sort()
+    for x in sorted(files):
+      if x.endswith('.html'):
+        with open(os.path.join(dirpath, x), 'r', encoding='utf-8', errors='replace') as f:
+          data = f.read()
+        ignored = sum(len(m.group(0)) for m in IGNORED_CONTENT.finditer(data))
+        if len(data) > 0 and ignored >= min_share * len(data):
+          documents.append(data)
+  return documents
+
+def convert_all(documents, prune_ignored):
+  h = converters.Html2Markdown(prune_ignored=prune_ignored)
+  texts = []
+  for data in documents:
+    try:
+      texts.append(h.convert(data))
+    except Exception as e:
+      texts.append(None)
+  return texts
+
+def measure(documents, prune_ignored, repeat):
+  best = None
+  for i in range(repeat):
+    start = time.perf_counter()
+    texts = convert_all(documents, prune_ignored)
+    elapsed = time.perf_counter() - start
+    if best is None or elapsed < best:
+      best = elapsed
+  return best, texts
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_prune")
+  parser.add_argument("--path", help="Path of the test corpora", default="tests")
+  parser.add_argument("--min-share", help="Minimum share of the characters of a page in script and style elements", type=float, default=0.01)
+  parser.add_argument("--repeat", help="Number of runs (the best is kept)", type=int, default=5)
+
+  args = vars(parser.parse_args())
+
+  status = 0
+  print("corpus       documents     nodes    pruned   kept   lost")
+  for corpus in ['breakdance', 'html2txt']:
+    documents = load_documents(os.path.join(args['path'], corpus), args['min_share'])
+    node_texts = convert_all(documents, False)
+    pruned_texts = convert_all(documents, True)
+    same = []
+    kept = 0
+    lost = 0
+    for data, node_text, pruned_text in zip(documents, node_texts, pruned_texts):
+      if node_text is None:
+        continue
+      if pruned_text == node_text:
+        same.append(data)
+      elif pruned_text is not None and WHITESPACE.sub('', node_text) in WHITESPACE.sub('', pruned_text):
+        kept += 1
+      else:
+        lost += 1
+    if lost > 0:
+      status = 1
+    nodes, node_texts = measure(same, False, args['repeat'])
+    pruned, pruned_texts = measure(same, True, args['repeat'])
+    if node_texts != pruned_texts:
+      status = 1
+    print("%-11s  %9d  %7.3fs  %7.3fs  %5d  %5d" % (corpus, len(same), nodes, pruned, kept, lost,))
+  return status
+
+if __name__ == "__main__":
+  sys.exit(main())
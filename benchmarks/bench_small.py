@@ -0,0 +1,80 @@
+import os
+import sys
+import argparse
+import timeit
+
+from html2txt import parsers
+from html2txt import converters
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program measures the throughput of converting many small HTML
+# snippets with a new Html2Markdown per snippet and with one reused
+# Html2Markdown.
+#
+
+snippets = [
+  '<p>Thanks, see you <b>tomorrow</b>.</p>',
+  '<div>Re: <a href="https://example.com/a">the report</a></div>',
+  '<ul><li>one</li><li>two</li></ul>',
+  'plain text with &amp; entity',
+  '<blockquote><p>quoted reply</p></blockquote><p>answer</p>',
+]
+
+def convert_new(count):
+  for i in range(count):
+    converters.Html2Markdown().convert(snippets[i % len(snippets)])
+
+def convert_reused(count):
+  h = converters.Html2Markdown()
+  for i in range(count):
+    h.convert(snippets[i % len(snippets)])
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_small")
+  parser.add_argument("--count", help="Number of snippets to convert", type=int, default=20000)
+  parser.add_argument("--repeat", help="Number of timing runs", type=int, default=5)
+
+  args = vars(parser.parse_args())
+
+  count = args['count']
+  repeat = args['repeat']
+
+  init_time = min(timeit.repeat(lambda: parsers.HtmlParser(), number=count, repeat=repeat))
+  new_time = min(timeit.repeat(lambda: convert_new(count), number=1, repeat=repeat))
+  reused_time = min(timeit.repeat(lambda: convert_reused(count), number=1, repeat=repeat))
+
+  print("snippets          = %d" % (count,))
+  print("HtmlParser()      = %.2f us" % (1e6 * init_time / count,))
+  print("new converter     = %.2f us/snippet (%.0f snippets/s)" % (1e6 * new_time / count, count / new_time,))
+  print("reused converter  = %.2f us/snippet (%.0f snippets/s)" % (1e6 * reused_time / count, count / reused_time,))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,102 @@
+import os
+import sys
+import argparse
+import timeit
+
+from html.parser import HTMLParser
+
+from html2txt.parsers.etreehtmlparser import ETreeHTMLParser, parse_starttag
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program measures the per-tag cost of start tag attribute parsing
+# with the expat fragment parser and with parse_starttag().
+#
+
+class StartTagCollector(HTMLParser):
+  def __init__(self):
+    super(StartTagCollector, self).__init__()
+    self.starttags = []
+
+  def handle_starttag(self, tag, attrs):
+    self.starttags.append(self.get_starttag_text())
+
+def collect_starttags(basePath):
+  collector = StartTagCollector()
+  for path, subdirs, files in os.walk(basePath):
+    for x in sorted(files):
+      if x.endswith('.html') or x.endswith('.svg'):
+        with open(os.path.join(path, x), 'r', errors='replace') as f:
+          collector.feed(f.read())
+  return collector.starttags
+
+def parse_xml(parser, starttags):
+  for starttag_text in starttags:
+    try:
+      parser.parse_starttag_xml(starttag_text)
+    except Exception:
+      pass
+
+def parse_fast(parser, starttags):
+  for starttag_text in starttags:
+    if parse_starttag(starttag_text) is None:
+      try:
+        parser.parse_starttag_xml(starttag_text)
+      except Exception:
+        pass
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_starttag")
+  parser.add_argument("--path", help="Path of the HTML files to scan for start tags", default="tests")
+  parser.add_argument("--repeat", help="Number of timing runs", type=int, default=5)
+
+  args = vars(parser.parse_args())
+
+  basePath = os.path.abspath(os.path.expanduser(args['path']))
+
+  starttags = collect_starttags(basePath)
+  if len(starttags) == 0:
+    print("no start tags found in %s" % (basePath,))
+    return 1
+
+  fast_count = sum(1 for x in starttags if parse_starttag(x) is not None)
+
+  etree_parser = ETreeHTMLParser()
+  xml_time = min(timeit.repeat(lambda: parse_xml(etree_parser, starttags), number=1, repeat=args['repeat']))
+  fast_time = min(timeit.repeat(lambda: parse_fast(etree_parser, starttags), number=1, repeat=args['repeat']))
+
+  print("start tags        = %d" % (len(starttags),))
+  print("fast path         = %d (%.1f%%)" % (fast_count, 100.0 * fast_count / len(starttags),))
+  print("expat per tag     = %.2f us" % (1e6 * xml_time / len(starttags),))
+  print("tokenizer per tag = %.2f us" % (1e6 * fast_time / len(starttags),))
+  print("speedup           = %.1fx" % (xml_time / fast_time,))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,103 @@
+import sys
+import time
+import argparse
+import tracemalloc
+
+from html2txt import converters
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program measures the time and peak memory of converting a table
+# with a large number of cells with convert() and with convert_iter(),
+# which renders each row as soon as it is complete.
+#
+
+def table_chunks(rows, columns):
+  # Yields the HTML of the table in chunks of 1000 rows
+  header = ''.join('<th align="left">Column %d</th>' % (column,) for column in range(columns))
+  yield '<table><thead><tr>%s</tr></thead><tbody>' % (header,)
+  for start in range(0, rows, 1000):
+    chunk = []
+    for row in range(start, min(start + 1000, rows)):
+      chunk.append('<tr>' + ''.join('<td>%d.%d</td>' % (row, column) for column in range(columns)) + '</tr>')
+    yield ''.join(chunk)
+  yield '</tbody></table>'
+
+def measure(method, memory):
+  start = time.perf_counter()
+  size = method()
+  elapsed = time.perf_counter() - start
+  peak = None
+  if memory:
+    # tracemalloc slows the conversion down, so the peak is measured
+    # in a separate run
+    tracemalloc.start()
+    method()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+  return elapsed, peak, size
+
+def main():
+  parser = argparse.ArgumentParser(description="bench_table")
+  parser.add_argument("--rows", help="Number of table rows", type=int, default=100000)
+  parser.add_argument("--columns", help="Number of cells per row", type=int, default=10)
+  parser.add_argument("--memory", help="Also measure the peak memory (slow)", action="store_true")
+
+  args = vars(parser.parse_args())
+
+  rows = args['rows']
+  columns = args['columns']
+
+  def convert():
+    data = ''.join(table_chunks(rows, columns))
+    return len(converters.Html2Markdown().convert(data))
+
+  def convert_iter():
+    size = 0
+    for text in converters.Html2Markdown().convert_iter(table_chunks(rows, columns)):
+      size += len(text)
+    return size
+
+  convert_time, convert_peak, convert_size = measure(convert, args['memory'])
+  iter_time, iter_peak, iter_size = measure(convert_iter, args['memory'])
+
+  print("cells               = %d" % (rows * columns,))
+  print("markdown            = %d chars" % (convert_size,))
+  print("convert time        = %.3f s" % (convert_time,))
+  print("convert_iter time   = %.3f s" % (iter_time,))
+  if args['memory']:
+    print("convert peak        = %.1f MB" % (convert_peak / 1e6,))
+    print("convert_iter peak   = %.1f MB" % (iter_peak / 1e6,))
+  if convert_size != iter_size:
+    print("convert_iter output differs")
+    return 1
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
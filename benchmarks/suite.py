@@ -0,0 +1,250 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+from html2txt import parsers
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+#
+# Description:
+#
+# This program times the phases of the conversion (parsing the HTML to an
+# ast.Node tree and rendering the tree to markdown) over the corpora in
+# tests/, and reports throughput, per-document latency and peak memory,
+# with the full tree and with the parser options of Html2Markdown().
+# Results can be saved as JSON and compared with a saved baseline.
+#
+# python -m benchmarks --output results.json
+# python -m benchmarks --baseline results.json --threshold 0.1
+#
+
+CORPORA = [
+  ('breakdance', 'breakdance/fixtures'),
+  ('html2txt', 'html2txt/html'),
+  ('svgweb', 'svgweb'),
+  ('mathml', 'mathml'),
+  ('commonmark', 'commonmark/commonmark-spec.json'),
+]
+
+# HtmlParser options of each configuration. 'tree' builds the full
+# ast.Node tree; 'defaults' parses like Html2Markdown() does by default.
+# Results of the 'defaults' configuration are reported as
+# '<corpus>+defaults'.
+CONFIGURATIONS = [
+  ('tree', {}),
+  ('defaults', {'xml_islands': True, 'prune_ignored': True}),
+]
+
+PHASES = ['parse', 'render', 'total']
+
+# Metrics that are worse when they are larger
+COMPARED_METRICS = ['seconds', 'p50_ms', 'p99_ms', 'peak_mb']
+
+def load_corpus(path):
+  # Returns the documents of a corpus in a fixed order
+  if path.endswith('.json'):
+    with open(path, 'r', encoding='utf-8') as f:
+      return [example['html'] for example in json.load(f)]
+  documents = []
+  for dirpath, subdirs, files in os.walk(path):
+    subdirs.sort()
+    for x in sorted(files):
+      if x.endswith('.html') or x.endswith('.svg'):
+        with open(os.path.join(dirpath, x), 'r', encoding='utf-8', errors='replace') as f:
+          documents.append(f.read())
+  return documents
+
+def count_nodes(root):
+  count = 0
+  stack = [root]
+  while len(stack) > 0:
+    node = stack.pop()
+    count += 1
+    stack.extend(node.children_)
+  return count
+
+def percentile(values, fraction):
+  if len(values) == 0:
+    return 0.0
+  values = sorted(values)
+  return values[min(len(values) - 1, int(fraction * len(values)))]
+
+def time_document(data, repeat, options):
+  # Best of repeat runs of each phase, and the number of nodes
+  parse_time = None
+  render_time = None
+  for i in range(repeat):
+    start = time.perf_counter()
+    root = parsers.HtmlParser(**options).parse(data)
+    parsed = time.perf_counter()
+    m = parsers.MarkdownVisitor()
+    m.visit(root)
+    rendered = time.perf_counter()
+    if parse_time is None or parsed - start < parse_time:
+      parse_time = parsed - start
+    if render_time is None or rendered - parsed < render_time:
+      render_time = rendered - parsed
+  return parse_time, render_time, count_nodes(root)
+
+def peak_memory(documents, options):
+  # Largest peak of converting one document. tracemalloc slows the
+  # conversion down, so this is a separate pass.
+  peak = 0
+  for data in documents:
+    tracemalloc.start()
+    try:
+      m = parsers.MarkdownVisitor()
+      m.visit(parsers.HtmlParser(**options).parse(data))
+    except Exception:
+      pass
+    current, document_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak = max(peak, document_peak)
+  return peak
+
+def run_corpus(documents, repeat, memory, options):
+  latencies = {phase: [] for phase in PHASES}
+  nodes = 0
+  size = 0
+  errors = 0
+  for data in documents:
+    try:
+      parse_time, render_time, document_nodes = time_document(data, repeat, options)
+    except Exception:
+      errors += 1
+      continue
+    latencies['parse'].append(parse_time)
+    latencies['render'].append(render_time)
+    latencies['total'].append(parse_time + render_time)
+    nodes += document_nodes
+    size += len(data.encode('utf-8', 'surrogatepass'))
+  result = {
+    'documents': len(documents),
+    'errors': errors,
+    'bytes': size,
+    'nodes': nodes,
+    'phases': {},
+  }
+  for phase in PHASES:
+    seconds = sum(latencies[phase])
+    result['phases'][phase] = {
+      'seconds': seconds,
+      'mb_per_s': size / 1e6 / seconds if seconds > 0 else 0.0,
+      'nodes_per_s': nodes / seconds if seconds > 0 else 0.0,
+      'p50_ms': percentile(latencies[phase], 0.50) * 1000,
+      'p99_ms': percentile(latencies[phase], 0.99) * 1000,
+    }
+  if memory:
+    result['phases']['total']['peak_mb'] = peak_memory(documents, options) / 1e6
+  return result
+
+def compare(results, baseline, threshold):
+  # Returns the metrics that are more than threshold (a fraction) worse
+  # than in the baseline
+  regressions = []
+  for corpus, result in results['corpora'].items():
+    baseline_result = baseline.get('corpora', {}).get(corpus)
+    if baseline_result is None:
+      continue
+    for phase, metrics in result['phases'].items():
+      baseline_metrics = baseline_result['phases'].get(phase, {})
+      for metric in COMPARED_METRICS:
+        if metric not in metrics or metric not in baseline_metrics:
+          continue
+        value = metrics[metric]
+        baseline_value = baseline_metrics[metric]
+        if baseline_value > 0 and value > baseline_value * (1.0 + threshold):
+          regressions.append((corpus, phase, metric, baseline_value, value))
+  return regressions
+
+def print_results(results):
+  print("%-20s %-7s %9s %8s %11s %9s %9s %8s" % (
+    "corpus", "phase", "seconds", "MB/s", "nodes/s", "p50 ms", "p99 ms", "peak MB"))
+  for corpus, result in results['corpora'].items():
+    for phase in PHASES:
+      metrics = result['phases'][phase]
+      peak = ''
+      if 'peak_mb' in metrics:
+        peak = "%.1f" % (metrics['peak_mb'],)
+      print("%-20s %-7s %9.3f %8.2f %11.0f %9.3f %9.3f %8s" % (
+        corpus, phase, metrics['seconds'], metrics['mb_per_s'], metrics['nodes_per_s'],
+        metrics['p50_ms'], metrics['p99_ms'], peak))
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="benchmarks")
+  parser.add_argument("--path", help="Path of the test corpora", default="tests")
+  parser.add_argument("--corpus", nargs='*', help="Corpora to run (default all)", default=None)
+  parser.add_argument("--configuration", nargs='*', help="Configurations to run (default all)", choices=[name for name, options in CONFIGURATIONS], default=None)
+  parser.add_argument("--repeat", help="Number of runs of each document (the best is kept)", type=int, default=3)
+  parser.add_argument("--no-memory", help="Do not measure the peak memory", action="store_true")
+  parser.add_argument("--output", help="JSON file for the results", default=None)
+  parser.add_argument("--baseline", help="JSON file of results to compare with", default=None)
+  parser.add_argument("--threshold", help="Allowed slowdown relative to the baseline", type=float, default=0.1)
+
+  args = vars(parser.parse_args(argv))
+
+  basePath = os.path.abspath(os.path.expanduser(args['path']))
+
+  results = {
+    'python': platform.python_version(),
+    'platform': platform.platform(),
+    'repeat': args['repeat'],
+    'corpora': {},
+  }
+  for corpus, path in CORPORA:
+    if args['corpus'] is not None and corpus not in args['corpus']:
+      continue
+    documents = load_corpus(os.path.join(basePath, path))
+    for name, options in CONFIGURATIONS:
+      if args['configuration'] is not None and name not in args['configuration']:
+        continue
+      key = corpus
+      if name != 'tree':
+        key = corpus + '+' + name
+      results['corpora'][key] = run_corpus(documents, args['repeat'], not args['no_memory'], options)
+
+  print_results(results)
+
+  if args['output'] is not None:
+    with open(args['output'], 'w') as f:
+      json.dump(results, f, indent=2, sort_keys=True)
+
+  if args['baseline'] is not None:
+    with open(args['baseline'], 'r') as f:
+      baseline = json.load(f)
+    regressions = compare(results, baseline, args['threshold'])
+    for corpus, phase, metric, baseline_value, value in regressions:
+      print("regression: %s %s %s %.3f -> %.3f (%+.1f%%)" % (
+        corpus, phase, metric, baseline_value, value, 100.0 * (value - baseline_value) / baseline_value,))
+    if len(regressions) > 0:
+      return 1
+    print("no regressions beyond %.0f%%" % (100.0 * args['threshold'],))
+  return 0
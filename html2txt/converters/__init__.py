@@ -1,3 +1,7 @@
 #__import__('pkg_resources').declare_namespace(__name__)
 
 from .html2markdown import *
+from .cache import *
+from .stats import *
+from .htmlfile import *
+from .asyncconverter import *
@@ -0,0 +1,235 @@
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from .html2markdown import Html2Markdown
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+def run_convert(settings, data):
+  # Runs in a worker thread or process
+  return Html2Markdown(**settings).convert(data)
+
+def run_convert_file(settings, path, encoding):
+  return Html2Markdown(**settings).convert_file(path, encoding=encoding)
+
+class AsyncHtml2Markdown(object):
+  """
+  Converts HTML to markdown from asyncio code without blocking the event
+  loop. Conversions run in a thread pool (or a process pool with
+  processes=True, or the given executor), at most max_in_flight at a
+  time; further calls wait for a slot. A call can be cancelled or given
+  a timeout. A conversion that is already running is not interrupted,
+  and its slot is only freed once it ends.
+  """
+  def __init__(self, max_workers=None, max_in_flight=None, timeout=None, processes=False, executor=None,
+               max_line_length=80, newline_char=os.linesep, indent_char=' ', memoize=False, columnar=False):
+    self.settings_ = {
+      'max_line_length': max_line_length,
+      'newline_char': newline_char,
+      'indent_char': indent_char,
+      'memoize': memoize,
+      'columnar': columnar,
+    }
+    if max_workers is None:
+      max_workers = os.cpu_count() or 1
+    self.owns_executor_ = executor is None
+    if executor is None:
+      if processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+      else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    self.executor_ = executor
+    if max_in_flight is None:
+      max_in_flight = max_workers
+    self.max_in_flight_ = max_in_flight
+    self.timeout_ = timeout
+    # Created in the event loop that uses it
+    self.semaphore_ = None
+    self.semaphore_loop_ = None
+    self.waiting_ = 0
+    self.in_flight_ = 0
+    self.started_ = 0
+    self.completed_ = 0
+    self.failed_ = 0
+    self.cancelled_ = 0
+    self.timed_out_ = 0
+    self.total_latency_ = 0.0
+    self.max_latency_ = 0.0
+    self.total_wait_ = 0.0
+
+  def semaphore(self, loop):
+    if self.semaphore_ is None or self.semaphore_loop_ is not loop:
+      self.semaphore_ = asyncio.Semaphore(self.max_in_flight_)
+      self.semaphore_loop_ = loop
+    return self.semaphore_
+
+  async def convert(self, data, timeout=None):
+    """
+    Returns the markdown of data. Raises asyncio.TimeoutError if it takes
+    longer than timeout (or the default timeout) seconds, counting the
+    time spent waiting for a slot.
+    """
+    return await self.run(run_convert, (self.settings_, data), timeout)
+
+  async def convert_file(self, path, encoding=None, timeout=None):
+    # See Html2Markdown.convert_file()
+    return await self.run(run_convert_file, (self.settings_, path, encoding), timeout)
+
+  async def run(self, job, args, timeout):
+    if timeout is None:
+      timeout = self.timeout_
+    start = time.perf_counter()
+    try:
+      if timeout is None:
+        return await self.submit(job, args, start)
+      return await asyncio.wait_for(self.submit(job, args, start), timeout)
+    except asyncio.TimeoutError:
+      self.timed_out_ += 1
+      raise
+    except asyncio.CancelledError:
+      self.cancelled_ += 1
+      raise
+    except Exception:
+      self.failed_ += 1
+      raise
+    finally:
+      latency = time.perf_counter() - start
+      self.total_latency_ += latency
+      self.max_latency_ = max(self.max_latency_, latency)
+
+  async def submit(self, job, args, start):
+    loop = asyncio.get_event_loop()
+    semaphore = self.semaphore(loop)
+    self.waiting_ += 1
+    try:
+      await semaphore.acquire()
+    finally:
+      self.waiting_ -= 1
+    self.total_wait_ += time.perf_counter() - start
+    self.started_ += 1
+    self.in_flight_ += 1
+    try:
+      future = self.executor_.submit(job, *args)
+    except BaseException:
+      self.job_done(semaphore)
+      raise
+    # The slot is freed when the job ends (or is cancelled before it
+    # starts), not when the caller stops waiting for it
+    future.add_done_callback(lambda f: self.job_ended(loop, semaphore))
+    result = await asyncio.wrap_future(future)
+    self.completed_ += 1
+    return result
+
+  def job_ended(self, loop, semaphore):
+    # Runs in a thread of the executor when the job ends
+    try:
+      loop.call_soon_threadsafe(self.job_done, semaphore)
+    except RuntimeError:
+      # The loop was closed while the job ran, so its semaphore is not
+      # used anymore
+      self.in_flight_ -= 1
+
+  def job_done(self, semaphore):
+    self.in_flight_ -= 1
+    semaphore.release()
+
+  def stats(self):
+    # Snapshot of the counters, e.g. for a metrics endpoint
+    return {
+      'waiting': self.waiting_,
+      'in_flight': self.in_flight_,
+      'completed': self.completed_,
+      'failed': self.failed_,
+      'cancelled': self.cancelled_,
+      'timed_out': self.timed_out_,
+      'mean_latency': self.mean_latency,
+      'max_latency': self.max_latency_,
+      'mean_wait': self.mean_wait,
+    }
+
+  def shutdown(self, wait=True):
+    # Shuts down the executor if it was created here
+    if self.owns_executor_:
+      self.executor_.shutdown(wait=wait)
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, exc_type, exc, tb):
+    self.shutdown()
+
+  @property
+  def waiting(self):
+    # Calls waiting for a slot
+    return self.waiting_
+
+  @property
+  def in_flight(self):
+    return self.in_flight_
+
+  @property
+  def completed(self):
+    return self.completed_
+
+  @property
+  def failed(self):
+    return self.failed_
+
+  @property
+  def cancelled(self):
+    return self.cancelled_
+
+  @property
+  def timed_out(self):
+    return self.timed_out_
+
+  @property
+  def mean_latency(self):
+    calls = self.completed_ + self.failed_ + self.cancelled_ + self.timed_out_
+    if calls == 0:
+      return 0.0
+    return self.total_latency_ / calls
+
+  @property
+  def max_latency(self):
+    return self.max_latency_
+
+  @property
+  def mean_wait(self):
+    # Mean time spent waiting for a slot by the calls that got one
+    if self.started_ == 0:
+      return 0.0
+    return self.total_wait_ / self.started_
+
+  @property
+  def max_in_flight(self):
+    return self.max_in_flight_
+
+  @property
+  def executor(self):
+    return self.executor_
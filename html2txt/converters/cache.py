@@ -0,0 +1,200 @@
+import os
+import sys
+import hashlib
+import tempfile
+import time
+
+from collections import OrderedDict
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Age in seconds after which a temporary file is left by an interrupted
+# write rather than being written by another process
+STALE_TEMPORARY_SECONDS = 3600
+
+class ConversionCache(object):
+  """
+  Cache of converted markdown keyed by a hash of the HTML and the visitor
+  settings. Entries are kept in an in-memory LRU and, if path is given, in
+  a directory of files that is shared between processes and runs.
+  """
+  def __init__(self, max_entries=1024, path=None, max_disk_bytes=256 * 1024 * 1024):
+    self.max_entries_ = max_entries
+    self.memory_ = OrderedDict()
+    self.path_ = None
+    self.max_disk_bytes_ = max_disk_bytes
+    self.disk_bytes_ = 0
+    self.hits_ = 0
+    self.misses_ = 0
+    if path is not None:
+      self.path_ = os.path.abspath(os.path.expanduser(path))
+      os.makedirs(self.path_, exist_ok=True)
+      self.remove_temporary_files()
+      self.disk_bytes_ = sum(size for filename, size, mtime in self.disk_entries())
+
+  @staticmethod
+  def key(data, settings):
+    # settings is a tuple of the visitor settings that change the output
+    h = hashlib.sha256(repr(settings).encode('utf-8'))
+    h.update(b'\0')
+    h.update(data.encode('utf-8', 'surrogatepass'))
+    return h.hexdigest()
+
+  def get(self, key):
+    text = self.memory_.get(key)
+    if text is not None:
+      self.memory_.move_to_end(key)
+      self.hits_ += 1
+      return text
+    if self.path_ is not None:
+      filename = self.disk_filename(key)
+      try:
+        with open(filename, 'r', encoding='utf-8', errors='surrogatepass', newline='') as f:
+          text = f.read()
+        # The modification time orders disk entries for eviction
+        os.utime(filename)
+      except OSError:
+        text = None
+      if text is not None:
+        self.put_memory(key, text)
+        self.hits_ += 1
+        return text
+    self.misses_ += 1
+    return None
+
+  def put(self, key, text):
+    self.put_memory(key, text)
+    if self.path_ is not None:
+      self.put_disk(key, text)
+
+  def put_memory(self, key, text):
+    self.memory_[key] = text
+    self.memory_.move_to_end(key)
+    while len(self.memory_) > self.max_entries_:
+      self.memory_.popitem(last=False)
+
+  def disk_filename(self, key):
+    return os.path.join(self.path_, key[:2], key + '.md')
+
+  def disk_entries(self):
+    entries = []
+    for path, subdirs, files in os.walk(self.path_):
+      for x in files:
+        if x.endswith('.md'):
+          filename = os.path.join(path, x)
+          try:
+            st = os.stat(filename)
+          except OSError:
+            continue
+          entries.append((filename, st.st_size, st.st_mtime))
+    return entries
+
+  def remove_temporary_files(self):
+    # Removes the temporary files left by writes that were interrupted
+    limit = time.time() - STALE_TEMPORARY_SECONDS
+    for path, subdirs, files in os.walk(self.path_):
+      for x in files:
+        if x.endswith('.tmp'):
+          filename = os.path.join(path, x)
+          try:
+            if os.stat(filename).st_mtime < limit:
+              os.remove(filename)
+          except OSError:
+            pass
+
+  def put_disk(self, key, text):
+    filename = self.disk_filename(key)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    try:
+      old_size = os.stat(filename).st_size
+    except OSError:
+      old_size = 0
+    data = text.encode('utf-8', 'surrogatepass')
+    # Write to a temporary file first so readers never see a partial entry
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename), suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+      os.replace(tmp_filename, filename)
+    except OSError:
+      try:
+        os.remove(tmp_filename)
+      except OSError:
+        pass
+      return
+    self.disk_bytes_ += len(data) - old_size
+    if self.disk_bytes_ > self.max_disk_bytes_:
+      self.evict_disk()
+
+  def evict_disk(self):
+    # Removes the least recently used files until the directory is at
+    # most 3/4 full, so eviction does not rescan on every put
+    entries = self.disk_entries()
+    entries.sort(key=lambda entry: entry[2])
+    total = sum(size for filename, size, mtime in entries)
+    limit = self.max_disk_bytes_ * 3 // 4
+    for filename, size, mtime in entries:
+      if total <= limit:
+        break
+      try:
+        os.remove(filename)
+      except OSError:
+        continue
+      total -= size
+    self.disk_bytes_ = total
+
+  def clear(self):
+    self.memory_.clear()
+    if self.path_ is not None:
+      for filename, size, mtime in self.disk_entries():
+        try:
+          os.remove(filename)
+        except OSError:
+          pass
+      self.disk_bytes_ = 0
+
+  @property
+  def hits(self):
+    return self.hits_
+
+  @property
+  def misses(self):
+    return self.misses_
+
+  @property
+  def max_entries(self):
+    return self.max_entries_
+
+  @property
+  def max_disk_bytes(self):
+    return self.max_disk_bytes_
+
+  @property
+  def path(self):
+    return self.path_
+
+  def __len__(self):
+    return len(self.memory_)
@@ -1,9 +1,14 @@
 import os
 import sys
+import time
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from  html2txt import parsers
 
+from html2txt.converters.htmlfile import read_html_file
+from html2txt.converters.stats import ConversionStats
+
 #from importlib import reload # reload 
 #reload(parsers)
 
@@ -13,20 +18,326 @@ from  html2txt import parsers
 # License: MIT (http://www.opensource.org/licenses/mit-license.php)
 
 class Html2Markdown(object):
-  def __init(self):
+  def __init__(self, max_line_length=80, newline_char=os.linesep, indent_char=' ', cache=None, memoize=False, columnar=False, stats=False, profile=None, xml_islands=True, track_offsets=False, prune_ignored=True, extractor=None):
     self.root_ = None
+    self.visitor_ = None
+    # HtmlParser keeps no state between parse() calls. The markup of svg
+    # and math elements is only serialized back, so their content is kept
+    # as XmlIslandNode events instead of nodes. With track_offsets the
+    # nodes of root get their source spans. The content of the elements
+    # that are not rendered (e.g. script and style) is skipped.
+    self.parser_ = parsers.HtmlParser(xml_islands, track_offsets, prune_ignored)
+    self.max_line_length_ = max_line_length
+    self.newline_char_ = newline_char
+    self.indent_char_ = indent_char
+    # Optional ConversionCache shared by convert() calls
+    self.cache_ = cache
+    # Reuse the markdown of repeated subtrees (see MarkdownVisitor.visit_memoized)
+    self.memoize_ = memoize
+    # Parse to a ColumnarTree and render it one subtree at a time
+    self.columnar_ = columnar
+    # Collect a ConversionStats for each conversion
+    self.collect_stats_ = stats
+    self.stats_ = None
+    # TagProfile that accumulates the cost of each node class and helper
+    # over the conversions (see ProfilingMarkdownVisitor)
+    self.profile_ = profile
+    # ContentExtractor that selects the subtree rendered (e.g. the article
+    # of a page)
+    self.extractor_ = extractor
+
+  def create_visitor(self, sink=None, encoding=None):
+    if self.profile_ is not None:
+      m = parsers.ProfilingMarkdownVisitor(self.profile_, sink, encoding)
+    else:
+      m = parsers.MarkdownVisitor(sink, encoding)
+    m.max_line_length = self.max_line_length_
+    m.newline_char = self.newline_char_
+    m.indent_char = self.indent_char_
+    m.memoize = self.memoize_
+    self.visitor_ = m
+    return m
 
   def convert(self, data):
-    p = parsers.HtmlParser()
-    self.root_ = p.parse(data)
-    m = parsers.MarkdownVisitor()
-    m.visit(self.root_)
-    return m.text
+    stats = self.start_stats()
+    key = None
+    if self.cache_ is not None:
+      if stats is not None:
+        start = stats.clock()
+      # root is not set when the markdown comes from the cache
+      settings = (self.max_line_length_, self.newline_char_, self.indent_char_)
+      if self.extractor_ is not None:
+        settings += self.extractor_.settings
+      key = self.cache_.key(data, settings)
+      text = self.cache_.get(key)
+      if text is not None:
+        self.root_ = None
+        if stats is not None:
+          stats.add_time('cache', start)
+          stats.cached = True
+          stats.add_chars_in(len(data))
+          stats.add_chars_out(len(text))
+        return text
+    m = self.create_visitor()
+    self.parse([data])
+    self.render(m)
+    text = m.text
+    if stats is not None:
+      stats.add_chars_out(len(text))
+    if key is not None:
+      self.cache_.put(key, text)
+    return text
+
+  def convert_to(self, data, sink, encoding=None):
+    """
+    Converts HTML and writes the markdown to sink (a text or binary file,
+    pipe or socket) as it is rendered instead of returning it. Binary
+    sinks get UTF-8 unless encoding is given. The sink is flushed at the
+    end. Returns the number of characters written.
+    """
+    if self.cache_ is not None:
+      # The markdown is needed as a whole to be cached
+      text = self.convert(data)
+      sink_writer = parsers.SinkWriter(sink, encoding)
+      sink_writer.write(text)
+      return flush_sink(sink_writer, sink)
+    self.start_stats()
+    m = self.create_visitor(sink, encoding)
+    self.parse([data])
+    self.render(m)
+    return self.flush_sink(m.data_[0], sink)
+
+  def convert_file(self, path, sink=None, encoding=None):
+    """
+    Converts an HTML file, which may be compressed with gzip, bzip2 or xz.
+    The file is decoded as it is parsed, with the encoding given or
+    sniffed from a byte order mark or <meta charset>. Returns the markdown,
+    or writes it to sink like convert_to() and returns its length.
+    """
+    chunks = read_html_file(path, encoding)
+    if self.cache_ is not None:
+      # The cache key is a hash of the whole text
+      data = ''.join(chunks)
+      if sink is None:
+        return self.convert(data)
+      return self.convert_to(data, sink)
+    stats = self.start_stats()
+    self.parse(chunks)
+    m = self.create_visitor(sink)
+    self.render(m)
+    if sink is None:
+      text = m.text
+      if stats is not None:
+        stats.add_chars_out(len(text))
+      return text
+    sink_writer = m.data_[0]
+    return self.flush_sink(sink_writer, sink)
+
+  def start_stats(self):
+    # Returns a new ConversionStats, or None if stats are not collected
+    if self.collect_stats_:
+      self.stats_ = ConversionStats()
+    else:
+      self.stats_ = None
+    return self.stats_
+
+  def parse(self, chunks):
+    self.root_ = self.parser_.parse_chunks(chunks, self.columnar_, self.stats_)
+    if self.stats_ is not None:
+      self.stats_.count_nodes(self.root_)
+    if self.extractor_ is not None:
+      self.extract()
+
+  def extract(self):
+    # Replaces root with the content selected by the extractor. A
+    # ColumnarTree is materialized first.
+    stats = self.stats_
+    if stats is not None:
+      start = stats.clock()
+    root = self.root_
+    if isinstance(root, parsers.ColumnarTree):
+      root = root.materialize()
+    self.root_ = self.extractor_.extract(root)
+    if stats is not None:
+      stats.add_time('extract', start)
+
+  def render(self, m):
+    # Visits the tree of the last parse with m
+    stats = self.stats_
+    if stats is not None:
+      start = stats.clock()
+    if isinstance(self.root_, parsers.ColumnarTree):
+      self.root_.accept(m)
+    else:
+      m.visit(self.root_)
+    if stats is not None:
+      stats.add_time('render', start)
+      stats.add_visitor(m)
+
+  def flush_sink(self, sink_writer, sink):
+    count = flush_sink(sink_writer, sink)
+    if self.stats_ is not None:
+      self.stats_.add_chars_out(count)
+    return count
+
+  def convert_iter(self, chunks):
+    """
+    Converts HTML from an iterable of string chunks, yielding markdown for
+    each block as soon as it is complete. The joined output is the same as
+    convert() on the joined input. Visited nodes are dropped, so the
+    stats of convert_iter() have no node counters. With an extractor the
+    content can only be selected in the whole tree, so the markdown is
+    yielded at once.
+    """
+    if self.extractor_ is not None:
+      yield self.convert(''.join(chunks))
+      return
+    stats = self.start_stats()
+    etree_parser = self.parser_.create_parser()
+    m = self.create_visitor()
+    self.root_ = etree_parser.getFragment()
+    # Stream containers entered so far, from the root down, and the state
+    # returned by visit_enter() for each
+    path = [self.root_]
+    states = [m.visit_enter(self.root_)]
+    for chunk in chunks:
+      if stats is None:
+        etree_parser.feed(chunk)
+        self.visit_completed(m, path, states, False)
+      else:
+        stats.add_chars_in(len(chunk))
+        start = stats.clock()
+        etree_parser.feed(chunk)
+        stats.add_time('feed', start)
+        start = stats.clock()
+        self.visit_completed(m, path, states, False)
+        stats.add_time('render', start)
+      text = m.flush_data()
+      if len(text) > 0:
+        if stats is not None:
+          stats.add_chars_out(len(text))
+        yield text
+    # Adds the remaining text and fails like convert() if unbalanced end
+    # tags closed the root
+    if stats is not None:
+      start = stats.clock()
+    etree_parser.getFragment()
+    if stats is not None:
+      stats.add_time('close', start)
+      start = stats.clock()
+    self.visit_completed(m, path, states, True)
+    m.visit_exit(self.root_, states.pop())
+    if stats is not None:
+      stats.add_time('render', start)
+      stats.add_visitor(m)
+    text = m.flush_data()
+    if len(text) > 0:
+      if stats is not None:
+        stats.add_chars_out(len(text))
+      yield text
+
+  def visit_completed(self, m, path, states, closed):
+    # Visits and drops the children of the nodes in path that can no longer
+    # change: all of them once a node is closed, otherwise all but the
+    # last. Stream containers are entered instead of being visited, and
+    # path[depth + 1] is always the first child of path[depth].
+    closed_path = [closed]
+    depth = 0
+    while True:
+      children = path[depth].children_
+      closed = closed_path[depth]
+      if len(path) > depth + 1:
+        # Resume in the container entered by a previous call
+        closed_path.append(closed or len(children) > 1)
+        depth += 1
+        continue
+      entered = False
+      while len(children) > 0:
+        child = children[0]
+        child_closed = closed or len(children) > 1
+        if type(child) in parsers.STREAM_CONTAINERS and (child_closed or len(child.children_) > 0):
+          # The text of a stream container is final once it has a child
+          states.append(m.visit_enter(child))
+          path.append(child)
+          closed_path.append(child_closed)
+          depth += 1
+          entered = True
+          break
+        if not child_closed:
+          break
+        m.visit(child)
+        del children[0]
+      if entered:
+        continue
+      if depth == 0 or not closed:
+        break
+      # All children of the closed container were visited
+      m.visit_exit(path.pop(), states.pop())
+      closed_path.pop()
+      depth -= 1
+      del path[depth].children_[0]
 
   @property
   def root(self):
     return self.root_
 
+  @property
+  def columnar(self):
+    return self.columnar_
+
+  @property
+  def visitor(self):
+    # MarkdownVisitor of the last conversion (e.g. for its memo counters)
+    return self.visitor_
+
+  @property
+  def stats(self):
+    # ConversionStats of the last conversion, or None if stats=False
+    return self.stats_
+
+  @property
+  def profile(self):
+    return self.profile_
+
+  @property
+  def extractor(self):
+    return self.extractor_
+
+  @property
+  def cache(self):
+    return self.cache_
+
+  @property
+  def cache_hits(self):
+    if self.cache_ is None:
+      return 0
+    return self.cache_.hits
+
+  @property
+  def cache_misses(self):
+    if self.cache_ is None:
+      return 0
+    return self.cache_.misses
+
+  @property
+  def max_line_length(self):
+    return self.max_line_length_
+
+  @property
+  def newline_char(self):
+    return self.newline_char_
+
+  @property
+  def indent_char(self):
+    return self.indent_char_
+
+def flush_sink(sink_writer, sink):
+  # Writes the rest of the markdown and returns the number of characters
+  sink_writer.flush()
+  if hasattr(sink, 'flush'):
+    sink.flush()
+  return sink_writer.chars_written
+
 def html_to_markdown(data):
   hmd = Html2Markdown()
   return hmd.convert(data)
@@ -67,15 +378,73 @@ def filelist(dir, excludePaths, exts):
       allfiles.extend(filelist(x, excludePaths, exts))
   return allfiles
 
-def main():
+def output_filename(file, basePath, outputPath):
+  # Mirrors the input tree below outputPath with a .md extension
+  name, extension = os.path.splitext(os.path.relpath(file, basePath))
+  return os.path.join(outputPath, name + '.md')
+
+def convert_file_job(file, output_file=None, profile_tags=False, main_content=None):
+  # Converts one file; runs in a worker process with --jobs. With
+  # profile_tags the TagProfile of the file is returned as a dict. With
+  # main_content (selectors) only the main content is converted.
+  start = time.perf_counter()
+  md = None
+  error = None
+  profile = None
+  if profile_tags:
+    profile = parsers.TagProfile()
+  extractor = None
+  if main_content is not None:
+    extractor = parsers.ContentExtractor(main_content)
+  try:
+    if output_file is None:
+      md = Html2Markdown(profile=profile, extractor=extractor).convert_file(file)
+    else:
+      os.makedirs(os.path.dirname(output_file), exist_ok=True)
+      try:
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+          Html2Markdown(profile=profile, extractor=extractor).convert_file(file, f)
+      except Exception:
+        # Does not leave a partial markdown file
+        os.remove(output_file)
+        raise
+  except Exception as e:
+    error = "%s: %s" % (type(e).__name__, e,)
+  if profile is not None:
+    profile = profile.as_dict()
+  return (file, output_file, time.perf_counter() - start, md, error, profile)
+
+def convert_files(files, basePath, outputPath, jobs, profile_tags=False, main_content=None):
+  # Yields the result of each file as soon as it is converted
+  jobs_args = []
+  for file in files:
+    if outputPath is None:
+      jobs_args.append((file, None))
+    else:
+      jobs_args.append((file, output_filename(file, basePath, outputPath)))
+  if jobs == 1:
+    for file, output_file in jobs_args:
+      yield convert_file_job(file, output_file, profile_tags, main_content)
+  else:
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+      futures = [executor.submit(convert_file_job, file, output_file, profile_tags, main_content) for file, output_file in jobs_args]
+      for future in as_completed(futures):
+        yield future.result()
+
+def main(argv=None):
   parser = argparse.ArgumentParser(description="mdtext")
   parser.add_argument("--path", help="Base path of the project to be scanned", default=".")
   parser.add_argument("--root", help="Root path of the project to be scanned", default="/")
   parser.add_argument("--prefix", help="Replace root path with this prefix", default="/")
   parser.add_argument("--extensions", help="File extensions that are processed", default=".html.svg")
   parser.add_argument("--exclude", nargs='*', help="Paths of folders to exclude", default=[])
+  parser.add_argument("--jobs", help="Number of worker processes (0 for one per CPU)", type=int, default=1)
+  parser.add_argument("--output", help="Directory for the markdown files, mirroring the scanned tree", default=None)
+  parser.add_argument("--profile-tags", help="Report the cost of each node class and helper over all files", action="store_true")
+  parser.add_argument("--profile-limit", help="Number of entries in the --profile-tags report", type=int, default=40)
+  parser.add_argument("--main-content", help="Only convert the main content of each page, selected by these selectors or by text density", nargs='?', const=parsers.DEFAULT_SELECTORS, default=None, metavar="SELECTORS")
 
-  args = vars(parser.parse_args())
+  args = vars(parser.parse_args(argv))
 
   basePath = os.path.abspath(os.path.expanduser(args['path']))
 
@@ -87,25 +456,57 @@ def main():
 
   excludePaths = args['exclude']
 
+  jobs = args['jobs']
+  if jobs < 1:
+    jobs = os.cpu_count() or 1
+
+  outputPath = args['output']
+  if outputPath is not None:
+    outputPath = os.path.abspath(os.path.expanduser(outputPath))
+
   # Remove trailing path separator from each exclude path
   excludePaths[:] = [x.rstrip(os.sep) for x in excludePaths]
 
   files = filelist(basePath, excludePaths, fileExtensions)
 
-  # Read each file
-  for file in files:
+  # filelist() can return a file more than once
+  files = list(dict.fromkeys(files))
+
+  profile = None
+  if args['profile_tags']:
+    profile = parsers.TagProfile()
+
+  start = time.perf_counter()
+  failed = 0
+
+  # Report each file as it is converted
+  for file, output_file, elapsed, md, error, file_profile in convert_files(files, basePath, outputPath, jobs, profile is not None, args['main_content']):
+    if file_profile is not None:
+      profile.merge(file_profile)
+
     file_canonical = file.replace(rootPath, rootPrefix, 1)
 
     print("file = %s" % (file_canonical,))
 
-    with open(file, 'r') as f:
-      lines = f.readlines()
+    if error is not None:
+      failed += 1
+      print("error = %s" % (error,), file=sys.stderr)
+    elif output_file is not None:
+      print("output = %s" % (output_file,))
+      print("time = %.3f s" % (elapsed,))
+    else:
+      print(md)
 
-      data = ''.join(lines)
+    sys.stdout.flush()
 
-      md = html_to_markdown(data)
+  print("converted %d files (%d failed) in %.3f s" % (len(files), failed, time.perf_counter() - start,), file=sys.stderr)
 
-      print(md)
+  if profile is not None:
+    print(profile.report(args['profile_limit']), file=sys.stderr)
+
+  if failed > 0:
+    return 1
+  return 0
 
 if __name__ == "__main__":
-  main()
+  sys.exit(main())
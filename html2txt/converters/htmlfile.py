@@ -0,0 +1,120 @@
+import io
+import codecs
+import os
+import re
+import bz2
+import gzip
+import lzma
+import mmap
+
+import webencodings
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Number of bytes searched for a byte order mark or <meta charset>
+SNIFF_BYTES = 4096
+
+BOMS = (
+  (b'\xef\xbb\xbf', 'utf-8'),
+  (b'\xff\xfe', 'utf-16-le'),
+  (b'\xfe\xff', 'utf-16-be'),
+)
+
+# <meta charset="..."> and <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET = re.compile(br'<meta[^>]*?charset\s*=\s*["\']?\s*([A-Za-z0-9_:.+-]+)', re.IGNORECASE)
+
+COMPRESSED_OPENERS = {
+  '.gz': gzip.open,
+  '.bz2': bz2.open,
+  '.xz': lzma.open,
+}
+
+def sniff_encoding(head, default='utf-8'):
+  """
+  Returns the Python codec name of the encoding of an HTML document and
+  the length of its byte order mark from the first bytes of the document.
+  """
+  for bom, name in BOMS:
+    if head.startswith(bom):
+      return (name, len(bom))
+  match = META_CHARSET.search(head)
+  if match is not None:
+    encoding = webencodings.lookup(match.group(1).decode('ascii'))
+    if encoding is not None:
+      # A document that can be read as ASCII to find <meta> is not UTF-16
+      if encoding.name in ('utf-16le', 'utf-16be'):
+        return ('utf-8', 0)
+      return (encoding.codec_info.name, 0)
+  return (default, 0)
+
+def iter_blocks(path, block_size):
+  # Yields the bytes of a file, decompressed if its extension is .gz, .bz2
+  # or .xz. Other files are memory-mapped instead of read.
+  name, extension = os.path.splitext(path)
+  opener = COMPRESSED_OPENERS.get(extension.lower())
+  if opener is not None:
+    with opener(path, 'rb') as f:
+      while True:
+        block = f.read(block_size)
+        if len(block) == 0:
+          break
+        yield block
+    return
+  with open(path, 'rb') as f:
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+      return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+      for start in range(0, size, block_size):
+        yield m[start:start + block_size]
+
+def read_html_file(path, encoding=None, block_size=1024 * 1024, errors='replace'):
+  """
+  Yields the text of an HTML file in chunks. The encoding is sniffed from
+  a byte order mark or <meta charset> unless it is given, and line
+  endings are translated to '\n' like a file opened in text mode.
+  """
+  blocks = iter_blocks(path, block_size)
+  # Collects enough bytes to sniff the encoding
+  head = b''
+  for block in blocks:
+    head += block
+    if len(head) >= SNIFF_BYTES:
+      break
+  bom_length = 0
+  if encoding is None:
+    encoding, bom_length = sniff_encoding(head[:SNIFF_BYTES])
+  decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(errors), True)
+  text = decoder.decode(head[bom_length:])
+  if len(text) > 0:
+    yield text
+  for block in blocks:
+    text = decoder.decode(block)
+    if len(text) > 0:
+      yield text
+  text = decoder.decode(b'', True)
+  if len(text) > 0:
+    yield text
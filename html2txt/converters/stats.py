@@ -0,0 +1,176 @@
+import time
+
+from html2txt import parsers
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+class ConversionStats(object):
+  """
+  Timings and counters of one conversion, collected by Html2Markdown when
+  it is created with stats=True. Each phase has wall and CPU time in
+  seconds: 'read' (getting the next chunk, e.g. decoding a file), 'feed'
+  (tokenizing and building the tree), 'close' (ending the parse), 'count'
+  (walking the tree for the node counters), 'render' (visiting the tree)
+  and 'cache' (a cache lookup that hit). Text sizes are in characters.
+  """
+  def __init__(self):
+    self.phases_ = {}
+    self.nodes_ = {}
+    self.max_depth_ = 0
+    self.chars_in_ = 0
+    self.chars_out_ = 0
+    self.buffer_pushes_ = 0
+    self.cached_ = False
+
+  @staticmethod
+  def clock():
+    return (time.perf_counter(), time.process_time())
+
+  def add_time(self, phase, start):
+    # Adds the time since start (a clock() value) to phase
+    wall = time.perf_counter() - start[0]
+    cpu = time.process_time() - start[1]
+    times = self.phases_.get(phase)
+    if times is None:
+      self.phases_[phase] = [wall, cpu]
+    else:
+      times[0] += wall
+      times[1] += cpu
+
+  def add_chars_in(self, count):
+    self.chars_in_ += count
+
+  def add_chars_out(self, count):
+    self.chars_out_ += count
+
+  def add_visitor(self, visitor):
+    self.buffer_pushes_ += visitor.buffer_pushes
+
+  def count_nodes(self, root, depth=0):
+    """
+    Counts the nodes of root (an ast.Node or a ColumnarTree) by namespace
+    and updates the maximum depth; depth is that of root.
+    """
+    start = self.clock()
+    if isinstance(root, parsers.ColumnarTree):
+      self.count_columnar_nodes(root, depth)
+    else:
+      nodes = self.nodes_
+      max_depth = self.max_depth_
+      stack = [(root, depth)]
+      while len(stack) > 0:
+        node, node_depth = stack.pop()
+        namespace = node.namespace
+        nodes[namespace] = nodes.get(namespace, 0) + 1
+        if node_depth > max_depth:
+          max_depth = node_depth
+        node_depth += 1
+        for n in node.children_:
+          stack.append((n, node_depth))
+      self.max_depth_ = max_depth
+    self.add_time('count', start)
+
+  def count_columnar_nodes(self, tree, depth):
+    # Parents have lower ids than their children, so one pass in id order
+    # gets every depth. Nodes under a detached node are not in the tree.
+    nodes = self.nodes_
+    kinds = tree.kinds_
+    parents = tree.parent_
+    depths = [depth]
+    for i in range(1, len(tree.kind_)):
+      kind = tree.kind_[i]
+      parent_depth = depths[parents[i]]
+      if kind == parsers.DETACHED or parent_depth < 0:
+        depths.append(-1)
+        continue
+      depths.append(parent_depth + 1)
+    for i, kind in enumerate(tree.kind_):
+      if depths[i] < 0:
+        continue
+      namespace = kinds[kind][2]
+      nodes[namespace] = nodes.get(namespace, 0) + 1
+    self.max_depth_ = max(self.max_depth_, max(depths))
+
+  def wall_time(self, phase=None):
+    # Wall time of phase, or of all phases
+    if phase is None:
+      return sum(times[0] for times in self.phases_.values())
+    return self.phases_.get(phase, (0.0, 0.0))[0]
+
+  def cpu_time(self, phase=None):
+    if phase is None:
+      return sum(times[1] for times in self.phases_.values())
+    return self.phases_.get(phase, (0.0, 0.0))[1]
+
+  def as_dict(self):
+    return {
+      'phases': {phase: {'wall': times[0], 'cpu': times[1]} for phase, times in self.phases_.items()},
+      'nodes': dict(self.nodes_),
+      'node_count': self.node_count,
+      'max_depth': self.max_depth_,
+      'chars_in': self.chars_in_,
+      'chars_out': self.chars_out_,
+      'buffer_pushes': self.buffer_pushes_,
+      'cached': self.cached_,
+    }
+
+  @property
+  def phases(self):
+    return self.phases_
+
+  @property
+  def nodes(self):
+    # {namespace URI: number of nodes}; the root and unknown elements may
+    # have no namespace (None)
+    return self.nodes_
+
+  @property
+  def node_count(self):
+    return sum(self.nodes_.values())
+
+  @property
+  def max_depth(self):
+    return self.max_depth_
+
+  @property
+  def chars_in(self):
+    return self.chars_in_
+
+  @property
+  def chars_out(self):
+    return self.chars_out_
+
+  @property
+  def buffer_pushes(self):
+    return self.buffer_pushes_
+
+  @property
+  def cached(self):
+    return self.cached_
+
+  @cached.setter
+  def cached(self, cached):
+    self.cached_ = cached
@@ -3,3 +3,6 @@
 from .ast import *
 from .parser import *
 
+from .columnar import *
+from .profile import *
+from .extract import *
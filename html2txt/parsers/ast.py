@@ -4,7 +4,8 @@ import sys
 from . import visitor as v
 
 from collections import OrderedDict, namedtuple
-from io import StringIO
+from types import MappingProxyType
+from io import StringIO, TextIOBase, RawIOBase, BufferedIOBase
 from xml.sax.saxutils import escape, quoteattr
 import html
 
@@ -44,16 +45,32 @@ from .common import escape_url, escape_html
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+# Shared values of the containers of a node that has none
+EMPTY_CHILDREN = ()
+EMPTY_ATTRIBUTES = MappingProxyType(OrderedDict())
+
+# A source span is stored as one int: the start offset shifted left by
+# SPAN_BITS and the length in the low bits
+SPAN_BITS = 40
+SPAN_MASK = (1 << SPAN_BITS) - 1
+
 class Node:
-  def __init__(self):
-    self.name_ = "Node"
-    self.namespace_ = None
-    self.namespace_map_ = {}
-    self.attributes_ = OrderedDict()
+  # name_ and namespace_ are class attributes. Setting them on an instance
+  # (e.g. for an unknown tag) stores them in the instance __dict__, which
+  # is only allocated then.
+  # source_span_ is only set by parsers that track offsets.
+  __slots__ = ('namespace_map_', 'attributes_', 'text_', 'tail_', 'parent_', 'children_', 'source_span_', '__dict__')
+  name_ = "Node"
+  namespace_ = None
+
+  def __init__(self):
+    # Containers are allocated on first write
+    self.namespace_map_ = None
+    self.attributes_ = None
     self.text_ = None
     self.tail_ = None
     self.parent_ = None
-    self.children_ = []
+    self.children_ = EMPTY_CHILDREN
 
   @property
   def tag(self):
@@ -79,6 +96,8 @@ class Node:
 
   @property
   def namespace_map(self):
+    if self.namespace_map_ is None:
+      self.namespace_map_ = {}
     return self.namespace_map_
 
   @namespace_map.setter
@@ -95,6 +114,10 @@ class Node:
 
   @property
   def children(self):
+    # The list is allocated on first access. The parser and the visitors
+    # read children_, which is EMPTY_CHILDREN for a leaf.
+    if self.children_ is EMPTY_CHILDREN:
+      self.children_ = []
     return self.children_
 
   @children.setter
@@ -102,21 +125,31 @@ class Node:
     self.children_ = children
 
   def add_child(self, child):
-    child.parent = self
-    self.children_.append(child)
+    child.parent_ = self
+    if self.children_ is EMPTY_CHILDREN:
+      self.children_ = [child]
+    else:
+      self.children_.append(child)
 
   @property
   def attributes(self):
+    # Like children, allocated on first access. The visitors read
+    # attributes_, which is None without attributes.
+    if self.attributes_ is None:
+      self.attributes_ = OrderedDict()
     return self.attributes_
 
   def attribute(self, name):
     if name == "text":
       return self.text_
-    if name in self.attributes_:
-      return self.attributes_[name]
+    attributes = self.attributes_
+    if attributes is not None and name in attributes:
+      return attributes[name]
     return None
 
   def set_attribute(self, name, value):
+    if self.attributes_ is None:
+      self.attributes_ = OrderedDict()
     self.attributes_[name] = value
 
   @property
@@ -135,6 +168,20 @@ class Node:
   def tail(self, tail):
     self.tail_ = tail
 
+  @property
+  def source_span(self):
+    # (start, end) character offsets of the element in the parsed input,
+    # or None if they were not tracked
+    try:
+      span = self.source_span_
+    except AttributeError:
+      return None
+    start = span >> SPAN_BITS
+    return (start, start + (span & SPAN_MASK))
+
+  def set_source_span(self, start, end):
+    self.source_span_ = (start << SPAN_BITS) | (end - start)
+
   def accept(self, visitor):
     return visitor.visit(self)
 
@@ -154,6 +201,7 @@ class Node:
 # cog -r ast.py
 '''[[[cog
 import cog
+import re
 
 tags = [
   # Namespace                                Tag                                Open Tag              Pre-Close Tag  Close Tag      Node Text     Post Tag     Indent        Attributes    Actions
@@ -247,7 +295,7 @@ tags = [
   ("http://www.w3.org/1999/xhtml"          , "caption"                ,         "~default~",          "",            "</caption>\n",            "node_text, node_tail = self.format_caption_text(node.text, node.tail)",           "",           "",           "",           "contents"),
   ("http://www.w3.org/1999/xhtml"          , "col"                    ,         "",          "",            "",            "",           "",           "",           "",           "contents"),
   ("http://www.w3.org/1999/xhtml"          , "colgroup"               ,         "",          "",            "",            "",           "",           "",           "",           "contents"),
-  ("http://www.w3.org/1999/xhtml"          , "table"                  ,         "open_tag, close_tag = self.format_table_tag(node.text, node.tail)",          "",            "~ignore~",            "node_text, node_tail = self.format_table_text(node.text, node.tail)",           "self.post_table_tag()",           "",           "",           "contents"),
+  ("http://www.w3.org/1999/xhtml"          , "table"                  ,         "open_tag, close_tag = self.format_table_tag(node.text, node.tail)",          "",            "~ignore~",            "node_text = self.format_table_text(node.text)",           "self.post_table_tag()",           "",           "",           "contents"),
   ("http://www.w3.org/1999/xhtml"          , "tbody"                  ,         "",          "",            "",            "node_text, node_tail = self.format_tbody_text(node.text, node.tail)",           "",           "",           "",           "contents"),
   ("http://www.w3.org/1999/xhtml"          , "td"                     ,         "",          "",            "|",            "node_text, node_tail = self.format_td_text(attr_style, node.text, node.tail)",           "",           "",           "style",           "contents"),
   ("http://www.w3.org/1999/xhtml"          , "tfoot"                  ,         "",          "",            "",            "node_text, node_tail = self.format_tfoot_text(node.text, node.tail)",           "",           "",           "",           "contents"),
@@ -430,1859 +478,1805 @@ for namespace, tag, open_tag, preclose_tag, close_tag, node_text, post_tag, inde
   node_name = upperFirst(tag.replace('-', ''))
   cog.outl("""# %s{%s}
 class %s%sNode(Node):
-  def __init__(self):
-    super(%s%sNode, self).__init__()
-    self.name_ = "%s"
-    self.namespace_ = "%s"
-""" % (namespace, tag, node_ns, node_name, node_ns, node_name, tag, namespace))
+  __slots__ = ()
+  name_ = "%s"
+  namespace_ = "%s"
+""" % (namespace, tag, node_ns, node_name, tag, namespace))
+
+# Nodes that MarkdownVisitor renders as HTML markup like unknown elements
+cog.outl("MARKUP_NODES = frozenset([")
+for namespace, tag, open_tag, preclose_tag, close_tag, node_text, post_tag, indent_char, attributes, actions in tags:
+  if (open_tag, preclose_tag, close_tag, node_text, post_tag, attributes, actions) == ("~default~", "", "~default~", "", "", "", "contents"):
+    cog.outl("  %s%sNode," % (upperFirst(namespace.split('/')[-1]), upperFirst(tag.replace('-', ''))))
+cog.outl("])")
+cog.outl("")
+
+# Nodes that MarkdownVisitor skips except for their tail
+cog.outl("IGNORED_NODES = frozenset([")
+for namespace, tag, open_tag, preclose_tag, close_tag, node_text, post_tag, indent_char, attributes, actions in tags:
+  if actions == "ignore":
+    cog.outl("  %s%sNode," % (upperFirst(namespace.split('/')[-1]), upperFirst(tag.replace('-', ''))))
+cog.outl("])")
+cog.outl("")
 ]]]'''
 # http://www.w3.org/1999/xhtml{comment}
 class XhtmlCommentNode(Node):
-  def __init__(self):
-    super(XhtmlCommentNode, self).__init__()
-    self.name_ = "comment"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "comment"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{html}
 class XhtmlHtmlNode(Node):
-  def __init__(self):
-    super(XhtmlHtmlNode, self).__init__()
-    self.name_ = "html"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "html"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{base}
 class XhtmlBaseNode(Node):
-  def __init__(self):
-    super(XhtmlBaseNode, self).__init__()
-    self.name_ = "base"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "base"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{head}
 class XhtmlHeadNode(Node):
-  def __init__(self):
-    super(XhtmlHeadNode, self).__init__()
-    self.name_ = "head"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "head"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{link}
 class XhtmlLinkNode(Node):
-  def __init__(self):
-    super(XhtmlLinkNode, self).__init__()
-    self.name_ = "link"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "link"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{meta}
 class XhtmlMetaNode(Node):
-  def __init__(self):
-    super(XhtmlMetaNode, self).__init__()
-    self.name_ = "meta"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "meta"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{style}
 class XhtmlStyleNode(Node):
-  def __init__(self):
-    super(XhtmlStyleNode, self).__init__()
-    self.name_ = "style"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "style"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{title}
 class XhtmlTitleNode(Node):
-  def __init__(self):
-    super(XhtmlTitleNode, self).__init__()
-    self.name_ = "title"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "title"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{body}
 class XhtmlBodyNode(Node):
-  def __init__(self):
-    super(XhtmlBodyNode, self).__init__()
-    self.name_ = "body"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "body"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{address}
 class XhtmlAddressNode(Node):
-  def __init__(self):
-    super(XhtmlAddressNode, self).__init__()
-    self.name_ = "address"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "address"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{article}
 class XhtmlArticleNode(Node):
-  def __init__(self):
-    super(XhtmlArticleNode, self).__init__()
-    self.name_ = "article"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "article"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{aside}
 class XhtmlAsideNode(Node):
-  def __init__(self):
-    super(XhtmlAsideNode, self).__init__()
-    self.name_ = "aside"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "aside"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{footer}
 class XhtmlFooterNode(Node):
-  def __init__(self):
-    super(XhtmlFooterNode, self).__init__()
-    self.name_ = "footer"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "footer"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{header}
 class XhtmlHeaderNode(Node):
-  def __init__(self):
-    super(XhtmlHeaderNode, self).__init__()
-    self.name_ = "header"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "header"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{h1}
 class XhtmlH1Node(Node):
-  def __init__(self):
-    super(XhtmlH1Node, self).__init__()
-    self.name_ = "h1"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "h1"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{h2}
 class XhtmlH2Node(Node):
-  def __init__(self):
-    super(XhtmlH2Node, self).__init__()
-    self.name_ = "h2"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "h2"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{h3}
 class XhtmlH3Node(Node):
-  def __init__(self):
-    super(XhtmlH3Node, self).__init__()
-    self.name_ = "h3"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "h3"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{h4}
 class XhtmlH4Node(Node):
-  def __init__(self):
-    super(XhtmlH4Node, self).__init__()
-    self.name_ = "h4"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "h4"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{h5}
 class XhtmlH5Node(Node):
-  def __init__(self):
-    super(XhtmlH5Node, self).__init__()
-    self.name_ = "h5"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "h5"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{h6}
 class XhtmlH6Node(Node):
-  def __init__(self):
-    super(XhtmlH6Node, self).__init__()
-    self.name_ = "h6"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "h6"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{hgroup}
 class XhtmlHgroupNode(Node):
-  def __init__(self):
-    super(XhtmlHgroupNode, self).__init__()
-    self.name_ = "hgroup"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "hgroup"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{main}
 class XhtmlMainNode(Node):
-  def __init__(self):
-    super(XhtmlMainNode, self).__init__()
-    self.name_ = "main"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "main"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{nav}
 class XhtmlNavNode(Node):
-  def __init__(self):
-    super(XhtmlNavNode, self).__init__()
-    self.name_ = "nav"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "nav"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{section}
 class XhtmlSectionNode(Node):
-  def __init__(self):
-    super(XhtmlSectionNode, self).__init__()
-    self.name_ = "section"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "section"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{blockquote}
 class XhtmlBlockquoteNode(Node):
-  def __init__(self):
-    super(XhtmlBlockquoteNode, self).__init__()
-    self.name_ = "blockquote"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "blockquote"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{dd}
 class XhtmlDdNode(Node):
-  def __init__(self):
-    super(XhtmlDdNode, self).__init__()
-    self.name_ = "dd"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "dd"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{div}
 class XhtmlDivNode(Node):
-  def __init__(self):
-    super(XhtmlDivNode, self).__init__()
-    self.name_ = "div"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "div"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{dl}
 class XhtmlDlNode(Node):
-  def __init__(self):
-    super(XhtmlDlNode, self).__init__()
-    self.name_ = "dl"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "dl"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{dt}
 class XhtmlDtNode(Node):
-  def __init__(self):
-    super(XhtmlDtNode, self).__init__()
-    self.name_ = "dt"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "dt"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{figcaption}
 class XhtmlFigcaptionNode(Node):
-  def __init__(self):
-    super(XhtmlFigcaptionNode, self).__init__()
-    self.name_ = "figcaption"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "figcaption"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{figure}
 class XhtmlFigureNode(Node):
-  def __init__(self):
-    super(XhtmlFigureNode, self).__init__()
-    self.name_ = "figure"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "figure"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{hr}
 class XhtmlHrNode(Node):
-  def __init__(self):
-    super(XhtmlHrNode, self).__init__()
-    self.name_ = "hr"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "hr"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{li}
 class XhtmlLiNode(Node):
-  def __init__(self):
-    super(XhtmlLiNode, self).__init__()
-    self.name_ = "li"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "li"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{main}
 class XhtmlMainNode(Node):
-  def __init__(self):
-    super(XhtmlMainNode, self).__init__()
-    self.name_ = "main"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "main"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{ol}
 class XhtmlOlNode(Node):
-  def __init__(self):
-    super(XhtmlOlNode, self).__init__()
-    self.name_ = "ol"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "ol"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{p}
 class XhtmlPNode(Node):
-  def __init__(self):
-    super(XhtmlPNode, self).__init__()
-    self.name_ = "p"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "p"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{pre}
 class XhtmlPreNode(Node):
-  def __init__(self):
-    super(XhtmlPreNode, self).__init__()
-    self.name_ = "pre"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "pre"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{ul}
 class XhtmlUlNode(Node):
-  def __init__(self):
-    super(XhtmlUlNode, self).__init__()
-    self.name_ = "ul"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "ul"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{a}
 class XhtmlANode(Node):
-  def __init__(self):
-    super(XhtmlANode, self).__init__()
-    self.name_ = "a"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "a"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{abbr}
 class XhtmlAbbrNode(Node):
-  def __init__(self):
-    super(XhtmlAbbrNode, self).__init__()
-    self.name_ = "abbr"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "abbr"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{b}
 class XhtmlBNode(Node):
-  def __init__(self):
-    super(XhtmlBNode, self).__init__()
-    self.name_ = "b"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "b"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{bdi}
 class XhtmlBdiNode(Node):
-  def __init__(self):
-    super(XhtmlBdiNode, self).__init__()
-    self.name_ = "bdi"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "bdi"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{bdo}
 class XhtmlBdoNode(Node):
-  def __init__(self):
-    super(XhtmlBdoNode, self).__init__()
-    self.name_ = "bdo"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "bdo"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{br}
 class XhtmlBrNode(Node):
-  def __init__(self):
-    super(XhtmlBrNode, self).__init__()
-    self.name_ = "br"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "br"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{cite}
 class XhtmlCiteNode(Node):
-  def __init__(self):
-    super(XhtmlCiteNode, self).__init__()
-    self.name_ = "cite"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "cite"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{code}
 class XhtmlCodeNode(Node):
-  def __init__(self):
-    super(XhtmlCodeNode, self).__init__()
-    self.name_ = "code"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "code"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{data}
 class XhtmlDataNode(Node):
-  def __init__(self):
-    super(XhtmlDataNode, self).__init__()
-    self.name_ = "data"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "data"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{dfn}
 class XhtmlDfnNode(Node):
-  def __init__(self):
-    super(XhtmlDfnNode, self).__init__()
-    self.name_ = "dfn"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "dfn"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{em}
 class XhtmlEmNode(Node):
-  def __init__(self):
-    super(XhtmlEmNode, self).__init__()
-    self.name_ = "em"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "em"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{i}
 class XhtmlINode(Node):
-  def __init__(self):
-    super(XhtmlINode, self).__init__()
-    self.name_ = "i"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "i"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{kbd}
 class XhtmlKbdNode(Node):
-  def __init__(self):
-    super(XhtmlKbdNode, self).__init__()
-    self.name_ = "kbd"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "kbd"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{mark}
 class XhtmlMarkNode(Node):
-  def __init__(self):
-    super(XhtmlMarkNode, self).__init__()
-    self.name_ = "mark"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "mark"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{q}
 class XhtmlQNode(Node):
-  def __init__(self):
-    super(XhtmlQNode, self).__init__()
-    self.name_ = "q"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "q"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{rb}
 class XhtmlRbNode(Node):
-  def __init__(self):
-    super(XhtmlRbNode, self).__init__()
-    self.name_ = "rb"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "rb"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{rp}
 class XhtmlRpNode(Node):
-  def __init__(self):
-    super(XhtmlRpNode, self).__init__()
-    self.name_ = "rp"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "rp"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{rt}
 class XhtmlRtNode(Node):
-  def __init__(self):
-    super(XhtmlRtNode, self).__init__()
-    self.name_ = "rt"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "rt"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{rtc}
 class XhtmlRtcNode(Node):
-  def __init__(self):
-    super(XhtmlRtcNode, self).__init__()
-    self.name_ = "rtc"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "rtc"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{ruby}
 class XhtmlRubyNode(Node):
-  def __init__(self):
-    super(XhtmlRubyNode, self).__init__()
-    self.name_ = "ruby"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "ruby"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{s}
 class XhtmlSNode(Node):
-  def __init__(self):
-    super(XhtmlSNode, self).__init__()
-    self.name_ = "s"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "s"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{samp}
 class XhtmlSampNode(Node):
-  def __init__(self):
-    super(XhtmlSampNode, self).__init__()
-    self.name_ = "samp"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "samp"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{small}
 class XhtmlSmallNode(Node):
-  def __init__(self):
-    super(XhtmlSmallNode, self).__init__()
-    self.name_ = "small"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "small"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{span}
 class XhtmlSpanNode(Node):
-  def __init__(self):
-    super(XhtmlSpanNode, self).__init__()
-    self.name_ = "span"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "span"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{strong}
 class XhtmlStrongNode(Node):
-  def __init__(self):
-    super(XhtmlStrongNode, self).__init__()
-    self.name_ = "strong"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "strong"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{sub}
 class XhtmlSubNode(Node):
-  def __init__(self):
-    super(XhtmlSubNode, self).__init__()
-    self.name_ = "sub"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "sub"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{sup}
 class XhtmlSupNode(Node):
-  def __init__(self):
-    super(XhtmlSupNode, self).__init__()
-    self.name_ = "sup"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "sup"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{time}
 class XhtmlTimeNode(Node):
-  def __init__(self):
-    super(XhtmlTimeNode, self).__init__()
-    self.name_ = "time"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "time"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{u}
 class XhtmlUNode(Node):
-  def __init__(self):
-    super(XhtmlUNode, self).__init__()
-    self.name_ = "u"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "u"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{var}
 class XhtmlVarNode(Node):
-  def __init__(self):
-    super(XhtmlVarNode, self).__init__()
-    self.name_ = "var"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "var"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{wbr}
 class XhtmlWbrNode(Node):
-  def __init__(self):
-    super(XhtmlWbrNode, self).__init__()
-    self.name_ = "wbr"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "wbr"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{area}
 class XhtmlAreaNode(Node):
-  def __init__(self):
-    super(XhtmlAreaNode, self).__init__()
-    self.name_ = "area"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "area"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{audio}
 class XhtmlAudioNode(Node):
-  def __init__(self):
-    super(XhtmlAudioNode, self).__init__()
-    self.name_ = "audio"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "audio"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{img}
 class XhtmlImgNode(Node):
-  def __init__(self):
-    super(XhtmlImgNode, self).__init__()
-    self.name_ = "img"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "img"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{map}
 class XhtmlMapNode(Node):
-  def __init__(self):
-    super(XhtmlMapNode, self).__init__()
-    self.name_ = "map"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "map"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{track}
 class XhtmlTrackNode(Node):
-  def __init__(self):
-    super(XhtmlTrackNode, self).__init__()
-    self.name_ = "track"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "track"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{video}
 class XhtmlVideoNode(Node):
-  def __init__(self):
-    super(XhtmlVideoNode, self).__init__()
-    self.name_ = "video"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "video"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{embed}
 class XhtmlEmbedNode(Node):
-  def __init__(self):
-    super(XhtmlEmbedNode, self).__init__()
-    self.name_ = "embed"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "embed"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{iframe}
 class XhtmlIframeNode(Node):
-  def __init__(self):
-    super(XhtmlIframeNode, self).__init__()
-    self.name_ = "iframe"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "iframe"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{object}
 class XhtmlObjectNode(Node):
-  def __init__(self):
-    super(XhtmlObjectNode, self).__init__()
-    self.name_ = "object"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "object"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{param}
 class XhtmlParamNode(Node):
-  def __init__(self):
-    super(XhtmlParamNode, self).__init__()
-    self.name_ = "param"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "param"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{picture}
 class XhtmlPictureNode(Node):
-  def __init__(self):
-    super(XhtmlPictureNode, self).__init__()
-    self.name_ = "picture"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "picture"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{source}
 class XhtmlSourceNode(Node):
-  def __init__(self):
-    super(XhtmlSourceNode, self).__init__()
-    self.name_ = "source"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "source"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{canvas}
 class XhtmlCanvasNode(Node):
-  def __init__(self):
-    super(XhtmlCanvasNode, self).__init__()
-    self.name_ = "canvas"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "canvas"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{noscript}
 class XhtmlNoscriptNode(Node):
-  def __init__(self):
-    super(XhtmlNoscriptNode, self).__init__()
-    self.name_ = "noscript"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "noscript"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{script}
 class XhtmlScriptNode(Node):
-  def __init__(self):
-    super(XhtmlScriptNode, self).__init__()
-    self.name_ = "script"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "script"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{del}
 class XhtmlDelNode(Node):
-  def __init__(self):
-    super(XhtmlDelNode, self).__init__()
-    self.name_ = "del"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "del"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{ins}
 class XhtmlInsNode(Node):
-  def __init__(self):
-    super(XhtmlInsNode, self).__init__()
-    self.name_ = "ins"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "ins"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{caption}
 class XhtmlCaptionNode(Node):
-  def __init__(self):
-    super(XhtmlCaptionNode, self).__init__()
-    self.name_ = "caption"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "caption"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{col}
 class XhtmlColNode(Node):
-  def __init__(self):
-    super(XhtmlColNode, self).__init__()
-    self.name_ = "col"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "col"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{colgroup}
 class XhtmlColgroupNode(Node):
-  def __init__(self):
-    super(XhtmlColgroupNode, self).__init__()
-    self.name_ = "colgroup"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "colgroup"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{table}
 class XhtmlTableNode(Node):
-  def __init__(self):
-    super(XhtmlTableNode, self).__init__()
-    self.name_ = "table"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "table"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{tbody}
 class XhtmlTbodyNode(Node):
-  def __init__(self):
-    super(XhtmlTbodyNode, self).__init__()
-    self.name_ = "tbody"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "tbody"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{td}
 class XhtmlTdNode(Node):
-  def __init__(self):
-    super(XhtmlTdNode, self).__init__()
-    self.name_ = "td"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "td"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{tfoot}
 class XhtmlTfootNode(Node):
-  def __init__(self):
-    super(XhtmlTfootNode, self).__init__()
-    self.name_ = "tfoot"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "tfoot"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{th}
 class XhtmlThNode(Node):
-  def __init__(self):
-    super(XhtmlThNode, self).__init__()
-    self.name_ = "th"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "th"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{thead}
 class XhtmlTheadNode(Node):
-  def __init__(self):
-    super(XhtmlTheadNode, self).__init__()
-    self.name_ = "thead"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "thead"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{tr}
 class XhtmlTrNode(Node):
-  def __init__(self):
-    super(XhtmlTrNode, self).__init__()
-    self.name_ = "tr"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "tr"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{button}
 class XhtmlButtonNode(Node):
-  def __init__(self):
-    super(XhtmlButtonNode, self).__init__()
-    self.name_ = "button"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "button"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{datalist}
 class XhtmlDatalistNode(Node):
-  def __init__(self):
-    super(XhtmlDatalistNode, self).__init__()
-    self.name_ = "datalist"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "datalist"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{fieldset}
 class XhtmlFieldsetNode(Node):
-  def __init__(self):
-    super(XhtmlFieldsetNode, self).__init__()
-    self.name_ = "fieldset"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "fieldset"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{form}
 class XhtmlFormNode(Node):
-  def __init__(self):
-    super(XhtmlFormNode, self).__init__()
-    self.name_ = "form"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "form"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{input}
 class XhtmlInputNode(Node):
-  def __init__(self):
-    super(XhtmlInputNode, self).__init__()
-    self.name_ = "input"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "input"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{label}
 class XhtmlLabelNode(Node):
-  def __init__(self):
-    super(XhtmlLabelNode, self).__init__()
-    self.name_ = "label"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "label"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{legend}
 class XhtmlLegendNode(Node):
-  def __init__(self):
-    super(XhtmlLegendNode, self).__init__()
-    self.name_ = "legend"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "legend"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{meter}
 class XhtmlMeterNode(Node):
-  def __init__(self):
-    super(XhtmlMeterNode, self).__init__()
-    self.name_ = "meter"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "meter"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{optgroup}
 class XhtmlOptgroupNode(Node):
-  def __init__(self):
-    super(XhtmlOptgroupNode, self).__init__()
-    self.name_ = "optgroup"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "optgroup"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{option}
 class XhtmlOptionNode(Node):
-  def __init__(self):
-    super(XhtmlOptionNode, self).__init__()
-    self.name_ = "option"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "option"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{output}
 class XhtmlOutputNode(Node):
-  def __init__(self):
-    super(XhtmlOutputNode, self).__init__()
-    self.name_ = "output"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "output"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{progress}
 class XhtmlProgressNode(Node):
-  def __init__(self):
-    super(XhtmlProgressNode, self).__init__()
-    self.name_ = "progress"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "progress"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{select}
 class XhtmlSelectNode(Node):
-  def __init__(self):
-    super(XhtmlSelectNode, self).__init__()
-    self.name_ = "select"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "select"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{textarea}
 class XhtmlTextareaNode(Node):
-  def __init__(self):
-    super(XhtmlTextareaNode, self).__init__()
-    self.name_ = "textarea"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "textarea"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{details}
 class XhtmlDetailsNode(Node):
-  def __init__(self):
-    super(XhtmlDetailsNode, self).__init__()
-    self.name_ = "details"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "details"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{dialog}
 class XhtmlDialogNode(Node):
-  def __init__(self):
-    super(XhtmlDialogNode, self).__init__()
-    self.name_ = "dialog"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "dialog"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{menu}
 class XhtmlMenuNode(Node):
-  def __init__(self):
-    super(XhtmlMenuNode, self).__init__()
-    self.name_ = "menu"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "menu"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{summary}
 class XhtmlSummaryNode(Node):
-  def __init__(self):
-    super(XhtmlSummaryNode, self).__init__()
-    self.name_ = "summary"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "summary"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{slot}
 class XhtmlSlotNode(Node):
-  def __init__(self):
-    super(XhtmlSlotNode, self).__init__()
-    self.name_ = "slot"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "slot"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{template}
 class XhtmlTemplateNode(Node):
-  def __init__(self):
-    super(XhtmlTemplateNode, self).__init__()
-    self.name_ = "template"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "template"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{acronym}
 class XhtmlAcronymNode(Node):
-  def __init__(self):
-    super(XhtmlAcronymNode, self).__init__()
-    self.name_ = "acronym"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "acronym"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{applet}
 class XhtmlAppletNode(Node):
-  def __init__(self):
-    super(XhtmlAppletNode, self).__init__()
-    self.name_ = "applet"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "applet"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{basefont}
 class XhtmlBasefontNode(Node):
-  def __init__(self):
-    super(XhtmlBasefontNode, self).__init__()
-    self.name_ = "basefont"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "basefont"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{bgsound}
 class XhtmlBgsoundNode(Node):
-  def __init__(self):
-    super(XhtmlBgsoundNode, self).__init__()
-    self.name_ = "bgsound"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "bgsound"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{big}
 class XhtmlBigNode(Node):
-  def __init__(self):
-    super(XhtmlBigNode, self).__init__()
-    self.name_ = "big"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "big"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{blink}
 class XhtmlBlinkNode(Node):
-  def __init__(self):
-    super(XhtmlBlinkNode, self).__init__()
-    self.name_ = "blink"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "blink"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{center}
 class XhtmlCenterNode(Node):
-  def __init__(self):
-    super(XhtmlCenterNode, self).__init__()
-    self.name_ = "center"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "center"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{command}
 class XhtmlCommandNode(Node):
-  def __init__(self):
-    super(XhtmlCommandNode, self).__init__()
-    self.name_ = "command"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "command"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{content}
 class XhtmlContentNode(Node):
-  def __init__(self):
-    super(XhtmlContentNode, self).__init__()
-    self.name_ = "content"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "content"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{dir}
 class XhtmlDirNode(Node):
-  def __init__(self):
-    super(XhtmlDirNode, self).__init__()
-    self.name_ = "dir"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "dir"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{element}
 class XhtmlElementNode(Node):
-  def __init__(self):
-    super(XhtmlElementNode, self).__init__()
-    self.name_ = "element"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "element"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{font}
 class XhtmlFontNode(Node):
-  def __init__(self):
-    super(XhtmlFontNode, self).__init__()
-    self.name_ = "font"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "font"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{frame}
 class XhtmlFrameNode(Node):
-  def __init__(self):
-    super(XhtmlFrameNode, self).__init__()
-    self.name_ = "frame"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "frame"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{frameset}
 class XhtmlFramesetNode(Node):
-  def __init__(self):
-    super(XhtmlFramesetNode, self).__init__()
-    self.name_ = "frameset"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "frameset"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{image}
 class XhtmlImageNode(Node):
-  def __init__(self):
-    super(XhtmlImageNode, self).__init__()
-    self.name_ = "image"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "image"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{isindex}
 class XhtmlIsindexNode(Node):
-  def __init__(self):
-    super(XhtmlIsindexNode, self).__init__()
-    self.name_ = "isindex"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "isindex"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{keygen}
 class XhtmlKeygenNode(Node):
-  def __init__(self):
-    super(XhtmlKeygenNode, self).__init__()
-    self.name_ = "keygen"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "keygen"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{listing}
 class XhtmlListingNode(Node):
-  def __init__(self):
-    super(XhtmlListingNode, self).__init__()
-    self.name_ = "listing"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "listing"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{marquee}
 class XhtmlMarqueeNode(Node):
-  def __init__(self):
-    super(XhtmlMarqueeNode, self).__init__()
-    self.name_ = "marquee"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "marquee"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{menuitem}
 class XhtmlMenuitemNode(Node):
-  def __init__(self):
-    super(XhtmlMenuitemNode, self).__init__()
-    self.name_ = "menuitem"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "menuitem"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{multicol}
 class XhtmlMulticolNode(Node):
-  def __init__(self):
-    super(XhtmlMulticolNode, self).__init__()
-    self.name_ = "multicol"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "multicol"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{nextid}
 class XhtmlNextidNode(Node):
-  def __init__(self):
-    super(XhtmlNextidNode, self).__init__()
-    self.name_ = "nextid"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "nextid"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{nobr}
 class XhtmlNobrNode(Node):
-  def __init__(self):
-    super(XhtmlNobrNode, self).__init__()
-    self.name_ = "nobr"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "nobr"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{noembed}
 class XhtmlNoembedNode(Node):
-  def __init__(self):
-    super(XhtmlNoembedNode, self).__init__()
-    self.name_ = "noembed"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "noembed"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{noframes}
 class XhtmlNoframesNode(Node):
-  def __init__(self):
-    super(XhtmlNoframesNode, self).__init__()
-    self.name_ = "noframes"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "noframes"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{plaintext}
 class XhtmlPlaintextNode(Node):
-  def __init__(self):
-    super(XhtmlPlaintextNode, self).__init__()
-    self.name_ = "plaintext"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "plaintext"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{shadow}
 class XhtmlShadowNode(Node):
-  def __init__(self):
-    super(XhtmlShadowNode, self).__init__()
-    self.name_ = "shadow"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "shadow"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{spacer}
 class XhtmlSpacerNode(Node):
-  def __init__(self):
-    super(XhtmlSpacerNode, self).__init__()
-    self.name_ = "spacer"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "spacer"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{strike}
 class XhtmlStrikeNode(Node):
-  def __init__(self):
-    super(XhtmlStrikeNode, self).__init__()
-    self.name_ = "strike"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "strike"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{tt}
 class XhtmlTtNode(Node):
-  def __init__(self):
-    super(XhtmlTtNode, self).__init__()
-    self.name_ = "tt"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "tt"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{xmp}
 class XhtmlXmpNode(Node):
-  def __init__(self):
-    super(XhtmlXmpNode, self).__init__()
-    self.name_ = "xmp"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "xmp"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/1999/xhtml{svg}
 class XhtmlSvgNode(Node):
-  def __init__(self):
-    super(XhtmlSvgNode, self).__init__()
-    self.name_ = "svg"
-    self.namespace_ = "http://www.w3.org/1999/xhtml"
+  __slots__ = ()
+  name_ = "svg"
+  namespace_ = "http://www.w3.org/1999/xhtml"
 
 # http://www.w3.org/2000/svg{a}
 class SvgANode(Node):
-  def __init__(self):
-    super(SvgANode, self).__init__()
-    self.name_ = "a"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "a"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{animate}
 class SvgAnimateNode(Node):
-  def __init__(self):
-    super(SvgAnimateNode, self).__init__()
-    self.name_ = "animate"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "animate"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{animateMotion}
 class SvgAnimateMotionNode(Node):
-  def __init__(self):
-    super(SvgAnimateMotionNode, self).__init__()
-    self.name_ = "animateMotion"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "animateMotion"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{animateTransform}
 class SvgAnimateTransformNode(Node):
-  def __init__(self):
-    super(SvgAnimateTransformNode, self).__init__()
-    self.name_ = "animateTransform"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "animateTransform"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{circle}
 class SvgCircleNode(Node):
-  def __init__(self):
-    super(SvgCircleNode, self).__init__()
-    self.name_ = "circle"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "circle"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{clipPath}
 class SvgClipPathNode(Node):
-  def __init__(self):
-    super(SvgClipPathNode, self).__init__()
-    self.name_ = "clipPath"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "clipPath"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{color-profile}
 class SvgColorprofileNode(Node):
-  def __init__(self):
-    super(SvgColorprofileNode, self).__init__()
-    self.name_ = "color-profile"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "color-profile"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{defs}
 class SvgDefsNode(Node):
-  def __init__(self):
-    super(SvgDefsNode, self).__init__()
-    self.name_ = "defs"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "defs"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{desc}
 class SvgDescNode(Node):
-  def __init__(self):
-    super(SvgDescNode, self).__init__()
-    self.name_ = "desc"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "desc"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{discard}
 class SvgDiscardNode(Node):
-  def __init__(self):
-    super(SvgDiscardNode, self).__init__()
-    self.name_ = "discard"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "discard"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{ellipse}
 class SvgEllipseNode(Node):
-  def __init__(self):
-    super(SvgEllipseNode, self).__init__()
-    self.name_ = "ellipse"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "ellipse"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feBlend}
 class SvgFeBlendNode(Node):
-  def __init__(self):
-    super(SvgFeBlendNode, self).__init__()
-    self.name_ = "feBlend"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feBlend"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feColorMatrix}
 class SvgFeColorMatrixNode(Node):
-  def __init__(self):
-    super(SvgFeColorMatrixNode, self).__init__()
-    self.name_ = "feColorMatrix"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feColorMatrix"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feComponentTransfer}
 class SvgFeComponentTransferNode(Node):
-  def __init__(self):
-    super(SvgFeComponentTransferNode, self).__init__()
-    self.name_ = "feComponentTransfer"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feComponentTransfer"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feComposite}
 class SvgFeCompositeNode(Node):
-  def __init__(self):
-    super(SvgFeCompositeNode, self).__init__()
-    self.name_ = "feComposite"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feComposite"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feConvolveMatrix}
 class SvgFeConvolveMatrixNode(Node):
-  def __init__(self):
-    super(SvgFeConvolveMatrixNode, self).__init__()
-    self.name_ = "feConvolveMatrix"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feConvolveMatrix"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feDiffuseLighting}
 class SvgFeDiffuseLightingNode(Node):
-  def __init__(self):
-    super(SvgFeDiffuseLightingNode, self).__init__()
-    self.name_ = "feDiffuseLighting"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feDiffuseLighting"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feDisplacementMap}
 class SvgFeDisplacementMapNode(Node):
-  def __init__(self):
-    super(SvgFeDisplacementMapNode, self).__init__()
-    self.name_ = "feDisplacementMap"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feDisplacementMap"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feDistantLight}
 class SvgFeDistantLightNode(Node):
-  def __init__(self):
-    super(SvgFeDistantLightNode, self).__init__()
-    self.name_ = "feDistantLight"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feDistantLight"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feDropShadow}
 class SvgFeDropShadowNode(Node):
-  def __init__(self):
-    super(SvgFeDropShadowNode, self).__init__()
-    self.name_ = "feDropShadow"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feDropShadow"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feFlood}
 class SvgFeFloodNode(Node):
-  def __init__(self):
-    super(SvgFeFloodNode, self).__init__()
-    self.name_ = "feFlood"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feFlood"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feFuncA}
 class SvgFeFuncANode(Node):
-  def __init__(self):
-    super(SvgFeFuncANode, self).__init__()
-    self.name_ = "feFuncA"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feFuncA"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feFuncB}
 class SvgFeFuncBNode(Node):
-  def __init__(self):
-    super(SvgFeFuncBNode, self).__init__()
-    self.name_ = "feFuncB"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feFuncB"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feFuncG}
 class SvgFeFuncGNode(Node):
-  def __init__(self):
-    super(SvgFeFuncGNode, self).__init__()
-    self.name_ = "feFuncG"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feFuncG"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feFuncR}
 class SvgFeFuncRNode(Node):
-  def __init__(self):
-    super(SvgFeFuncRNode, self).__init__()
-    self.name_ = "feFuncR"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feFuncR"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feGaussianBlur}
 class SvgFeGaussianBlurNode(Node):
-  def __init__(self):
-    super(SvgFeGaussianBlurNode, self).__init__()
-    self.name_ = "feGaussianBlur"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feGaussianBlur"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feImage}
 class SvgFeImageNode(Node):
-  def __init__(self):
-    super(SvgFeImageNode, self).__init__()
-    self.name_ = "feImage"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feImage"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feMerge}
 class SvgFeMergeNode(Node):
-  def __init__(self):
-    super(SvgFeMergeNode, self).__init__()
-    self.name_ = "feMerge"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feMerge"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feMergeNode}
 class SvgFeMergeNodeNode(Node):
-  def __init__(self):
-    super(SvgFeMergeNodeNode, self).__init__()
-    self.name_ = "feMergeNode"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feMergeNode"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feMorphology}
 class SvgFeMorphologyNode(Node):
-  def __init__(self):
-    super(SvgFeMorphologyNode, self).__init__()
-    self.name_ = "feMorphology"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feMorphology"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feOffset}
 class SvgFeOffsetNode(Node):
-  def __init__(self):
-    super(SvgFeOffsetNode, self).__init__()
-    self.name_ = "feOffset"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feOffset"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{fePointLight}
 class SvgFePointLightNode(Node):
-  def __init__(self):
-    super(SvgFePointLightNode, self).__init__()
-    self.name_ = "fePointLight"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "fePointLight"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feSpecularLighting}
 class SvgFeSpecularLightingNode(Node):
-  def __init__(self):
-    super(SvgFeSpecularLightingNode, self).__init__()
-    self.name_ = "feSpecularLighting"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feSpecularLighting"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feSpotLight}
 class SvgFeSpotLightNode(Node):
-  def __init__(self):
-    super(SvgFeSpotLightNode, self).__init__()
-    self.name_ = "feSpotLight"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feSpotLight"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feTile}
 class SvgFeTileNode(Node):
-  def __init__(self):
-    super(SvgFeTileNode, self).__init__()
-    self.name_ = "feTile"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feTile"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{feTurbulence}
 class SvgFeTurbulenceNode(Node):
-  def __init__(self):
-    super(SvgFeTurbulenceNode, self).__init__()
-    self.name_ = "feTurbulence"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "feTurbulence"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{filter}
 class SvgFilterNode(Node):
-  def __init__(self):
-    super(SvgFilterNode, self).__init__()
-    self.name_ = "filter"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "filter"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{foreignObject}
 class SvgForeignObjectNode(Node):
-  def __init__(self):
-    super(SvgForeignObjectNode, self).__init__()
-    self.name_ = "foreignObject"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "foreignObject"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{g}
 class SvgGNode(Node):
-  def __init__(self):
-    super(SvgGNode, self).__init__()
-    self.name_ = "g"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "g"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{hatch}
 class SvgHatchNode(Node):
-  def __init__(self):
-    super(SvgHatchNode, self).__init__()
-    self.name_ = "hatch"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "hatch"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{hatchpath}
 class SvgHatchpathNode(Node):
-  def __init__(self):
-    super(SvgHatchpathNode, self).__init__()
-    self.name_ = "hatchpath"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "hatchpath"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{image}
 class SvgImageNode(Node):
-  def __init__(self):
-    super(SvgImageNode, self).__init__()
-    self.name_ = "image"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "image"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{line}
 class SvgLineNode(Node):
-  def __init__(self):
-    super(SvgLineNode, self).__init__()
-    self.name_ = "line"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "line"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{linearGradient}
 class SvgLinearGradientNode(Node):
-  def __init__(self):
-    super(SvgLinearGradientNode, self).__init__()
-    self.name_ = "linearGradient"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "linearGradient"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{marker}
 class SvgMarkerNode(Node):
-  def __init__(self):
-    super(SvgMarkerNode, self).__init__()
-    self.name_ = "marker"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "marker"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{mask}
 class SvgMaskNode(Node):
-  def __init__(self):
-    super(SvgMaskNode, self).__init__()
-    self.name_ = "mask"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "mask"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{mesh}
 class SvgMeshNode(Node):
-  def __init__(self):
-    super(SvgMeshNode, self).__init__()
-    self.name_ = "mesh"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "mesh"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{meshgradient}
 class SvgMeshgradientNode(Node):
-  def __init__(self):
-    super(SvgMeshgradientNode, self).__init__()
-    self.name_ = "meshgradient"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "meshgradient"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{meshpatch}
 class SvgMeshpatchNode(Node):
-  def __init__(self):
-    super(SvgMeshpatchNode, self).__init__()
-    self.name_ = "meshpatch"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "meshpatch"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{meshrow}
 class SvgMeshrowNode(Node):
-  def __init__(self):
-    super(SvgMeshrowNode, self).__init__()
-    self.name_ = "meshrow"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "meshrow"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{metadata}
 class SvgMetadataNode(Node):
-  def __init__(self):
-    super(SvgMetadataNode, self).__init__()
-    self.name_ = "metadata"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "metadata"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{mpath}
 class SvgMpathNode(Node):
-  def __init__(self):
-    super(SvgMpathNode, self).__init__()
-    self.name_ = "mpath"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "mpath"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{path}
 class SvgPathNode(Node):
-  def __init__(self):
-    super(SvgPathNode, self).__init__()
-    self.name_ = "path"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "path"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{pattern}
 class SvgPatternNode(Node):
-  def __init__(self):
-    super(SvgPatternNode, self).__init__()
-    self.name_ = "pattern"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "pattern"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{polygon}
 class SvgPolygonNode(Node):
-  def __init__(self):
-    super(SvgPolygonNode, self).__init__()
-    self.name_ = "polygon"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "polygon"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{polyline}
 class SvgPolylineNode(Node):
-  def __init__(self):
-    super(SvgPolylineNode, self).__init__()
-    self.name_ = "polyline"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "polyline"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{radialGradient}
 class SvgRadialGradientNode(Node):
-  def __init__(self):
-    super(SvgRadialGradientNode, self).__init__()
-    self.name_ = "radialGradient"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "radialGradient"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{rect}
 class SvgRectNode(Node):
-  def __init__(self):
-    super(SvgRectNode, self).__init__()
-    self.name_ = "rect"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "rect"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{script}
 class SvgScriptNode(Node):
-  def __init__(self):
-    super(SvgScriptNode, self).__init__()
-    self.name_ = "script"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "script"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{set}
 class SvgSetNode(Node):
-  def __init__(self):
-    super(SvgSetNode, self).__init__()
-    self.name_ = "set"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "set"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{solidcolor}
 class SvgSolidcolorNode(Node):
-  def __init__(self):
-    super(SvgSolidcolorNode, self).__init__()
-    self.name_ = "solidcolor"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "solidcolor"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{stop}
 class SvgStopNode(Node):
-  def __init__(self):
-    super(SvgStopNode, self).__init__()
-    self.name_ = "stop"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "stop"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{style}
 class SvgStyleNode(Node):
-  def __init__(self):
-    super(SvgStyleNode, self).__init__()
-    self.name_ = "style"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "style"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{svg}
 class SvgSvgNode(Node):
-  def __init__(self):
-    super(SvgSvgNode, self).__init__()
-    self.name_ = "svg"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "svg"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{switch}
 class SvgSwitchNode(Node):
-  def __init__(self):
-    super(SvgSwitchNode, self).__init__()
-    self.name_ = "switch"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "switch"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{symbol}
 class SvgSymbolNode(Node):
-  def __init__(self):
-    super(SvgSymbolNode, self).__init__()
-    self.name_ = "symbol"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "symbol"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{text}
 class SvgTextNode(Node):
-  def __init__(self):
-    super(SvgTextNode, self).__init__()
-    self.name_ = "text"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "text"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{textPath}
 class SvgTextPathNode(Node):
-  def __init__(self):
-    super(SvgTextPathNode, self).__init__()
-    self.name_ = "textPath"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "textPath"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{title}
 class SvgTitleNode(Node):
-  def __init__(self):
-    super(SvgTitleNode, self).__init__()
-    self.name_ = "title"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "title"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{tspan}
 class SvgTspanNode(Node):
-  def __init__(self):
-    super(SvgTspanNode, self).__init__()
-    self.name_ = "tspan"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "tspan"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{unknown}
 class SvgUnknownNode(Node):
-  def __init__(self):
-    super(SvgUnknownNode, self).__init__()
-    self.name_ = "unknown"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "unknown"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{use}
 class SvgUseNode(Node):
-  def __init__(self):
-    super(SvgUseNode, self).__init__()
-    self.name_ = "use"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "use"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/2000/svg{view}
 class SvgViewNode(Node):
-  def __init__(self):
-    super(SvgViewNode, self).__init__()
-    self.name_ = "view"
-    self.namespace_ = "http://www.w3.org/2000/svg"
+  __slots__ = ()
+  name_ = "view"
+  namespace_ = "http://www.w3.org/2000/svg"
 
 # http://www.w3.org/1998/Math/MathML{math}
 class MathMLMathNode(Node):
-  def __init__(self):
-    super(MathMLMathNode, self).__init__()
-    self.name_ = "math"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "math"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{maction}
 class MathMLMactionNode(Node):
-  def __init__(self):
-    super(MathMLMactionNode, self).__init__()
-    self.name_ = "maction"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "maction"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{maligngroup}
 class MathMLMaligngroupNode(Node):
-  def __init__(self):
-    super(MathMLMaligngroupNode, self).__init__()
-    self.name_ = "maligngroup"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "maligngroup"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{malignmark}
 class MathMLMalignmarkNode(Node):
-  def __init__(self):
-    super(MathMLMalignmarkNode, self).__init__()
-    self.name_ = "malignmark"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "malignmark"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{menclose}
 class MathMLMencloseNode(Node):
-  def __init__(self):
-    super(MathMLMencloseNode, self).__init__()
-    self.name_ = "menclose"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "menclose"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{merror}
 class MathMLMerrorNode(Node):
-  def __init__(self):
-    super(MathMLMerrorNode, self).__init__()
-    self.name_ = "merror"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "merror"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mfenced}
 class MathMLMfencedNode(Node):
-  def __init__(self):
-    super(MathMLMfencedNode, self).__init__()
-    self.name_ = "mfenced"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mfenced"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mfrac}
 class MathMLMfracNode(Node):
-  def __init__(self):
-    super(MathMLMfracNode, self).__init__()
-    self.name_ = "mfrac"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mfrac"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mglyph}
 class MathMLMglyphNode(Node):
-  def __init__(self):
-    super(MathMLMglyphNode, self).__init__()
-    self.name_ = "mglyph"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mglyph"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mi}
 class MathMLMiNode(Node):
-  def __init__(self):
-    super(MathMLMiNode, self).__init__()
-    self.name_ = "mi"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mi"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mlabeledtr}
 class MathMLMlabeledtrNode(Node):
-  def __init__(self):
-    super(MathMLMlabeledtrNode, self).__init__()
-    self.name_ = "mlabeledtr"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mlabeledtr"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mlongdiv}
 class MathMLMlongdivNode(Node):
-  def __init__(self):
-    super(MathMLMlongdivNode, self).__init__()
-    self.name_ = "mlongdiv"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mlongdiv"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mmultiscripts}
 class MathMLMmultiscriptsNode(Node):
-  def __init__(self):
-    super(MathMLMmultiscriptsNode, self).__init__()
-    self.name_ = "mmultiscripts"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mmultiscripts"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mn}
 class MathMLMnNode(Node):
-  def __init__(self):
-    super(MathMLMnNode, self).__init__()
-    self.name_ = "mn"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mn"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mo}
 class MathMLMoNode(Node):
-  def __init__(self):
-    super(MathMLMoNode, self).__init__()
-    self.name_ = "mo"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mo"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mover}
 class MathMLMoverNode(Node):
-  def __init__(self):
-    super(MathMLMoverNode, self).__init__()
-    self.name_ = "mover"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mover"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mpadded}
 class MathMLMpaddedNode(Node):
-  def __init__(self):
-    super(MathMLMpaddedNode, self).__init__()
-    self.name_ = "mpadded"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mpadded"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mphantom}
 class MathMLMphantomNode(Node):
-  def __init__(self):
-    super(MathMLMphantomNode, self).__init__()
-    self.name_ = "mphantom"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mphantom"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mroot}
 class MathMLMrootNode(Node):
-  def __init__(self):
-    super(MathMLMrootNode, self).__init__()
-    self.name_ = "mroot"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mroot"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mrow}
 class MathMLMrowNode(Node):
-  def __init__(self):
-    super(MathMLMrowNode, self).__init__()
-    self.name_ = "mrow"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mrow"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{ms}
 class MathMLMsNode(Node):
-  def __init__(self):
-    super(MathMLMsNode, self).__init__()
-    self.name_ = "ms"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "ms"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mscarries}
 class MathMLMscarriesNode(Node):
-  def __init__(self):
-    super(MathMLMscarriesNode, self).__init__()
-    self.name_ = "mscarries"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mscarries"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mscarry}
 class MathMLMscarryNode(Node):
-  def __init__(self):
-    super(MathMLMscarryNode, self).__init__()
-    self.name_ = "mscarry"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mscarry"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msgroup}
 class MathMLMsgroupNode(Node):
-  def __init__(self):
-    super(MathMLMsgroupNode, self).__init__()
-    self.name_ = "msgroup"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msgroup"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msline}
 class MathMLMslineNode(Node):
-  def __init__(self):
-    super(MathMLMslineNode, self).__init__()
-    self.name_ = "msline"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msline"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mspace}
 class MathMLMspaceNode(Node):
-  def __init__(self):
-    super(MathMLMspaceNode, self).__init__()
-    self.name_ = "mspace"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mspace"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msqrt}
 class MathMLMsqrtNode(Node):
-  def __init__(self):
-    super(MathMLMsqrtNode, self).__init__()
-    self.name_ = "msqrt"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msqrt"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msrow}
 class MathMLMsrowNode(Node):
-  def __init__(self):
-    super(MathMLMsrowNode, self).__init__()
-    self.name_ = "msrow"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msrow"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mstack}
 class MathMLMstackNode(Node):
-  def __init__(self):
-    super(MathMLMstackNode, self).__init__()
-    self.name_ = "mstack"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mstack"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mstyle}
 class MathMLMstyleNode(Node):
-  def __init__(self):
-    super(MathMLMstyleNode, self).__init__()
-    self.name_ = "mstyle"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mstyle"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msub}
 class MathMLMsubNode(Node):
-  def __init__(self):
-    super(MathMLMsubNode, self).__init__()
-    self.name_ = "msub"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msub"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msup}
 class MathMLMsupNode(Node):
-  def __init__(self):
-    super(MathMLMsupNode, self).__init__()
-    self.name_ = "msup"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msup"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{msubsup}
 class MathMLMsubsupNode(Node):
-  def __init__(self):
-    super(MathMLMsubsupNode, self).__init__()
-    self.name_ = "msubsup"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "msubsup"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mtable}
 class MathMLMtableNode(Node):
-  def __init__(self):
-    super(MathMLMtableNode, self).__init__()
-    self.name_ = "mtable"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mtable"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mtd}
 class MathMLMtdNode(Node):
-  def __init__(self):
-    super(MathMLMtdNode, self).__init__()
-    self.name_ = "mtd"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mtd"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mtext}
 class MathMLMtextNode(Node):
-  def __init__(self):
-    super(MathMLMtextNode, self).__init__()
-    self.name_ = "mtext"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mtext"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{mtr}
 class MathMLMtrNode(Node):
-  def __init__(self):
-    super(MathMLMtrNode, self).__init__()
-    self.name_ = "mtr"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "mtr"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{munder}
 class MathMLMunderNode(Node):
-  def __init__(self):
-    super(MathMLMunderNode, self).__init__()
-    self.name_ = "munder"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "munder"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{munderover}
 class MathMLMunderoverNode(Node):
-  def __init__(self):
-    super(MathMLMunderoverNode, self).__init__()
-    self.name_ = "munderover"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "munderover"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{semantics}
 class MathMLSemanticsNode(Node):
-  def __init__(self):
-    super(MathMLSemanticsNode, self).__init__()
-    self.name_ = "semantics"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "semantics"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{annotation}
 class MathMLAnnotationNode(Node):
-  def __init__(self):
-    super(MathMLAnnotationNode, self).__init__()
-    self.name_ = "annotation"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "annotation"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/1998/Math/MathML{annotation-xml}
 class MathMLAnnotationxmlNode(Node):
-  def __init__(self):
-    super(MathMLAnnotationxmlNode, self).__init__()
-    self.name_ = "annotation-xml"
-    self.namespace_ = "http://www.w3.org/1998/Math/MathML"
+  __slots__ = ()
+  name_ = "annotation-xml"
+  namespace_ = "http://www.w3.org/1998/Math/MathML"
 
 # http://www.w3.org/2000/xmlns{XML_DECL}
 class XmlnsXML_DECLNode(Node):
-  def __init__(self):
-    super(XmlnsXML_DECLNode, self).__init__()
-    self.name_ = "XML_DECL"
-    self.namespace_ = "http://www.w3.org/2000/xmlns"
+  __slots__ = ()
+  name_ = "XML_DECL"
+  namespace_ = "http://www.w3.org/2000/xmlns"
+
+MARKUP_NODES = frozenset([
+  XhtmlAddressNode,
+  XhtmlHgroupNode,
+  XhtmlBdiNode,
+  XhtmlBdoNode,
+  XhtmlCiteNode,
+  XhtmlDataNode,
+  XhtmlDfnNode,
+  XhtmlKbdNode,
+  XhtmlMarkNode,
+  XhtmlQNode,
+  XhtmlSampNode,
+  XhtmlSmallNode,
+  XhtmlSubNode,
+  XhtmlSupNode,
+  XhtmlTimeNode,
+  XhtmlUNode,
+  XhtmlVarNode,
+  XhtmlAreaNode,
+  XhtmlPictureNode,
+  XhtmlTextareaNode,
+  XhtmlDetailsNode,
+  XhtmlSlotNode,
+  XhtmlTemplateNode,
+  XhtmlBgsoundNode,
+  XhtmlCommandNode,
+  XhtmlContentNode,
+  XhtmlElementNode,
+  XhtmlFontNode,
+  XhtmlImageNode,
+  XhtmlIsindexNode,
+  XhtmlListingNode,
+  XhtmlMarqueeNode,
+  XhtmlMulticolNode,
+  XhtmlNextidNode,
+  XhtmlNobrNode,
+  XhtmlNoembedNode,
+  XhtmlPlaintextNode,
+  XhtmlShadowNode,
+  XhtmlSpacerNode,
+  XhtmlXmpNode,
+  SvgANode,
+  SvgAnimateNode,
+  SvgAnimateMotionNode,
+  SvgAnimateTransformNode,
+  SvgCircleNode,
+  SvgClipPathNode,
+  SvgColorprofileNode,
+  SvgDefsNode,
+  SvgDescNode,
+  SvgDiscardNode,
+  SvgEllipseNode,
+  SvgFeBlendNode,
+  SvgFeColorMatrixNode,
+  SvgFeComponentTransferNode,
+  SvgFeCompositeNode,
+  SvgFeConvolveMatrixNode,
+  SvgFeDiffuseLightingNode,
+  SvgFeDisplacementMapNode,
+  SvgFeDistantLightNode,
+  SvgFeDropShadowNode,
+  SvgFeFloodNode,
+  SvgFeFuncANode,
+  SvgFeFuncBNode,
+  SvgFeFuncGNode,
+  SvgFeFuncRNode,
+  SvgFeGaussianBlurNode,
+  SvgFeImageNode,
+  SvgFeMergeNode,
+  SvgFeMergeNodeNode,
+  SvgFeMorphologyNode,
+  SvgFeOffsetNode,
+  SvgFePointLightNode,
+  SvgFeSpecularLightingNode,
+  SvgFeSpotLightNode,
+  SvgFeTileNode,
+  SvgFeTurbulenceNode,
+  SvgFilterNode,
+  SvgForeignObjectNode,
+  SvgGNode,
+  SvgHatchNode,
+  SvgHatchpathNode,
+  SvgImageNode,
+  SvgLineNode,
+  SvgLinearGradientNode,
+  SvgMarkerNode,
+  SvgMaskNode,
+  SvgMeshNode,
+  SvgMeshgradientNode,
+  SvgMeshpatchNode,
+  SvgMeshrowNode,
+  SvgMetadataNode,
+  SvgMpathNode,
+  SvgPathNode,
+  SvgPatternNode,
+  SvgPolygonNode,
+  SvgPolylineNode,
+  SvgRadialGradientNode,
+  SvgRectNode,
+  SvgScriptNode,
+  SvgSetNode,
+  SvgSolidcolorNode,
+  SvgStopNode,
+  SvgStyleNode,
+  SvgSwitchNode,
+  SvgSymbolNode,
+  SvgTextNode,
+  SvgTextPathNode,
+  SvgTitleNode,
+  SvgTspanNode,
+  SvgUnknownNode,
+  SvgUseNode,
+  SvgViewNode,
+  MathMLMactionNode,
+  MathMLMaligngroupNode,
+  MathMLMalignmarkNode,
+  MathMLMencloseNode,
+  MathMLMerrorNode,
+  MathMLMfencedNode,
+  MathMLMfracNode,
+  MathMLMglyphNode,
+  MathMLMiNode,
+  MathMLMlabeledtrNode,
+  MathMLMlongdivNode,
+  MathMLMmultiscriptsNode,
+  MathMLMnNode,
+  MathMLMoNode,
+  MathMLMoverNode,
+  MathMLMpaddedNode,
+  MathMLMphantomNode,
+  MathMLMrootNode,
+  MathMLMrowNode,
+  MathMLMsNode,
+  MathMLMscarriesNode,
+  MathMLMscarryNode,
+  MathMLMsgroupNode,
+  MathMLMslineNode,
+  MathMLMspaceNode,
+  MathMLMsqrtNode,
+  MathMLMsrowNode,
+  MathMLMstackNode,
+  MathMLMstyleNode,
+  MathMLMsubNode,
+  MathMLMsupNode,
+  MathMLMsubsupNode,
+  MathMLMtableNode,
+  MathMLMtdNode,
+  MathMLMtextNode,
+  MathMLMtrNode,
+  MathMLMunderNode,
+  MathMLMunderoverNode,
+  MathMLSemanticsNode,
+  MathMLAnnotationNode,
+  MathMLAnnotationxmlNode,
+])
+
+IGNORED_NODES = frozenset([
+  XhtmlLinkNode,
+  XhtmlMetaNode,
+  XhtmlStyleNode,
+  XhtmlAsideNode,
+  XhtmlRbNode,
+  XhtmlRpNode,
+  XhtmlRtNode,
+  XhtmlRtcNode,
+  XhtmlRubyNode,
+  XhtmlAudioNode,
+  XhtmlMapNode,
+  XhtmlTrackNode,
+  XhtmlVideoNode,
+  XhtmlEmbedNode,
+  XhtmlIframeNode,
+  XhtmlObjectNode,
+  XhtmlParamNode,
+  XhtmlSourceNode,
+  XhtmlCanvasNode,
+  XhtmlScriptNode,
+  XhtmlButtonNode,
+  XhtmlDatalistNode,
+  XhtmlFormNode,
+  XhtmlMeterNode,
+  XhtmlProgressNode,
+  XhtmlDialogNode,
+  XhtmlAppletNode,
+  XhtmlBasefontNode,
+  XhtmlBigNode,
+  XhtmlBlinkNode,
+  XhtmlCenterNode,
+  XhtmlDirNode,
+  XhtmlFrameNode,
+  XhtmlFramesetNode,
+  XhtmlKeygenNode,
+  XhtmlTtNode,
+])
 
 #[[[end]]]
 
@@ -2301,6 +2295,8 @@ def attr_breaks(tag, attributes, indent, max_line_length):
   return breaks
 
 def format_html_tag(tag, attributes, indent, indent_char, max_line_length, is_empty, text, tail, newline_char):
+  if attributes is None:
+    attributes = EMPTY_ATTRIBUTES
   breaks = attr_breaks(tag, attributes, indent, max_line_length)
   indent_str = indent_char * (len(tag) + 2)
   if tag == "Node":
@@ -2329,6 +2325,59 @@ def format_html_tag(tag, attributes, indent, indent_char, max_line_length, is_em
 
   return (tag_str, close_tag_suffix)
 
+class XmlIslandNode(Node):
+  """
+  Content of an svg or math element (an island) that the markdown only
+  serializes back to markup, kept as the parser events instead of nodes:
+  text (str), start tags ((name, attributes, tag)), comments ((None, text))
+  and end tags (None). See AstTreeBuilder(xml_islands=True).
+  """
+  __slots__ = ('events_',)
+  name_ = "XmlIsland"
+
+  def __init__(self):
+    Node.__init__(self)
+    self.events_ = []
+
+  @property
+  def events(self):
+    return self.events_
+
+  def memo_key(self):
+    return tuple(event if type(event) is not tuple or event[0] is None else
+                 (event[0], tuple(event[1].items()))
+                 for event in self.events_)
+
+  def render(self, indent, indent_char, max_line_length, newline_char):
+    """
+    Returns the markup that MarkdownVisitor writes for the same elements
+    as nodes. indent is that of the children of the island root.
+    """
+    events = self.events_
+    count = len(events)
+    data = []
+    # Close tags of the open elements
+    close_tags = []
+    for i in range(count):
+      event = events[i]
+      if event is None:
+        data.append(close_tags.pop())
+      elif type(event) is str:
+        data.append(event)
+      elif event[0] is None:
+        data.append('<!--' + event[1] + '-->')
+      else:
+        # Elements still open at the end have no more content
+        is_empty = i + 1 == count or events[i + 1] is None
+        open_tag, close_tag = format_html_tag(
+          event[0], event[1], indent + len(close_tags), indent_char,
+          max_line_length, is_empty, None, None, newline_char)
+        data.append(open_tag)
+        close_tags.append(close_tag)
+    while len(close_tags) > 0:
+      data.append(close_tags.pop())
+    return ''.join(data)
+
 def langCanonicalize(lang):
   if lang is None:
     return ''
@@ -2343,9 +2392,218 @@ def langCanonicalize(lang):
 
   return lang
 
-class MarkdownVisitor:
+class TableState:
+  """
+  Header metadata of a table being rendered. Body rows are written as they
+  are visited, so only the cells of the header are kept.
+  """
+  __slots__ = ('columns_', 'header_', 'alignment_')
+
+  def __init__(self, columns=0, header=None, alignment=None):
+    # Number of cells in the current row
+    self.columns_ = columns
+    self.header_ = [] if header is None else header
+    self.alignment_ = [] if alignment is None else alignment
+
+  def header_rows(self):
+    num_columns = self.columns_
+    header = self.header_
+    alignment = self.alignment_
+
+    num_header = len(header)
+    num_alignment = len(alignment)
+
+    # The padding is only seen by the later theads of the table
+    if (num_alignment % num_columns) != 0:
+      alignment.extend([None] * abs(num_columns - num_alignment))
+    if (num_header % num_columns) != 0:
+      header.extend([''] * abs(num_columns - num_header))
+
+    # Cells of header rows shorter or longer than the last one wrap around
+    header_cols = [''] * num_columns
+    for i in range(num_header):
+      j = i % num_columns
+      header_val = header[i]
+      if header_val is None:
+        header_val = ''
+      if header_cols[j] == '':
+        header_cols[j] = header_val
+      else:
+        header_cols[j] += '<br>' + header_val
+
+    align_cols = [''] * num_columns
+    for i in range(num_alignment):
+      if alignment[i] is not None:
+        align_cols[i % num_columns] = alignment[i]
+
+    return '|' + '|'.join(header_cols) + '|\n' + '|' + '|'.join(align_cols) + '|\n'
+
+# Line breaks of str.splitlines() other than \n and \r\n
+QUOTE_LINE_BREAKS = re.compile('[\v\f\x1c\x1d\x1e\x85\u2028\u2029]|\r(?!\n)')
+
+def quote_lines(text, indent):
+  lines = []
+  for line in text.splitlines(keepends=True):
+    if line.endswith('\n'):
+      lines.append(indent + line)
+    else:
+      lines.append(indent + line + '\n')
+  return ''.join(lines)
+
+class QuoteBuffer:
+  """
+  Data source of a blockquote. The text written to it and the buffers of
+  nested blockquotes are kept as parts, and the quote prefixes of all
+  levels are applied in one pass when the outermost blockquote is closed.
+  """
   def __init__(self):
-    self.data_ = [StringIO()]
+    self.parts_ = []
+    # Number of '>' in the prefix of each line, set when the blockquote closes
+    self.depth_ = 0
+    # False if the text has line breaks other than \n and \r\n
+    self.simple_ = True
+
+  def write(self, data):
+    if len(data) == 0:
+      return
+    self.parts_.append(data)
+    if self.simple_ and QUOTE_LINE_BREAKS.search(data) is not None:
+      self.simple_ = False
+
+  def add_quote(self, quote):
+    self.parts_.append(quote)
+    if not quote.simple_:
+      self.simple_ = False
+
+  def getvalue(self):
+    # Text written so far, without the prefix of this blockquote
+    return ''.join(part if type(part) is str else part.render() for part in self.parts_)
+
+  def render(self):
+    """
+    Returns the quoted text: every line (ending with a newline) is prefixed
+    with the '>' of each blockquote that it starts a line in.
+    """
+    if not self.simple_:
+      return self.render_nested()
+    data = []
+    # Sums of the prefix depths from this blockquote down to each nested one
+    depths = [self.depth_]
+    # First level (from this blockquote down) of the nested blockquotes
+    # that are all at the start of a line
+    start = 0
+    stack = [iter(self.parts_)]
+    while len(stack) > 0:
+      for part in stack[-1]:
+        if type(part) is not str:
+          depths.append(depths[-1] + part.depth_)
+          stack.append(iter(part.parts_))
+          break
+        level = len(depths)
+        for line in part.splitlines(keepends=True):
+          if start < level:
+            if start == 0:
+              data.append('>' * depths[-1])
+            else:
+              data.append('>' * (depths[-1] - depths[start - 1]))
+          data.append(line)
+          if line.endswith('\n'):
+            start = 0
+          else:
+            start = level
+      else:
+        stack.pop()
+        if start == len(depths):
+          # Ends the last line of the blockquote
+          data.append('\n')
+          start = 0
+        depths.pop()
+    return ''.join(data)
+
+  def render_nested(self):
+    # Quotes the text of each blockquote after its nested blockquotes, for
+    # line breaks that a blockquote can change for the enclosing ones
+    stack = [(self, iter(self.parts_), [])]
+    while True:
+      quote, parts, texts = stack[-1]
+      for part in parts:
+        if type(part) is str:
+          texts.append(part)
+        else:
+          stack.append((part, iter(part.parts_), []))
+          break
+      else:
+        stack.pop()
+        text = quote_lines(''.join(texts), '>' * quote.depth_)
+        if len(stack) == 0:
+          return text
+        stack[-1][2].append(text)
+
+def is_binary_sink(sink):
+  if isinstance(sink, TextIOBase):
+    return False
+  if isinstance(sink, (RawIOBase, BufferedIOBase)):
+    return True
+  if not hasattr(sink, 'write'):
+    # e.g. a socket
+    return True
+  mode = getattr(sink, 'mode', None)
+  return isinstance(mode, str) and 'b' in mode
+
+class SinkWriter:
+  """
+  Data source that passes the markdown on to a caller-supplied sink
+  (anything with a write() method, or a socket) instead of keeping it.
+  Text is written in blocks of about buffer_size characters and encoded
+  first if the sink takes bytes.
+  """
+  def __init__(self, sink, encoding=None, buffer_size=65536):
+    self.sink_ = sink
+    if encoding is None and is_binary_sink(sink):
+      encoding = 'utf-8'
+    self.encoding_ = encoding
+    self.buffer_ = []
+    self.buffer_chars_ = 0
+    self.buffer_size_ = buffer_size
+    self.chars_written_ = 0
+    if hasattr(sink, 'write'):
+      self.sink_write_ = sink.write
+    else:
+      self.sink_write_ = sink.sendall
+
+  def write(self, data):
+    self.buffer_.append(data)
+    self.buffer_chars_ += len(data)
+    if self.buffer_chars_ >= self.buffer_size_:
+      self.flush()
+
+  def flush(self):
+    if self.buffer_chars_ == 0:
+      return
+    data = ''.join(self.buffer_)
+    self.buffer_ = []
+    self.chars_written_ += self.buffer_chars_
+    self.buffer_chars_ = 0
+    if self.encoding_ is not None:
+      data = data.encode(self.encoding_)
+    self.sink_write_(data)
+
+  def getvalue(self):
+    # The text is not kept
+    return ''
+
+  @property
+  def chars_written(self):
+    return self.chars_written_ + self.buffer_chars_
+
+class MarkdownVisitor:
+  def __init__(self, sink=None, encoding=None):
+    # With a sink the markdown is written to it (see SinkWriter) and only
+    # look-back (th cells, blockquotes, memoized subtrees) is buffered
+    if sink is None:
+      self.data_ = [StringIO()]
+    else:
+      self.data_ = [SinkWriter(sink, encoding)]
     self.indent_ = 0
     self.indent_char_ = ' '
     self.newline_char_ = os.linesep
@@ -2358,29 +2616,68 @@ class MarkdownVisitor:
     self.base_href_ = ''
     self.list_stack_ = []
     self.table_dict_ = []
+    # StringIO buffers of closed th cells, reused for the next ones
+    self.cell_buffers_ = []
     self.thead_ = 0
     self.table_ = 0
     self.svg_ = 0
     self.math_ = 0
+    # Subtree memoization (see visit_memoized)
+    self.memoize_ = False
+    self.memoize_min_nodes_ = 4
+    self.subtree_table_ = {}
+    self.subtree_counts_ = {}
+    self.subtree_memo_ = {}
+    self.memo_hits_ = 0
+    self.memo_misses_ = 0
+    self.memo_skipped_nodes_ = 0
+    # Buffers pushed for look-back (th cells, blockquotes, memoized subtrees)
+    self.buffer_pushes_ = 0
 
   def InXmlScope(self):
     return self.svg_ > 0 or self.math_ > 0
 
   def push_data_source(self):
+    self.buffer_pushes_ += 1
     self.data_.append(StringIO())
 
   def pop_data_source(self):
     self.data_.pop()
 
+  def push_cell_buffer(self):
+    self.buffer_pushes_ += 1
+    if len(self.cell_buffers_) > 0:
+      self.data_.append(self.cell_buffers_.pop())
+    else:
+      self.data_.append(StringIO())
+
+  def pop_cell_buffer(self):
+    # Returns the text of the cell and keeps the buffer for the next cell
+    cell_buffer = self.data_.pop()
+    text = cell_buffer.getvalue()
+    cell_buffer.seek(0)
+    cell_buffer.truncate()
+    self.cell_buffers_.append(cell_buffer)
+    return text
+
   def write_data(self, data=''):
     if data is None:
       return
     self.data_[-1].write(data)
 
+  def flush_data(self):
+    # Returns the text written so far and starts a new buffer
+    if isinstance(self.data_[-1], SinkWriter):
+      self.data_[-1].flush()
+      return ''
+    text = self.data_[-1].getvalue()
+    self.data_[-1] = StringIO()
+    return text
+
   def is_header_row(self, node):
     status = True
     count = 0
-    for n in node.children:
+    for n in node.children_:
       count += 1
       if n.name != 'th':
         status = False
@@ -2492,18 +2789,15 @@ class MarkdownVisitor:
 
   def format_table_tag(self, text, tail):
     self.table_ += 1
-    table_dict = {}
-    table_dict['columns'] = 0
-    table_dict['header'] = []
-    table_dict['alignment'] = []
-
-    self.table_dict_.append(table_dict)
+    self.table_dict_.append(TableState())
     open_tag = "\n"
     close_tag = "\n"
     return (open_tag, close_tag)
 
-  def format_table_text(self, text, tail):
-    return (None, tail)
+  def format_table_text(self, text):
+    # The tail is read when the table is closed, which it may not be yet
+    # when its rows are streamed (see convert_iter)
+    return None
 
   def post_table_tag(self):
     if len(self.table_dict_) > 0:
@@ -2520,79 +2814,9 @@ class MarkdownVisitor:
     return (None, None)
 
   def preclose_thead_tag(self):
-    header_row = ""
-    alignment_row = ""
     if len(self.table_dict_) > 0:
-      header_cols = []
-      header_row = "|"
-      align_cols = []
-      alignment_row = "|"
-      table_dict = self.table_dict_[-1]
-      num_columns = table_dict['columns']
-      alignment = table_dict['alignment']
-      num_alignment = len(alignment)
-      header = table_dict['header']
-      num_header = len(header)
-
-      if (num_alignment % num_columns) != 0:
-        if num_columns > num_alignment:
-          num_missing = num_columns - num_alignment
-        else:
-          num_missing = num_alignment - num_columns
-        for i in range(num_missing):
-          alignment.append(None)
-
-      if (num_header % num_columns) != 0:
-        if num_columns > num_header:
-          num_missing = num_columns - num_header
-        else:
-          num_missing = num_header - num_columns
-        for i in range(num_missing):
-          header.append('')
-
-      for i in range(num_columns):
-        header_cols.append('')
-        align_cols.append('')
-
-      j = 0
-      for i in range(num_header):
-        if i % num_columns == 0:
-          j = 0
-        header_col = header_cols[j]
-        header_val = header[i]
-        if header_val is None:
-          header_val = ''
-        if header_col == '':
-          header_col = header_val
-        else:
-          header_col += '<br>' + header_val
-        header_cols[j] = header_col
-        j += 1
-
-      j = 0
-      for i in range(num_alignment):
-        if i % num_columns == 0:
-          j = 0
-        align_col = align_cols[j]
-        align_val = alignment[i]
-        if align_val is not None:
-          align_col = align_val
-        align_cols[j] = align_col
-        j += 1
-
-      for i in range(num_columns):
-        align_col = align_cols[i]
-        if align_col is None:
-          align_cols[i] = '---'
-
-      for i in range(num_columns):
-        header_row += header_cols[i] + '|'
-      header_row += '\n'
-
-      for i in range(num_columns):
-        alignment_row += align_cols[i] + '|'
-      alignment_row += '\n'
-    return header_row + alignment_row
+      return self.table_dict_[-1].header_rows()
+    return ""
 
   def post_thead_tag(self):
     self.thead_ -= 1
@@ -2605,9 +2829,7 @@ class MarkdownVisitor:
 
   def format_tr_tag(self, text, tail):
     if len(self.table_dict_) > 0:
-      table_dict = self.table_dict_[-1]
-      table_dict['columns'] = 0
-      self.table_dict_[-1] = table_dict
+      self.table_dict_[-1].columns_ = 0
     if self.thead_ > 0:
       open_tag = ""
     else:
@@ -2631,7 +2853,7 @@ class MarkdownVisitor:
     return header_row
 
   def format_th_tag(self, text, tail):
-    self.push_data_source()
+    self.push_cell_buffer()
 
     open_tag = ""
     if self.thead_ > 0:
@@ -2648,14 +2870,11 @@ class MarkdownVisitor:
   def preclose_th_tag(self, attr_style, attr_align, text, tail):
     if text is None:
       text = ''
-    th_text = self.text
-    self.pop_data_source()
+    th_text = self.pop_cell_buffer()
 
     if self.thead_ > 0:
       if len(self.table_dict_) > 0:
-        table_dict = self.table_dict_[-1]
-        table_dict['columns'] = table_dict['columns'] + 1
-        self.table_dict_[-1] = table_dict
+        self.table_dict_[-1].columns_ += 1
       if attr_style is None:
         attr_style = ''
       if attr_align is None:
@@ -2669,23 +2888,16 @@ class MarkdownVisitor:
       else:
         align_col = "---"
       if len(self.table_dict_) > 0:
-        table_dict = self.table_dict_[-1]
-        alignment = table_dict['alignment']
-        alignment.append(align_col)
-        header = table_dict['header']
-        header.append(text + th_text)
-        table_dict['header'] = header
-        table_dict['alignment'] = alignment
-        self.table_dict_[-1] = table_dict
+        table_state = self.table_dict_[-1]
+        table_state.alignment_.append(align_col)
+        table_state.header_.append(text + th_text)
         return None
     else:
       return th_text
 
   def format_td_text(self, attr_style, text, tail):
     if len(self.table_dict_) > 0:
-      table_dict = self.table_dict_[-1]
-      table_dict['columns'] = table_dict['columns'] + 1
-      self.table_dict_[-1] = table_dict
+      self.table_dict_[-1].columns_ += 1
     return (text, None)
 
   def format_dl_tag(self, text, tail):
@@ -2979,7 +3191,8 @@ class MarkdownVisitor:
 
   def format_blockquote_tag(self, text, tail):
     self.blockquotes_ += 1
-    self.push_data_source()
+    self.buffer_pushes_ += 1
+    self.data_.append(QuoteBuffer())
 
     open_tag = ''
     close_tag = ''
@@ -2989,19 +3202,15 @@ class MarkdownVisitor:
     return (None, None)
 
   def preclose_blockquote_tag(self):
-    blockquote_text = self.text
-    self.pop_data_source()
+    quote = self.data_.pop()
 
-    indent = ""
     if self.pre_ == 0 and self.code_ == 0:
-      if self.blockquotes_ > 0:
-        indent = self.blockquotes_ * '>'
-    lines = blockquote_text.splitlines(keepends=True)
-    for line in lines:
-      if line.endswith('\n'):
-        self.write_data(indent + line)
-      else:
-        self.write_data(indent + line + '\n')
+      quote.depth_ = self.blockquotes_
+    if isinstance(self.data_[-1], QuoteBuffer):
+      # Quoted with the enclosing blockquote
+      self.data_[-1].add_quote(quote)
+    else:
+      self.write_data(quote.render())
 
   def post_blockquote_tag(self):
     self.blockquotes_ -= 1
@@ -3052,6 +3261,38 @@ class MarkdownVisitor:
   def max_line_length(self, max_line_length):
     self.max_line_length_ = max_line_length
 
+  @property
+  def memoize(self):
+    return self.memoize_
+
+  @memoize.setter
+  def memoize(self, memoize):
+    self.memoize_ = memoize
+
+  @property
+  def memoize_min_nodes(self):
+    return self.memoize_min_nodes_
+
+  @memoize_min_nodes.setter
+  def memoize_min_nodes(self, memoize_min_nodes):
+    self.memoize_min_nodes_ = memoize_min_nodes
+
+  @property
+  def memo_hits(self):
+    return self.memo_hits_
+
+  @property
+  def memo_misses(self):
+    return self.memo_misses_
+
+  @property
+  def memo_skipped_nodes(self):
+    return self.memo_skipped_nodes_
+
+  @property
+  def buffer_pushes(self):
+    return self.buffer_pushes_
+
   @property
   def text(self):
     return self.data_[-1].getvalue()
@@ -3060,34 +3301,189 @@ class MarkdownVisitor:
   def utf8_text(self):
     return self.data_[-1].getvalue().encode('utf-8')
 
-  @v.on('node')
   def visit(self, node):
     """
-    This is the generic method that initializes the
-    dynamic dispatcher.
+    Visits node and its descendants with an explicit stack, so the depth
+    of the tree is not limited by the recursion limit.
     """
+    if self.memoize_:
+      self.visit_memoized(node)
+      return
+    visit_enter = self.visit_enter
+    visit_exit = self.visit_exit
+    state = visit_enter(node)
+    if state is None:
+      return
+    stack = [(node, state, iter(node.children_))]
+    while len(stack) > 0:
+      node, state, children = stack[-1]
+      for n in children:
+        n_state = visit_enter(n)
+        if n_state is not None:
+          stack.append((n, n_state, iter(n.children_)))
+          break
+      else:
+        stack.pop()
+        visit_exit(node, state)
+
+  def subtree_ids(self, root):
+    # Numbers the distinct subtrees under root (hash-consing) and counts
+    # how often each occurs. Returns {id(node): (subtree id, node count,
+    # contains thead)}.
+    ids = {}
+    table = self.subtree_table_
+    counts = self.subtree_counts_
+    stack = [(root, False)]
+    while len(stack) > 0:
+      node, children_done = stack.pop()
+      if not children_done:
+        stack.append((node, True))
+        for n in node.children_:
+          stack.append((n, False))
+        continue
+      size = 1
+      has_thead = type(node) is XhtmlTheadNode
+      child_ids = []
+      for n in node.children_:
+        child_id, child_size, child_thead = ids[id(n)]
+        child_ids.append(child_id)
+        size += child_size
+        has_thead = has_thead or child_thead
+      key = (type(node), node.name, node.namespace, tuple(node.attributes_.items()) if node.attributes_ else (),
+             node.text, node.tail, tuple(child_ids))
+      if type(node) is XmlIslandNode:
+        key += (node.memo_key(),)
+      subtree_id = table.get(key)
+      if subtree_id is None:
+        subtree_id = len(table)
+        table[key] = subtree_id
+      counts[subtree_id] = counts.get(subtree_id, 0) + 1
+      ids[id(node)] = (subtree_id, size, has_thead)
+    return ids
+
+  def memo_state(self, columns):
+    # State that changes the rendering of a subtree. Table column counts
+    # are only read when a thead closes, so they are left out otherwise
+    # and applied as a difference after a memo hit.
+    tables = []
+    for table_state in self.table_dict_:
+      tables.append((table_state.columns_ if columns else None,
+                     tuple(table_state.header_), tuple(table_state.alignment_)))
+    return (self.indent_, self.indent_char_, self.newline_char_, self.max_line_length_,
+            self.blockquotes_, self.blockquotes_newline, self.pre_, self.code_,
+            self.pre_language, self.base_href_, tuple(self.list_stack_), tuple(tables),
+            self.thead_, self.table_, self.svg_, self.math_)
+
+  def restore_memo_state(self, state, columns_delta):
+    (self.indent_, self.indent_char_, self.newline_char_, self.max_line_length_,
+     self.blockquotes_, self.blockquotes_newline, self.pre_, self.code_,
+     self.pre_language, self.base_href_, list_stack, tables,
+     self.thead_, self.table_, self.svg_, self.math_) = state
+    self.list_stack_ = list(list_stack)
+    table_dict_ = []
+    for i in range(len(tables)):
+      table_dict_.append(TableState(self.table_dict_[i].columns_ + columns_delta[i],
+                                    list(tables[i][1]), list(tables[i][2])))
+    self.table_dict_ = table_dict_
+
+  def table_columns(self):
+    return [table_state.columns_ for table_state in self.table_dict_]
+
+  def store_memo(self, memo_key, columns):
+    # Moves the markdown captured for a subtree to the enclosing data
+    # source and remembers it with the state after the subtree
+    text = self.text
+    self.pop_data_source()
+    self.write_data(text)
+    self.memo_misses_ += 1
+    columns_after = self.table_columns()
+    if len(columns_after) == len(columns):
+      columns_delta = tuple(columns_after[i] - columns[i] for i in range(len(columns)))
+      self.subtree_memo_[memo_key] = (text, self.memo_state(False), columns_delta)
+
+  def visit_memoized(self, node):
+    """
+    Like visit(), but reuses the markdown of an identical subtree visited
+    before in the same state instead of visiting it again.
+    """
+    ids = self.subtree_ids(node)
+    counts = self.subtree_counts_
+    memo = self.subtree_memo_
+    min_nodes = self.memoize_min_nodes_
+    visit_enter = self.visit_enter
+    visit_exit = self.visit_exit
+    state = visit_enter(node)
+    if state is None:
+      return
+    stack = [(node, state, iter(node.children_), None, None)]
+    while len(stack) > 0:
+      node, state, children, memo_key, columns = stack[-1]
+      for n in children:
+        n_key = None
+        n_columns = None
+        subtree_id, size, has_thead = ids[id(n)]
+        if size >= min_nodes and counts[subtree_id] > 1:
+          n_key = (subtree_id, self.memo_state(has_thead))
+          entry = memo.get(n_key)
+          if entry is not None:
+            text, n_state, columns_delta = entry
+            self.write_data(text)
+            self.restore_memo_state(n_state, columns_delta)
+            self.memo_hits_ += 1
+            self.memo_skipped_nodes_ += size
+            continue
+          n_columns = self.table_columns()
+          self.push_data_source()
+        n_state = visit_enter(n)
+        if n_state is not None:
+          stack.append((n, n_state, iter(n.children_), n_key, n_columns))
+          break
+        if n_key is not None:
+          self.store_memo(n_key, n_columns)
+      else:
+        stack.pop()
+        visit_exit(node, state)
+        if memo_key is not None:
+          self.store_memo(memo_key, columns)
 
-  @v.when(Node)
-  def visit(self, node):
+  @v.on('node')
+  def visit_enter(self, node):
+    """
+    Writes the output before the children of node. Returns the state
+    passed to visit_exit() or None if the children are skipped.
+    """
+
+  @v.on('node')
+  def visit_exit(self, node, state):
     """
-    Will run for nodes that do specifically match the
-    provided type.
+    Writes the output after the children of node.
     """
-    is_empty = (node.text is None) and (len(node.children) == 0)
+
+  @visit_enter.when(Node)
+  def visit_enter(self, node):
+    is_empty = (node.text is None) and (len(node.children_) == 0)
     open_tag, close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
+      node.name, node.attributes_, self.indent_, self.indent_char_[-1],
       self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     self.write_data(open_tag)
     if node.text is not None:
       self.write_data(node.text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
     self.indent_ -= 1
     self.write_data(close_tag)
     if node.tail is not None:
       self.write_data(node.tail)
 
+  @visit_enter.when(XmlIslandNode)
+  def visit_enter(self, node):
+    self.write_data(node.render(self.indent_, self.indent_char_[-1], self.max_line_length_, self.newline_char_))
+    return None
+
   '''[[[cog
   upperFirst = lambda s: s[:1].upper() + s[1:] if s else ''
   for namespace, tag, open_tag, preclose_tag, close_tag, node_text, post_tag, indent_char, attributes, actions in tags:
@@ -3122,27 +3518,38 @@ class MarkdownVisitor:
         attr_str += attr_indent + "attr_" + attr + " = node.attribute(\"" + attr + "\")\n"
         attr_indent = "  "
 
+    # Values computed before the children and used after them are passed
+    # to visit_exit() in the state tuple
+    exit_state = "close_tag"
+    exit_tail = "node_tail = node.tail"
+    if node_text.find("node_tail") != -1:
+      exit_state += ", node_tail"
+      exit_tail = ""
+    for attr in re.findall(r'attr_[A-Za-z0-9_]+', preclose_tag + " " + post_tag):
+      if (", " + attr) not in exit_state:
+        exit_state += ", " + attr
+
     if actions == "contents":
-      cog.outl("""@v.when(%s%sNode)
-  def visit(self, node):
+      cog.outl("""@visit_enter.when(%s%sNode)
+  def visit_enter(self, node):
     # Matches nodes of type %s%sNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     %s
     %s
     %s
     %s
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3150,8 +3557,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (%s,)
+
+  @visit_exit.when(%s%sNode)
+  def visit_exit(self, node, state):
+    %s, = state
+    %s
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     %s
     if node_preclose is not None:
@@ -3163,39 +3576,40 @@ class MarkdownVisitor:
       self.write_data(node_pre_tail)
     if node_tail is not None:
       self.write_data(node_tail)
-      """ % (node_ns, node_name, node_ns, node_name, attr_str, open_tag, close_tag, node_text, preclose_tag, post_tag,))
+      """ % (node_ns, node_name, node_ns, node_name, attr_str, open_tag, close_tag, node_text, exit_state, node_ns, node_name, exit_state, exit_tail, preclose_tag, post_tag,))
     elif actions == "ignore":
-      cog.outl("""@v.when(%s%sNode)
-  def visit(self, node):
+      cog.outl("""@visit_enter.when(%s%sNode)
+  def visit_enter(self, node):
     # Matches nodes of type %s%sNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       """ % (node_ns, node_name, node_ns, node_name,))
     else:
       cog.outl("""# ERROR: Uknnown action for nodes of type %sNode
       """ % (upperFirst(node_name),))
 
   ]]]'''
-  @v.when(XhtmlCommentNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCommentNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCommentNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_comment_tag(node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3203,8 +3617,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlCommentNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3217,26 +3637,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlHtmlNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlHtmlNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlHtmlNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3244,8 +3664,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlHtmlNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3258,27 +3684,27 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBaseNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBaseNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBaseNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_href = node.attribute("href")
 
     open_tag, close_tag = self.format_base_tag(attr_href)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3286,8 +3712,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBaseNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3300,26 +3732,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlHeadNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlHeadNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlHeadNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3327,8 +3759,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlHeadNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3341,44 +3779,47 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlLinkNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlLinkNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlLinkNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlMetaNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMetaNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMetaNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlStyleNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlStyleNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlStyleNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlTitleNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTitleNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTitleNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_title_tag(node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3386,8 +3827,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlTitleNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3400,26 +3847,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBodyNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBodyNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBodyNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3427,8 +3874,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBodyNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3441,26 +3894,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAddressNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAddressNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAddressNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3468,8 +3921,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlAddressNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3482,26 +3941,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlArticleNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlArticleNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlArticleNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3509,8 +3968,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlArticleNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3523,32 +3988,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAsideNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAsideNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAsideNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlFooterNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFooterNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFooterNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3556,8 +4022,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlFooterNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3570,28 +4042,28 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlHeaderNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlHeaderNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlHeaderNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """
 
   """
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3599,8 +4071,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlHeaderNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3613,26 +4091,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlH1Node)
-  def visit(self, node):
+  @visit_enter.when(XhtmlH1Node)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlH1Node
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """# """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3640,8 +4118,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlH1Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3654,26 +4138,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlH2Node)
-  def visit(self, node):
+  @visit_enter.when(XhtmlH2Node)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlH2Node
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """## """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3681,8 +4165,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlH2Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3695,26 +4185,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlH3Node)
-  def visit(self, node):
+  @visit_enter.when(XhtmlH3Node)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlH3Node
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """### """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3722,8 +4212,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlH3Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3736,26 +4232,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlH4Node)
-  def visit(self, node):
+  @visit_enter.when(XhtmlH4Node)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlH4Node
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """#### """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3763,8 +4259,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlH4Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3777,26 +4279,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlH5Node)
-  def visit(self, node):
+  @visit_enter.when(XhtmlH5Node)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlH5Node
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """##### """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3804,8 +4306,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlH5Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3818,26 +4326,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlH6Node)
-  def visit(self, node):
+  @visit_enter.when(XhtmlH6Node)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlH6Node
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """###### """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3845,8 +4353,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlH6Node)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3859,26 +4373,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlHgroupNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlHgroupNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlHgroupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3886,8 +4400,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlHgroupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3900,26 +4420,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMainNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMainNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMainNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3927,8 +4447,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMainNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3941,26 +4467,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlNavNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlNavNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlNavNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -3968,8 +4494,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlNavNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -3982,26 +4514,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSectionNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSectionNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSectionNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4009,8 +4541,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSectionNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4023,26 +4561,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBlockquoteNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBlockquoteNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBlockquoteNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_blockquote_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_blockquote_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4050,8 +4588,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlBlockquoteNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     node_preclose = self.preclose_blockquote_tag()
     if node_preclose is not None:
@@ -4064,26 +4608,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDdNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDdNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDdNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_dd_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_dd_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4091,8 +4635,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlDdNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4105,26 +4655,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDivNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDivNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDivNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_div_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_div_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4132,8 +4682,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlDivNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4146,26 +4702,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDlNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDlNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDlNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_dl_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_dl_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4173,8 +4729,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlDlNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4187,26 +4749,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDtNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDtNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDtNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_dt_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_dt_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4214,8 +4776,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlDtNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4228,26 +4796,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlFigcaptionNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFigcaptionNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFigcaptionNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4255,8 +4823,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlFigcaptionNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4269,26 +4843,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlFigureNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFigureNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFigureNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4296,8 +4870,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlFigureNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4310,28 +4890,28 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlHrNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlHrNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlHrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """
   ---
   """
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4339,8 +4919,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlHrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4353,26 +4939,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlLiNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlLiNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlLiNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_li_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_li_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4380,8 +4966,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlLiNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4394,26 +4986,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMainNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMainNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMainNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4421,8 +5013,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMainNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4435,26 +5033,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlOlNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlOlNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlOlNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_ol_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_ol_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4462,8 +5060,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlOlNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4476,26 +5080,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlPNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlPNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlPNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_p_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_p_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4503,8 +5107,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlPNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4517,28 +5127,28 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlPreNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlPreNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlPreNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_language = node.attribute("language")
     attr_class = node.attribute("class")
 
     open_tag, close_tag = self.format_pre_tag(attr_language, attr_class, node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4546,8 +5156,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlPreNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4560,26 +5176,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlUlNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlUlNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlUlNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_ul_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_ul_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4587,8 +5203,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlUlNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4601,18 +5223,12 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlANode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlANode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlANode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_text = node.attribute("text")
     attr_href = node.attribute("href")
     attr_title = node.attribute("title")
@@ -4620,10 +5236,16 @@ class MarkdownVisitor:
     open_tag, close_tag =self.format_link(attr_text, attr_href, attr_title)
     
     node_text, node_tail = self.format_link_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4631,8 +5253,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlANode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4645,27 +5273,27 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAbbrNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAbbrNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAbbrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_title = node.attribute("title")
 
     open_tag, close_tag = self.format_abbr_tag(attr_title)
     
     node_text, node_pre_tag = self.format_abbr_text(attr_title, node.text)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4673,8 +5301,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlAbbrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4687,26 +5321,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """**"""
     close_tag = """**"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4714,8 +5348,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4728,26 +5368,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBdiNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBdiNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBdiNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4755,8 +5395,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBdiNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4769,26 +5415,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBdoNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBdoNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBdoNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4796,8 +5442,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBdoNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4810,26 +5462,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBrNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBrNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_br_tag(node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4837,8 +5489,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4851,26 +5509,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlCiteNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCiteNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCiteNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4878,8 +5536,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlCiteNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4892,28 +5556,28 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlCodeNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCodeNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCodeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_lang = node.attribute("lang")
     attr_class = node.attribute("class")
 
     open_tag, close_tag = self.format_code_tag(attr_lang, attr_class, node.text)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4921,8 +5585,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlCodeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4935,26 +5605,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDataNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDataNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDataNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -4962,8 +5632,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlDataNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -4976,26 +5652,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDfnNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDfnNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDfnNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5003,8 +5679,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlDfnNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5017,26 +5699,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlEmNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlEmNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlEmNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """*"""
     close_tag = """*"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5044,8 +5726,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlEmNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5058,26 +5746,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlINode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlINode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlINode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """*"""
     close_tag = """*"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5085,8 +5773,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlINode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5099,26 +5793,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlKbdNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlKbdNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlKbdNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5126,8 +5820,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlKbdNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5140,26 +5840,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMarkNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMarkNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMarkNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5167,8 +5867,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMarkNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5181,26 +5887,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlQNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlQNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlQNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5208,8 +5914,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlQNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5222,56 +5934,61 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlRbNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlRbNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlRbNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlRpNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlRpNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlRpNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlRtNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlRtNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlRtNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlRtcNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlRtcNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlRtcNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlRubyNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlRubyNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlRubyNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlSNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """~~"""
     close_tag = """~~"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5279,8 +5996,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5293,26 +6016,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSampNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSampNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSampNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5320,8 +6043,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSampNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5334,26 +6063,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSmallNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSmallNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSmallNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5361,8 +6090,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSmallNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5375,26 +6110,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSpanNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSpanNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSpanNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5402,8 +6137,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSpanNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5416,26 +6157,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlStrongNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlStrongNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlStrongNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """**"""
     close_tag = """**"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5443,8 +6184,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlStrongNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5457,26 +6204,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSubNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSubNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSubNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5484,8 +6231,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSubNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5498,26 +6251,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSupNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSupNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5525,8 +6278,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5539,26 +6298,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTimeNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTimeNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTimeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5566,8 +6325,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlTimeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5580,26 +6345,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlUNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlUNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlUNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5607,8 +6372,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlUNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5621,26 +6392,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlVarNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlVarNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlVarNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5648,8 +6419,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlVarNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5662,26 +6439,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlWbrNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlWbrNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlWbrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """<wbr>"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5689,8 +6466,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlWbrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5703,26 +6486,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAreaNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAreaNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAreaNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5730,8 +6513,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlAreaNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5744,24 +6533,19 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAudioNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAudioNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAudioNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlImgNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlImgNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlImgNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_src = node.attribute("src")
     attr_alt = node.attribute("alt")
     attr_title = node.attribute("title")
@@ -5769,10 +6553,16 @@ class MarkdownVisitor:
     open_tag, close_tag = self.format_img_link(attr_src, attr_alt, attr_title)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5780,8 +6570,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlImgNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5794,68 +6590,75 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMapNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMapNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMapNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlTrackNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTrackNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTrackNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlVideoNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlVideoNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlVideoNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlEmbedNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlEmbedNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlEmbedNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlIframeNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlIframeNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlIframeNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlObjectNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlObjectNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlObjectNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlParamNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlParamNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlParamNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlPictureNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlPictureNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlPictureNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5863,8 +6666,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlPictureNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5877,38 +6686,40 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSourceNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSourceNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSourceNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlCanvasNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCanvasNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCanvasNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlNoscriptNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlNoscriptNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlNoscriptNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5916,8 +6727,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlNoscriptNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5930,32 +6747,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlScriptNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlScriptNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlScriptNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlDelNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDelNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDelNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """~~"""
     close_tag = """~~"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -5963,8 +6781,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlDelNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -5977,26 +6801,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlInsNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlInsNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlInsNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """++"""
     close_tag = """++"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6004,8 +6828,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlInsNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6018,27 +6848,27 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlCaptionNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCaptionNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCaptionNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = """</caption>
   """
     node_text, node_tail = self.format_caption_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6046,8 +6876,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlCaptionNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6060,26 +6896,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlColNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlColNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlColNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6087,8 +6923,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlColNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6101,26 +6943,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlColgroupNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlColgroupNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlColgroupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6128,8 +6970,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlColgroupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6142,26 +6990,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTableNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTableNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTableNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_table_tag(node.text, node.tail)
     
-    node_text, node_tail = self.format_table_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    node_text = self.format_table_text(node.text)
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6169,8 +7017,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlTableNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6183,26 +7037,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTbodyNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTbodyNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTbodyNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text, node_tail = self.format_tbody_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6210,8 +7064,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlTbodyNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6224,27 +7084,27 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTdNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTdNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTdNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_style = node.attribute("style")
 
     open_tag = """"""
     close_tag = """|"""
     node_text, node_tail = self.format_td_text(attr_style, node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6252,8 +7112,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlTdNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6266,26 +7132,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTfootNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTfootNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTfootNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text, node_tail = self.format_tfoot_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6293,8 +7159,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlTfootNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6307,28 +7179,28 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlThNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlThNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlThNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_style = node.attribute("style")
     attr_align = node.attribute("align")
 
     open_tag, close_tag = self.format_th_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_th_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6336,8 +7208,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail, attr_style, attr_align,)
+
+  @visit_exit.when(XhtmlThNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, attr_style, attr_align, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     node_preclose = self.preclose_th_tag(attr_style, attr_align, node.text, node.tail)
     if node_preclose is not None:
@@ -6350,26 +7228,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTheadNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTheadNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTheadNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_thead_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_thead_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6377,8 +7255,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlTheadNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     node_preclose = self.preclose_thead_tag()
     if node_preclose is not None:
@@ -6391,26 +7275,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTrNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTrNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_tr_tag(node.text, node.tail)
     
     node_text, node_tail = self.format_tr_text(node.text, node.tail)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6418,8 +7302,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag, node_tail,)
+
+  @visit_exit.when(XhtmlTrNode)
+  def visit_exit(self, node, state):
+    close_tag, node_tail, = state
+    
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6432,38 +7322,40 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlButtonNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlButtonNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlButtonNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlDatalistNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDatalistNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDatalistNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlFieldsetNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFieldsetNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFieldsetNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6471,8 +7363,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlFieldsetNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6485,34 +7383,35 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlFormNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFormNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFormNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlInputNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlInputNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlInputNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_type = node.attribute("type")
     attr_checked = node.attribute("checked")
 
     open_tag, close_tag = self.format_input_tag(attr_type, attr_checked, node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6520,8 +7419,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlInputNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6534,26 +7439,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlLabelNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlLabelNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlLabelNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6561,8 +7466,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlLabelNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6575,26 +7486,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlLegendNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlLegendNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlLegendNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6602,8 +7513,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlLegendNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6616,32 +7533,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMeterNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMeterNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMeterNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlOptgroupNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlOptgroupNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlOptgroupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6649,8 +7567,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlOptgroupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6663,26 +7587,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlOptionNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlOptionNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlOptionNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6690,8 +7614,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlOptionNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6704,26 +7634,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlOutputNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlOutputNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlOutputNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6731,8 +7661,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlOutputNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6745,32 +7681,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlProgressNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlProgressNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlProgressNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlSelectNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSelectNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSelectNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6778,8 +7715,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSelectNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6792,26 +7735,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTextareaNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTextareaNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTextareaNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6819,8 +7762,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlTextareaNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6833,26 +7782,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDetailsNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDetailsNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDetailsNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6860,8 +7809,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlDetailsNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6874,32 +7829,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDialogNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDialogNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDialogNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlMenuNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMenuNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMenuNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6907,8 +7863,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMenuNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6921,26 +7883,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSummaryNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSummaryNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSummaryNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6948,8 +7910,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSummaryNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -6962,26 +7930,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSlotNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSlotNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSlotNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -6989,8 +7957,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSlotNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7003,26 +7977,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTemplateNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTemplateNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTemplateNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7030,8 +8004,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlTemplateNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7044,27 +8024,27 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAcronymNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAcronymNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAcronymNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_title = node.attribute("title")
 
     open_tag, close_tag = self.format_abbr_tag(attr_title)
     
     node_text, node_pre_tag = self.format_abbr_text(attr_title, node.text)
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7072,8 +8052,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlAcronymNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7086,38 +8072,40 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlAppletNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlAppletNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlAppletNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlBasefontNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBasefontNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBasefontNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlBgsoundNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBgsoundNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBgsoundNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7125,8 +8113,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlBgsoundNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7139,44 +8133,47 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlBigNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBigNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBigNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlBlinkNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlBlinkNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlBlinkNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlCenterNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCenterNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCenterNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlCommandNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlCommandNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlCommandNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7184,8 +8181,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlCommandNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7198,26 +8201,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlContentNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlContentNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlContentNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7225,8 +8228,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlContentNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7239,32 +8248,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlDirNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlDirNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlDirNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlElementNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlElementNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlElementNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7272,8 +8282,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlElementNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7286,26 +8302,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlFontNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFontNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFontNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7313,8 +8329,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlFontNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7327,38 +8349,40 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlFrameNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFrameNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFrameNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlFramesetNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlFramesetNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlFramesetNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlImageNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlImageNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlImageNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7366,8 +8390,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlImageNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7380,26 +8410,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlIsindexNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlIsindexNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlIsindexNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7407,8 +8437,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlIsindexNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7421,32 +8457,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlKeygenNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlKeygenNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlKeygenNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlListingNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlListingNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlListingNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7454,8 +8491,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlListingNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7468,26 +8511,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMarqueeNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMarqueeNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMarqueeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7495,8 +8538,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMarqueeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7509,26 +8558,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMenuitemNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMenuitemNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMenuitemNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7536,8 +8585,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMenuitemNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7550,26 +8605,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlMulticolNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlMulticolNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlMulticolNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7577,8 +8632,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlMulticolNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7591,26 +8652,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlNextidNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlNextidNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlNextidNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7618,8 +8679,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlNextidNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7632,26 +8699,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlNobrNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlNobrNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlNobrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7659,8 +8726,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlNobrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7673,26 +8746,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlNoembedNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlNoembedNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlNoembedNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7700,8 +8773,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlNoembedNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7714,26 +8793,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlNoframesNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlNoframesNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlNoframesNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """"""
     close_tag = """"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7741,8 +8820,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlNoframesNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7755,26 +8840,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlPlaintextNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlPlaintextNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlPlaintextNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7782,8 +8867,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlPlaintextNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7796,26 +8887,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlShadowNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlShadowNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlShadowNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7823,8 +8914,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlShadowNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7837,26 +8934,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSpacerNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSpacerNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSpacerNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7864,8 +8961,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSpacerNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7878,26 +8981,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlStrikeNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlStrikeNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlStrikeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = """~~"""
     close_tag = """~~"""
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7905,8 +9008,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlStrikeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7919,32 +9028,33 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlTtNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlTtNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlTtNode
     if node.tail is not None:
       self.write_data(node.tail)
+    return None
       
-  @v.when(XhtmlXmpNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlXmpNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlXmpNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7952,8 +9062,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlXmpNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -7966,26 +9082,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XhtmlSvgNode)
-  def visit(self, node):
+  @visit_enter.when(XhtmlSvgNode)
+  def visit_enter(self, node):
     # Matches nodes of type XhtmlSvgNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_svg_tag(node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -7993,8 +9109,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XhtmlSvgNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8007,26 +9129,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgANode)
-  def visit(self, node):
+  @visit_enter.when(SvgANode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgANode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8034,8 +9156,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgANode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8048,26 +9176,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgAnimateNode)
-  def visit(self, node):
+  @visit_enter.when(SvgAnimateNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgAnimateNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8075,8 +9203,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgAnimateNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8089,26 +9223,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgAnimateMotionNode)
-  def visit(self, node):
+  @visit_enter.when(SvgAnimateMotionNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgAnimateMotionNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8116,8 +9250,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgAnimateMotionNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8130,26 +9270,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgAnimateTransformNode)
-  def visit(self, node):
+  @visit_enter.when(SvgAnimateTransformNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgAnimateTransformNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8157,8 +9297,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgAnimateTransformNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8171,26 +9317,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgCircleNode)
-  def visit(self, node):
+  @visit_enter.when(SvgCircleNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgCircleNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8198,8 +9344,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgCircleNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8212,26 +9364,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgClipPathNode)
-  def visit(self, node):
+  @visit_enter.when(SvgClipPathNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgClipPathNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8239,8 +9391,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgClipPathNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8253,26 +9411,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgColorprofileNode)
-  def visit(self, node):
+  @visit_enter.when(SvgColorprofileNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgColorprofileNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8280,8 +9438,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgColorprofileNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8294,26 +9458,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgDefsNode)
-  def visit(self, node):
+  @visit_enter.when(SvgDefsNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgDefsNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8321,8 +9485,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgDefsNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8335,26 +9505,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgDescNode)
-  def visit(self, node):
+  @visit_enter.when(SvgDescNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgDescNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8362,8 +9532,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgDescNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8376,26 +9552,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgDiscardNode)
-  def visit(self, node):
+  @visit_enter.when(SvgDiscardNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgDiscardNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8403,8 +9579,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgDiscardNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8417,26 +9599,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgEllipseNode)
-  def visit(self, node):
+  @visit_enter.when(SvgEllipseNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgEllipseNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8444,8 +9626,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgEllipseNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8458,26 +9646,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeBlendNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeBlendNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeBlendNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8485,8 +9673,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeBlendNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8499,26 +9693,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeColorMatrixNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeColorMatrixNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeColorMatrixNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8526,8 +9720,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeColorMatrixNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8540,26 +9740,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeComponentTransferNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeComponentTransferNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeComponentTransferNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8567,8 +9767,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeComponentTransferNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8581,26 +9787,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeCompositeNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeCompositeNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeCompositeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8608,8 +9814,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeCompositeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8622,26 +9834,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeConvolveMatrixNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeConvolveMatrixNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeConvolveMatrixNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8649,8 +9861,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeConvolveMatrixNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8663,26 +9881,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeDiffuseLightingNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeDiffuseLightingNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeDiffuseLightingNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8690,8 +9908,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeDiffuseLightingNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8704,26 +9928,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeDisplacementMapNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeDisplacementMapNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeDisplacementMapNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8731,8 +9955,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeDisplacementMapNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8745,26 +9975,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeDistantLightNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeDistantLightNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeDistantLightNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8772,8 +10002,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeDistantLightNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8786,26 +10022,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeDropShadowNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeDropShadowNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeDropShadowNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8813,8 +10049,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeDropShadowNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8827,26 +10069,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeFloodNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeFloodNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeFloodNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8854,8 +10096,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeFloodNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8868,26 +10116,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeFuncANode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeFuncANode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeFuncANode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8895,8 +10143,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeFuncANode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8909,26 +10163,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeFuncBNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeFuncBNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeFuncBNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8936,8 +10190,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeFuncBNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8950,26 +10210,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeFuncGNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeFuncGNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeFuncGNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -8977,8 +10237,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeFuncGNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -8991,26 +10257,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeFuncRNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeFuncRNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeFuncRNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9018,8 +10284,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeFuncRNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9032,26 +10304,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeGaussianBlurNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeGaussianBlurNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeGaussianBlurNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9059,8 +10331,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeGaussianBlurNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9073,26 +10351,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeImageNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeImageNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeImageNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9100,8 +10378,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeImageNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9114,26 +10398,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeMergeNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeMergeNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeMergeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9141,8 +10425,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeMergeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9155,26 +10445,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeMergeNodeNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeMergeNodeNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeMergeNodeNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9182,8 +10472,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeMergeNodeNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9196,26 +10492,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeMorphologyNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeMorphologyNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeMorphologyNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9223,8 +10519,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeMorphologyNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9237,26 +10539,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeOffsetNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeOffsetNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeOffsetNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9264,8 +10566,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeOffsetNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9278,26 +10586,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFePointLightNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFePointLightNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFePointLightNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9305,8 +10613,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFePointLightNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9319,26 +10633,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeSpecularLightingNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeSpecularLightingNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeSpecularLightingNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9346,8 +10660,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeSpecularLightingNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9360,26 +10680,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeSpotLightNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeSpotLightNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeSpotLightNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9387,8 +10707,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeSpotLightNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9401,26 +10727,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeTileNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeTileNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeTileNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9428,8 +10754,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeTileNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9442,26 +10774,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFeTurbulenceNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFeTurbulenceNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFeTurbulenceNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9469,8 +10801,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFeTurbulenceNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9483,26 +10821,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgFilterNode)
-  def visit(self, node):
+  @visit_enter.when(SvgFilterNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgFilterNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9510,8 +10848,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgFilterNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9524,26 +10868,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgForeignObjectNode)
-  def visit(self, node):
+  @visit_enter.when(SvgForeignObjectNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgForeignObjectNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9551,8 +10895,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgForeignObjectNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9565,26 +10915,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgGNode)
-  def visit(self, node):
+  @visit_enter.when(SvgGNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgGNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9592,8 +10942,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgGNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9606,26 +10962,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgHatchNode)
-  def visit(self, node):
+  @visit_enter.when(SvgHatchNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgHatchNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9633,8 +10989,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgHatchNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9647,26 +11009,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgHatchpathNode)
-  def visit(self, node):
+  @visit_enter.when(SvgHatchpathNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgHatchpathNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9674,8 +11036,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgHatchpathNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9688,26 +11056,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgImageNode)
-  def visit(self, node):
+  @visit_enter.when(SvgImageNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgImageNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9715,8 +11083,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgImageNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9729,26 +11103,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgLineNode)
-  def visit(self, node):
+  @visit_enter.when(SvgLineNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgLineNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9756,8 +11130,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgLineNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9770,26 +11150,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgLinearGradientNode)
-  def visit(self, node):
+  @visit_enter.when(SvgLinearGradientNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgLinearGradientNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9797,8 +11177,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgLinearGradientNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9811,26 +11197,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMarkerNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMarkerNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMarkerNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9838,8 +11224,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMarkerNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9852,26 +11244,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMaskNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMaskNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMaskNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9879,8 +11271,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMaskNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9893,26 +11291,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMeshNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMeshNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMeshNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9920,8 +11318,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMeshNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9934,26 +11338,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMeshgradientNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMeshgradientNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMeshgradientNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -9961,8 +11365,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMeshgradientNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -9975,26 +11385,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMeshpatchNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMeshpatchNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMeshpatchNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10002,8 +11412,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMeshpatchNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10016,26 +11432,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMeshrowNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMeshrowNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMeshrowNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10043,8 +11459,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMeshrowNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10057,26 +11479,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMetadataNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMetadataNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMetadataNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10084,8 +11506,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMetadataNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10098,26 +11526,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgMpathNode)
-  def visit(self, node):
+  @visit_enter.when(SvgMpathNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgMpathNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10125,8 +11553,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgMpathNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10139,26 +11573,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgPathNode)
-  def visit(self, node):
+  @visit_enter.when(SvgPathNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgPathNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10166,8 +11600,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgPathNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10180,26 +11620,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgPatternNode)
-  def visit(self, node):
+  @visit_enter.when(SvgPatternNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgPatternNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10207,8 +11647,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgPatternNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10221,26 +11667,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgPolygonNode)
-  def visit(self, node):
+  @visit_enter.when(SvgPolygonNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgPolygonNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10248,8 +11694,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgPolygonNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10262,26 +11714,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgPolylineNode)
-  def visit(self, node):
+  @visit_enter.when(SvgPolylineNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgPolylineNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10289,8 +11741,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgPolylineNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10303,26 +11761,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgRadialGradientNode)
-  def visit(self, node):
+  @visit_enter.when(SvgRadialGradientNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgRadialGradientNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10330,8 +11788,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgRadialGradientNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10344,26 +11808,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgRectNode)
-  def visit(self, node):
+  @visit_enter.when(SvgRectNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgRectNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10371,8 +11835,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgRectNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10385,26 +11855,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgScriptNode)
-  def visit(self, node):
+  @visit_enter.when(SvgScriptNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgScriptNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10412,8 +11882,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgScriptNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10426,26 +11902,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgSetNode)
-  def visit(self, node):
+  @visit_enter.when(SvgSetNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgSetNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10453,8 +11929,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgSetNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10467,26 +11949,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgSolidcolorNode)
-  def visit(self, node):
+  @visit_enter.when(SvgSolidcolorNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgSolidcolorNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10494,8 +11976,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgSolidcolorNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10508,26 +11996,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgStopNode)
-  def visit(self, node):
+  @visit_enter.when(SvgStopNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgStopNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10535,8 +12023,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgStopNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10549,26 +12043,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgStyleNode)
-  def visit(self, node):
+  @visit_enter.when(SvgStyleNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgStyleNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10576,8 +12070,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgStyleNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10590,26 +12090,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgSvgNode)
-  def visit(self, node):
+  @visit_enter.when(SvgSvgNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgSvgNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_svg_tag(node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10617,8 +12117,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgSvgNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10631,26 +12137,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgSwitchNode)
-  def visit(self, node):
+  @visit_enter.when(SvgSwitchNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgSwitchNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10658,8 +12164,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgSwitchNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10672,26 +12184,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgSymbolNode)
-  def visit(self, node):
+  @visit_enter.when(SvgSymbolNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgSymbolNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10699,8 +12211,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgSymbolNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10713,26 +12231,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgTextNode)
-  def visit(self, node):
+  @visit_enter.when(SvgTextNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgTextNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10740,8 +12258,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgTextNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10754,26 +12278,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgTextPathNode)
-  def visit(self, node):
+  @visit_enter.when(SvgTextPathNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgTextPathNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10781,8 +12305,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgTextPathNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10795,26 +12325,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgTitleNode)
-  def visit(self, node):
+  @visit_enter.when(SvgTitleNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgTitleNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10822,8 +12352,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgTitleNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10836,26 +12372,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgTspanNode)
-  def visit(self, node):
+  @visit_enter.when(SvgTspanNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgTspanNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10863,8 +12399,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgTspanNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10877,26 +12419,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgUnknownNode)
-  def visit(self, node):
+  @visit_enter.when(SvgUnknownNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgUnknownNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10904,8 +12446,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgUnknownNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10918,26 +12466,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgUseNode)
-  def visit(self, node):
+  @visit_enter.when(SvgUseNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgUseNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10945,8 +12493,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgUseNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -10959,26 +12513,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(SvgViewNode)
-  def visit(self, node):
+  @visit_enter.when(SvgViewNode)
+  def visit_enter(self, node):
     # Matches nodes of type SvgViewNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -10986,8 +12540,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(SvgViewNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11000,26 +12560,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMathNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMathNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMathNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag, close_tag = self.format_math_tag(node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11027,8 +12587,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMathNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11041,26 +12607,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMactionNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMactionNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMactionNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11068,8 +12634,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMactionNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11082,26 +12654,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMaligngroupNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMaligngroupNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMaligngroupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11109,8 +12681,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMaligngroupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11123,26 +12701,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMalignmarkNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMalignmarkNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMalignmarkNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11150,8 +12728,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMalignmarkNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11164,26 +12748,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMencloseNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMencloseNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMencloseNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11191,8 +12775,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMencloseNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11205,26 +12795,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMerrorNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMerrorNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMerrorNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11232,8 +12822,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMerrorNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11246,26 +12842,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMfencedNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMfencedNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMfencedNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11273,8 +12869,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMfencedNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11287,26 +12889,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMfracNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMfracNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMfracNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11314,8 +12916,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMfracNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11328,26 +12936,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMglyphNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMglyphNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMglyphNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11355,8 +12963,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMglyphNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11369,26 +12983,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMiNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMiNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMiNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11396,8 +13010,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMiNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11410,26 +13030,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMlabeledtrNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMlabeledtrNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMlabeledtrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11437,8 +13057,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMlabeledtrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11451,26 +13077,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMlongdivNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMlongdivNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMlongdivNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11478,8 +13104,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMlongdivNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11492,26 +13124,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMmultiscriptsNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMmultiscriptsNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMmultiscriptsNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11519,8 +13151,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMmultiscriptsNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11533,26 +13171,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMnNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMnNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMnNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11560,8 +13198,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMnNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11574,26 +13218,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMoNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMoNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMoNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11601,8 +13245,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMoNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11615,26 +13265,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMoverNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMoverNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMoverNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11642,8 +13292,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMoverNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11656,26 +13312,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMpaddedNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMpaddedNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMpaddedNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11683,8 +13339,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMpaddedNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11697,26 +13359,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMphantomNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMphantomNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMphantomNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11724,8 +13386,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMphantomNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11738,26 +13406,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMrootNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMrootNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMrootNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11765,8 +13433,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMrootNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11779,26 +13453,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMrowNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMrowNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMrowNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11806,8 +13480,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMrowNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11820,26 +13500,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11847,8 +13527,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11861,26 +13547,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMscarriesNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMscarriesNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMscarriesNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11888,8 +13574,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMscarriesNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11902,26 +13594,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMscarryNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMscarryNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMscarryNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11929,8 +13621,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMscarryNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11943,26 +13641,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsgroupNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsgroupNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsgroupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -11970,8 +13668,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsgroupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -11984,26 +13688,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMslineNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMslineNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMslineNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12011,8 +13715,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMslineNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12025,26 +13735,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMspaceNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMspaceNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMspaceNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12052,8 +13762,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMspaceNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12066,26 +13782,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsqrtNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsqrtNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsqrtNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12093,8 +13809,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsqrtNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12107,26 +13829,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsrowNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsrowNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsrowNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12134,8 +13856,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsrowNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12148,26 +13876,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMstackNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMstackNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMstackNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12175,8 +13903,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMstackNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12189,26 +13923,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMstyleNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMstyleNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMstyleNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12216,8 +13950,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMstyleNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12230,26 +13970,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsubNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsubNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsubNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12257,8 +13997,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsubNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12271,26 +14017,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsupNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsupNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12298,8 +14044,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12312,26 +14064,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMsubsupNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMsubsupNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMsubsupNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12339,8 +14091,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMsubsupNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12353,26 +14111,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMtableNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMtableNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMtableNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12380,8 +14138,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMtableNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12394,26 +14158,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMtdNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMtdNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMtdNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12421,8 +14185,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMtdNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12435,26 +14205,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMtextNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMtextNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMtextNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12462,8 +14232,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMtextNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12476,26 +14252,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMtrNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMtrNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMtrNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12503,8 +14279,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMtrNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12517,26 +14299,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMunderNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMunderNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMunderNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12544,8 +14326,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMunderNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12558,26 +14346,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLMunderoverNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLMunderoverNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLMunderoverNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12585,8 +14373,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLMunderoverNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12599,26 +14393,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLSemanticsNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLSemanticsNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLSemanticsNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12626,8 +14420,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLSemanticsNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12640,26 +14440,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLAnnotationNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLAnnotationNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLAnnotationNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12667,8 +14467,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLAnnotationNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12681,26 +14487,26 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(MathMLAnnotationxmlNode)
-  def visit(self, node):
+  @visit_enter.when(MathMLAnnotationxmlNode)
+  def visit_enter(self, node):
     # Matches nodes of type MathMLAnnotationxmlNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     
     open_tag = None
     close_tag = None
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12708,8 +14514,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(MathMLAnnotationxmlNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
@@ -12722,18 +14534,12 @@ class MarkdownVisitor:
     if node_tail is not None:
       self.write_data(node_tail)
       
-  @v.when(XmlnsXML_DECLNode)
-  def visit(self, node):
+  @visit_enter.when(XmlnsXML_DECLNode)
+  def visit_enter(self, node):
     # Matches nodes of type XmlnsXML_DECLNode
-    is_empty = (node.text is None) and (len(node.children) == 0)
-    html_open_tag, html_close_tag = format_html_tag(
-      node.name, node.attributes, self.indent_, self.indent_char_[-1],
-      self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
     node_text = node.text
     node_tail = node.tail
     node_pre_tag  = None
-    node_pre_tail = None
-    node_preclose = None
     attr_version = node.attribute("version")
     attr_encoding = node.attribute("encoding")
     attr_standalone = node.attribute("standalone")
@@ -12741,10 +14547,16 @@ class MarkdownVisitor:
     open_tag, close_tag = self.format_XML_DECL_tag(attr_version, attr_encoding, attr_standalone, node.text, node.tail)
     
     node_text = node.text
-    if open_tag is None:
-      open_tag = html_open_tag
-    if close_tag is None:
-      close_tag = html_close_tag
+    if open_tag is None or close_tag is None:
+      # Render the HTML tag only for a missing markdown mapping
+      is_empty = (node.text is None) and (len(node.children_) == 0)
+      html_open_tag, html_close_tag = format_html_tag(
+        node.name, node.attributes_, self.indent_, self.indent_char_[-1],
+        self.max_line_length_, is_empty, node.text, node.tail, self.newline_char_)
+      if open_tag is None:
+        open_tag = html_open_tag
+      if close_tag is None:
+        close_tag = html_close_tag
     if node_pre_tag is not None:
       self.write_data(node_pre_tag)
     if len(open_tag) > 0:
@@ -12752,8 +14564,14 @@ class MarkdownVisitor:
     if node_text is not None:
       self.write_data(node_text)
     self.indent_ += 1
-    for n in node.children:
-      self.visit(n)
+    return (close_tag,)
+
+  @visit_exit.when(XmlnsXML_DECLNode)
+  def visit_exit(self, node, state):
+    close_tag, = state
+    node_tail = node.tail
+    node_pre_tail = None
+    node_preclose = None
     self.indent_ -= 1
     
     if node_preclose is not None:
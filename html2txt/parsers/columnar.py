@@ -0,0 +1,461 @@
+from array import array
+from collections import OrderedDict
+
+from . import ast
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Nodes whose visit_enter() does not depend on their children. Their
+# children can be rendered one at a time (see convert_iter() and
+# ColumnarTree.accept()).
+STREAM_CONTAINERS = (
+  ast.XhtmlHtmlNode,
+  ast.XhtmlBodyNode,
+  ast.XhtmlMainNode,
+  ast.XhtmlArticleNode,
+  ast.XhtmlSectionNode,
+  # Rows of a table are rendered as soon as they are complete
+  ast.XhtmlTableNode,
+  ast.XhtmlTheadNode,
+  ast.XhtmlTbodyNode,
+  ast.XhtmlTfootNode,
+)
+
+# Kind of the nodes that are not part of the tree (pruned subtrees and the
+# content of skipped elements)
+DETACHED = -1
+
+class ColumnarTree:
+  """
+  Document tree stored as parallel arrays of integers instead of one
+  ast.Node per element. Nodes are ids numbered in document order, with
+  the root at 0. Strings (text, tails, attribute keys and values) are
+  indexes into a table of interned strings, -1 for None.
+  """
+  def __init__(self):
+    # (class, name, namespace) of each kind of node
+    self.kinds_ = []
+    self.kind_ids_ = {}
+    self.strings_ = []
+    self.string_ids_ = {}
+    self.kind_ = array('i')
+    self.parent_ = array('i')
+    self.first_child_ = array('i')
+    self.last_child_ = array('i')
+    self.next_sibling_ = array('i')
+    self.text_ = array('i')
+    self.tail_ = array('i')
+    self.attribute_start_ = array('i')
+    self.attribute_count_ = array('i')
+    # Key and value string ids of the attributes of all nodes
+    self.attributes_ = array('i')
+    # Source spans of the nodes (-1 if unknown), allocated by the first
+    # set_source_span()
+    self.span_start_ = None
+    self.span_end_ = None
+
+  def kind_id(self, cls, name=None, namespace=None):
+    if name is None:
+      name = cls.name_
+      namespace = cls.namespace_
+    key = (cls, name, namespace)
+    kind = self.kind_ids_.get(key)
+    if kind is None:
+      kind = len(self.kinds_)
+      self.kinds_.append(key)
+      self.kind_ids_[key] = kind
+    return kind
+
+  def string_id(self, s):
+    if s is None:
+      return -1
+    sid = self.string_ids_.get(s)
+    if sid is None:
+      sid = len(self.strings_)
+      self.strings_.append(s)
+      self.string_ids_[s] = sid
+    return sid
+
+  def string(self, sid):
+    if sid < 0:
+      return None
+    return self.strings_[sid]
+
+  def add_node(self, kind, parent, attributes=None):
+    i = len(self.kind_)
+    self.kind_.append(kind)
+    self.parent_.append(parent)
+    self.first_child_.append(-1)
+    self.last_child_.append(-1)
+    self.next_sibling_.append(-1)
+    self.text_.append(-1)
+    self.tail_.append(-1)
+    self.attribute_start_.append(len(self.attributes_))
+    count = 0
+    if attributes is not None:
+      for key, value in attributes.items():
+        self.attributes_.append(self.string_id(key))
+        self.attributes_.append(self.string_id(value))
+        count += 1
+    self.attribute_count_.append(count)
+    if parent >= 0 and kind != DETACHED:
+      last = self.last_child_[parent]
+      if last < 0:
+        self.first_child_[parent] = i
+      else:
+        self.next_sibling_[last] = i
+      self.last_child_[parent] = i
+    return i
+
+  def __len__(self):
+    return len(self.kind_)
+
+  @property
+  def root(self):
+    return 0
+
+  def node_class(self, i):
+    return self.kinds_[self.kind_[i]][0]
+
+  def name(self, i):
+    return self.kinds_[self.kind_[i]][1]
+
+  def namespace(self, i):
+    return self.kinds_[self.kind_[i]][2]
+
+  def tag(self, i):
+    cls, name, namespace = self.kinds_[self.kind_[i]]
+    if namespace is None:
+      return name
+    return "{" + namespace + "}" + name
+
+  def text(self, i):
+    return self.string(self.text_[i])
+
+  def tail(self, i):
+    return self.string(self.tail_[i])
+
+  def attributes(self, i):
+    attributes = OrderedDict()
+    start = self.attribute_start_[i]
+    for j in range(start, start + 2 * self.attribute_count_[i], 2):
+      attributes[self.strings_[self.attributes_[j]]] = self.string(self.attributes_[j + 1])
+    return attributes
+
+  def source_span(self, i):
+    # (start, end) character offsets of i in the parsed input, or None
+    if self.span_start_ is None or i >= len(self.span_start_) or self.span_start_[i] < 0:
+      return None
+    return (self.span_start_[i], self.span_end_[i])
+
+  def set_source_span(self, i, start, end):
+    if self.span_start_ is None:
+      self.span_start_ = array('q')
+      self.span_end_ = array('q')
+    count = len(self.kind_) - len(self.span_start_)
+    if count > 0:
+      self.span_start_.extend([-1] * count)
+      self.span_end_.extend([-1] * count)
+    self.span_start_[i] = start
+    self.span_end_[i] = end
+
+  def parent(self, i):
+    return self.parent_[i]
+
+  def children(self, i):
+    children = []
+    child = self.first_child_[i]
+    while child >= 0:
+      children.append(child)
+      child = self.next_sibling_[child]
+    return children
+
+  def subtree_end(self, i):
+    # Subtrees are contiguous ranges of ids, so the subtree of i ends at
+    # the next sibling of i or of its nearest ancestor that has one
+    n = i
+    while n >= 0:
+      if self.next_sibling_[n] >= 0:
+        return self.next_sibling_[n]
+      n = self.parent_[n]
+    return len(self.kind_)
+
+  def kinds_of(self, cls):
+    return set(kind for kind in range(len(self.kinds_)) if issubclass(self.kinds_[kind][0], cls))
+
+  def count(self, cls=None):
+    """
+    Returns the number of nodes of the tree (including the root) that are
+    instances of cls, or of all nodes if cls is None.
+    """
+    if cls is None:
+      return len(self.kind_) - self.kind_.count(DETACHED)
+    kinds = self.kinds_of(cls)
+    if len(kinds) == 1:
+      return self.kind_.count(kinds.pop())
+    return sum(1 for kind in self.kind_ if kind in kinds)
+
+  def find(self, cls):
+    """
+    Returns the ids of the nodes that are instances of cls in document
+    order.
+    """
+    kinds = self.kinds_of(cls)
+    return [i for i, kind in enumerate(self.kind_) if kind in kinds]
+
+  def prune(self, cls):
+    """
+    Removes the subtrees of the nodes that are instances of cls (with their
+    tails, like removing them from an ast.Node tree). Returns the number of
+    nodes removed.
+    """
+    kinds = self.kinds_of(cls)
+    removed = 0
+    parents = set()
+    kind_ = self.kind_
+    i = 1
+    count = len(kind_)
+    while i < count:
+      if kind_[i] in kinds:
+        end = self.subtree_end(i)
+        parents.add(self.parent_[i])
+        for j in range(i, end):
+          if kind_[j] != DETACHED:
+            kind_[j] = DETACHED
+            removed += 1
+        i = end
+      else:
+        i += 1
+    # Unlinks the removed children
+    for parent in parents:
+      last = -1
+      child = self.first_child_[parent]
+      self.first_child_[parent] = -1
+      while child >= 0:
+        next_sibling = self.next_sibling_[child]
+        if kind_[child] != DETACHED:
+          if last < 0:
+            self.first_child_[parent] = child
+          else:
+            self.next_sibling_[last] = child
+          last = child
+        child = next_sibling
+      if last >= 0:
+        self.next_sibling_[last] = -1
+      self.last_child_[parent] = last
+    return removed
+
+  def create_node(self, i):
+    # Returns an ast.Node for i without its children
+    cls, name, namespace = self.kinds_[self.kind_[i]]
+    node = cls()
+    if cls is ast.Node and i > 0:
+      node.name = name
+      node.namespace = namespace
+    node.text = self.string(self.text_[i])
+    node.tail = self.string(self.tail_[i])
+    start = self.attribute_start_[i]
+    for j in range(start, start + 2 * self.attribute_count_[i], 2):
+      node.set_attribute(self.strings_[self.attributes_[j]], self.string(self.attributes_[j + 1]))
+    if self.span_start_ is not None:
+      span = self.source_span(i)
+      if span is not None:
+        node.set_source_span(span[0], span[1])
+    return node
+
+  def materialize(self, i=0):
+    """
+    Returns the ast.Node tree of the subtree of i.
+    """
+    root = self.create_node(i)
+    stack = [(i, root)]
+    while len(stack) > 0:
+      i, node = stack.pop()
+      child = self.first_child_[i]
+      while child >= 0:
+        astchild = self.create_node(child)
+        node.add_child(astchild)
+        stack.append((child, astchild))
+        child = self.next_sibling_[child]
+    return root
+
+  def accept(self, visitor):
+    """
+    Renders the tree with visitor (e.g. a MarkdownVisitor). Stream
+    containers are entered without their children, and every other child
+    is materialized and visited on its own, so only one subtree at a time
+    exists as ast.Node objects.
+    """
+    root = self.create_node(0)
+    state = visitor.visit_enter(root)
+    if state is None:
+      return
+    stack = [(root, state, self.first_child_[0])]
+    while len(stack) > 0:
+      node, state, child = stack[-1]
+      while child >= 0:
+        next_sibling = self.next_sibling_[child]
+        if self.kinds_[self.kind_[child]][0] in STREAM_CONTAINERS:
+          astchild = self.create_node(child)
+          astchild.parent = node
+          child_state = visitor.visit_enter(astchild)
+          if child_state is not None:
+            stack[-1] = (node, state, next_sibling)
+            stack.append((astchild, child_state, self.first_child_[child]))
+            break
+        else:
+          astchild = self.materialize(child)
+          astchild.parent = node
+          visitor.visit(astchild)
+        child = next_sibling
+      else:
+        stack.pop()
+        visitor.visit_exit(node, state)
+
+class ColumnarTreeBuilder:
+  """
+  Tree builder for ETreeHTMLParser that fills a ColumnarTree. The
+  materialized tree is the same as the one built by AstTreeBuilder.
+  """
+  def __init__(self, node_classes, attribute_key=None):
+    self.tree_ = ColumnarTree()
+    self.openElements = []
+    # Last element (attached or not) under each open element, used to
+    # place text in the tail of the previous sibling like ElementTree
+    self.last_child_ = []
+    self.node_classes_ = node_classes
+    self.attribute_key_ = attribute_key
+    self.node_kinds_ = {}
+    # Text added to the text (or tail, if pending_tail_) of pending_node_
+    # since the last string was interned. It is interned once, when
+    # another node gets text or an element or comment is inserted.
+    self.pending_node_ = -1
+    self.pending_tail_ = False
+    self.pending_text_ = []
+
+  def insertRoot(self, token):
+    self.pending_node_ = -1
+    self.pending_text_ = []
+    self.tree_ = ColumnarTree()
+    root = self.tree_.add_node(self.tree_.kind_id(ast.Node), -1)
+    self.openElements = [root]
+    self.last_child_ = [-1]
+
+  def getFragment(self):
+    # Like html5lib, fails if the root was popped by unbalanced end tags
+    self.openElements[0]
+    self.flush_text()
+    return self.tree_
+
+  def sync_open_elements(self):
+    # ETreeHTMLParser pops openElements directly
+    del self.last_child_[len(self.openElements):]
+
+  def node_kind(self, tag):
+    kind = self.node_kinds_.get(tag)
+    if kind is None:
+      cls = self.node_classes_.get(tag)
+      if cls is not None:
+        kind = self.tree_.kind_id(cls)
+      else:
+        kind = self.tree_.kind_id(ast.Node, tag.split('}')[-1], tag.split('}')[-2][1:])
+      self.node_kinds_[tag] = kind
+    return kind
+
+  def insertElementNormal(self, token):
+    name = token["name"]
+    namespace = token.get("namespace", ast.XhtmlHtmlNode.namespace_)
+    if namespace is None:
+      tag = name
+    else:
+      tag = "{%s}%s" % (namespace, name)
+    self.sync_open_elements()
+    self.flush_text()
+    tree = self.tree_
+    parent = self.openElements[-1]
+    if tree.kind_[parent] == DETACHED:
+      kind = DETACHED
+    elif len(self.openElements) == 1 and tag not in self.node_classes_:
+      # parse_tree skips unknown elements at the top level
+      kind = DETACHED
+    else:
+      kind = self.node_kind(tag)
+    attributes = OrderedDict()
+    attribute_key = self.attribute_key_
+    for key, value in token["data"].items():
+      if attribute_key is not None:
+        key = attribute_key(key)
+      attributes[key] = value
+    element = tree.add_node(kind, parent, attributes)
+    self.last_child_[-1] = element
+    self.openElements.append(element)
+    self.last_child_.append(-1)
+    return element
+
+  def insertComment(self, token, parent=None):
+    self.sync_open_elements()
+    self.flush_text()
+    tree = self.tree_
+    parent = self.openElements[-1]
+    kind = DETACHED
+    if tree.kind_[parent] != DETACHED:
+      kind = self.node_kind('{http://www.w3.org/1999/xhtml}comment')
+    element = tree.add_node(kind, parent)
+    tree.text_[element] = tree.string_id(token["data"])
+    self.last_child_[-1] = element
+    return element
+
+  def set_source_span(self, element, start, end):
+    self.tree_.set_source_span(element, start, end)
+
+  def insertText(self, data, parent=None):
+    self.sync_open_elements()
+    last_child = self.last_child_[-1]
+    if last_child >= 0:
+      node = last_child
+      tail = True
+    elif len(self.openElements) > 1:
+      node = self.openElements[-1]
+      tail = False
+    else:
+      return
+    if node != self.pending_node_ or tail != self.pending_tail_:
+      self.flush_text()
+      self.pending_node_ = node
+      self.pending_tail_ = tail
+    self.pending_text_.append(data)
+
+  def flush_text(self):
+    # Interns the pending text, appended to the text or tail of the node
+    if self.pending_node_ < 0:
+      return
+    tree = self.tree_
+    node = self.pending_node_
+    strings = tree.tail_ if self.pending_tail_ else tree.text_
+    text = tree.string(strings[node]) or ""
+    strings[node] = tree.string_id(text + "".join(self.pending_text_))
+    self.pending_node_ = -1
+    self.pending_text_ = []
@@ -7,6 +7,7 @@ import html
 from html.parser import HTMLParser
 from xml.etree import ElementTree
 
+from array import array
 from collections import OrderedDict
 
 from html5lib.treebuilders import getTreeBuilder
@@ -39,6 +40,94 @@ def escape_attribute_characters(s):
     result += c
   return result
 
+# Start tags are tokenized directly when they are well-formed XML (quoted
+# attribute values, unique XML names, no characters that expat rejects).
+# Anything else is handed to XmlFragmentParser so that attribute names,
+# namespaces and parse errors stay exactly as expat reports them.
+_XML_NAME = r'[A-Za-z_][A-Za-z0-9_.\-]*(?::[A-Za-z_][A-Za-z0-9_.\-]*)?'
+_XML_SPACE = r'[ \t\r\n]'
+
+_STARTTAG_RE = re.compile(
+  r'<(' + _XML_NAME + r')((?:' + _XML_SPACE + r'+' + _XML_NAME + _XML_SPACE + r'*=' +
+  _XML_SPACE + r'*(?:"[^"]*"|\'[^\']*\'))*)' + _XML_SPACE + r'*/?>\Z')
+
+_ATTRIBUTE_RE = re.compile(
+  _XML_SPACE + r'+(' + _XML_NAME + r')' + _XML_SPACE + r'*=' + _XML_SPACE +
+  r'*(?:"([^"]*)"|\'([^\']*)\')')
+
+_XML_INVALID_CHAR_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+_XML_FRAGMENT_NAMESPACES = {
+  "html": "http://www.w3.org/1999/xhtml",
+  "mathml": "http://www.w3.org/1998/Math/MathML",
+  "svg": "http://www.w3.org/2000/svg",
+  "xlink": "http://www.w3.org/1999/xlink",
+  "namespace": "http://www.w3.org/XML/1998/namespace",
+  "xmlns": "http://www.w3.org/2000/xmlns/"
+}
+
+# HTML elements that never have content or an end tag
+VOID_ELEMENTS = frozenset([
+  'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'embed', 'frame', 'hr',
+  'img', 'input', 'keygen', 'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+
+def parse_starttag(starttag_text):
+  """
+  Return (tag, attributes) for starttag_text as XmlFragmentParser would
+  produce them, or None if the start tag needs the XML parser.
+  """
+  match = _STARTTAG_RE.match(starttag_text)
+  if match is None:
+    return None
+  if _XML_INVALID_CHAR_RE.search(starttag_text) is not None:
+    return None
+  name = match.group(1)
+  if name == 'svg':
+    default_namespace = "http://www.w3.org/2000/svg"
+  elif name == 'math':
+    default_namespace = "http://www.w3.org/1998/Math/MathML"
+  elif name == 'html':
+    default_namespace = "http://www.w3.org/1999/xhtml"
+  else:
+    default_namespace = "http://www.w3.org/2000/xmlns/"
+
+  attribs = {}
+  names = set()
+  namespace_map = {}
+  namespace = None
+  for attr in _ATTRIBUTE_RE.finditer(match.group(2)):
+    attr_name = attr.group(1)
+    if attr_name in names or attr_name.startswith('xmlns_'):
+      return None
+    names.add(attr_name)
+    attr_val = attr.group(2)
+    if attr_val is None:
+      attr_val = attr.group(3)
+    # Attribute-value normalization (XML 1.0 section 3.3.3)
+    attr_val = attr_val.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ').replace('\t', ' ')
+    if attr_name == 'xmlns':
+      namespace = attr_val
+      prefix = namespace.split('/')[-1].lower()
+      if prefix == 'xhtml':
+        prefix = 'html'
+      namespace_map[namespace] = prefix
+    if attr_name.find(':') != -1:
+      ns_prefix, attrib_name = attr_name.split(':')
+      ns_uri = namespace_map.get(ns_prefix)
+      if ns_uri is None:
+        ns_uri = _XML_FRAGMENT_NAMESPACES.get(ns_prefix)
+      if ns_uri is not None:
+        if ns_uri != default_namespace:
+          attr_name = '{' + ns_uri + '}' + attrib_name
+        else:
+          attr_name = attrib_name
+    attribs[attr_name] = attr_val
+
+  if namespace is not None:
+    name = '{' + namespace + '}' + name
+  return (name, attribs)
+
 def merge_dicts(*dict_args):
   """
   Given any number of dicts, shallow copy and merge into a new dict,
@@ -75,10 +164,13 @@ def merge_dicts(*dict_args):
 # SOFTWARE.
 
 class ETreeHTMLParser(HTMLParser):
-  def __init__(self, namespaceHTMLElements=True):
+  def __init__(self, namespaceHTMLElements=True, tree=None, track_offsets=False, prune_tags=None):
     super(ETreeHTMLParser, self).__init__()
-    tree = getTreeBuilder("etree")
-    self.tree = tree(namespaceHTMLElements)
+    # tree can be any object with the html5lib treebuilder methods used
+    # below (e.g. parsers.AstTreeBuilder builds ast.Node trees directly)
+    if tree is None:
+      tree = getTreeBuilder("etree")(namespaceHTMLElements)
+    self.tree = tree
     self.tree.insertRoot({"name": "DOCUMENT_ROOT", "data": {}})
     # Assume HTML element is the root (e.g. parsing an HTML fragment or document)
     self.default_namespace_map_ = {
@@ -97,6 +189,56 @@ class ETreeHTMLParser(HTMLParser):
     self.namespace_map_ = [dict(self.default_namespace_map_)]
     self.default_namespace_ = ["http://www.w3.org/1999/xhtml"]
     self.all_namespaces_map_ = {}
+    # Text from consecutive handle_data() calls, which may be split at
+    # feed() boundaries
+    self.pending_data_ = []
+    # With track_offsets the tree gets the source span (character offsets
+    # in the input) of each element and comment through set_source_span()
+    self.track_offsets_ = track_offsets
+    # Number of characters fed, the offset of the start of each line and
+    # the start offset of each element in tree.openElements
+    self.fed_chars_ = 0
+    self.line_starts_ = array('q', [0])
+    self.span_starts_ = [0]
+    # Names of the HTML elements whose content is skipped: their start and
+    # end tags are still handled but nothing between them reaches the tree.
+    # pruned_ is the depth of the tags in the content of a pruned element
+    # plus one, or 0 outside of one.
+    self.prune_tags_ = frozenset(prune_tags or ())
+    self.pruned_ = 0
+    # Pruned void elements are closed at their start tag. Without pruning
+    # they stay open, so the whitespace up to the next tag is their content
+    # and an end tag that would pop the root closes one of them instead.
+    self.void_tail_ = False
+    self.closed_voids_ = 0
+
+  def feed(self, data):
+    if self.track_offsets_:
+      line_starts = self.line_starts_
+      i = data.find('\n')
+      while i >= 0:
+        line_starts.append(self.fed_chars_ + i + 1)
+        i = data.find('\n', i + 1)
+      self.fed_chars_ += len(data)
+    super(ETreeHTMLParser, self).feed(data)
+
+  def source_offset(self):
+    # Character offset in the input of the token being handled
+    lineno, offset = self.getpos()
+    return self.line_starts_[lineno - 1] + offset
+
+  def rawdata_offset(self, offset):
+    # Index of offset in rawdata, which holds the input not yet parsed
+    return offset - (self.fed_chars_ - len(self.rawdata))
+
+  def end_span(self, element, end=None):
+    # Sets the span of an element closed by the token being handled
+    start = self.span_starts_.pop()
+    if end is None:
+      # The end tag ends at the first '>' like in HTMLParser.parse_endtag()
+      offset = self.source_offset()
+      end = self.rawdata.find('>', self.rawdata_offset(offset) + 1) + 1 - self.rawdata_offset(0)
+    self.tree.set_source_span(element, start, end)
 
   def namespace_uri_map(self):
     self.all_namespaces_map_.update(self.default_namespace_map_)
@@ -117,6 +259,11 @@ class ETreeHTMLParser(HTMLParser):
     return self.default_namespace_[-1]
 
   def getFragment(self):
+    self.flush_data()
+    if self.track_offsets_:
+      # Elements without an end tag end with the input
+      for element, start in zip(self.tree.openElements, self.span_starts_):
+        self.tree.set_source_span(element, start, self.fed_chars_)
     return self.tree.getFragment()
 
   def push_namespace(self):
@@ -168,6 +315,20 @@ class ETreeHTMLParser(HTMLParser):
     return found
 
   def handle_starttag(self, tag, attrs):
+    if self.start_element(tag, attrs) and tag in VOID_ELEMENTS:
+      # A pruned void element gets no end tag to leave the pruned content
+      self.pruned_ = 0
+      self.close_start_element()
+      self.void_tail_ = True
+      self.closed_voids_ += 1
+
+  def start_element(self, tag, attrs):
+    # Returns True when the content of the element is pruned
+    if self.pruned_ > 0:
+      if tag not in VOID_ELEMENTS:
+        self.pruned_ += 1
+      return False
+    self.flush_data()
     self.push_namespace()
     if tag == 'svg':
       self.push_default_namespace("http://www.w3.org/2000/svg")
@@ -179,25 +340,14 @@ class ETreeHTMLParser(HTMLParser):
     namespace = None
     # Parse get_starttag_text() for correct case of attribute names
     starttag_text = self.get_starttag_text()
-    if starttag_text.endswith('/>'):
-      pass
-    elif starttag_text.endswith('>'):
-      starttag_text = starttag_text[:-1] + '/>'
-    # NOTE: XML parser doesn't handle '<' inside quotes
-    #       https://www.w3.org/TR/2006/REC-xml11-20060816/
-    #       [10]   	AttValue	   ::=   	'"' ([^<&"] | Reference)* '"'
-		#	                               |  "'" ([^<&'] | Reference)* "'"
-    starttag_text = escape_attribute_characters(starttag_text)
-    parser = XmlFragmentParser(namespaceHTMLElements=False)
-    try:
-      parser.Parse(starttag_text, True)
-    except xml.parsers.expat.ExpatError as e:
-      if 'no element found' in str(e):
-        pass
-      else:
-        raise(e)
-    starttag_element = list(parser.getFragment())[0]
-    attrs = starttag_element.attrib
+    if len(attrs) == 0 and (starttag_text == '<' + tag + '>' or starttag_text == '<' + tag + '/>'):
+      # Lowercase tag without attributes (e.g. most MathML elements)
+      starttag = (tag, {})
+    else:
+      starttag = parse_starttag(starttag_text)
+      if starttag is None:
+        starttag = self.parse_starttag_xml(starttag_text)
+    starttag_tag, attrs = starttag
 
     for key in attrs.keys():
       name = key
@@ -212,19 +362,77 @@ class ETreeHTMLParser(HTMLParser):
 
     token = {}
     if namespace is not None:
-      tag = starttag_element.tag.replace('{' + namespace + '}', '')
+      tag = starttag_tag.replace('{' + namespace + '}', '')
     else:
-      tag = starttag_element.tag
+      tag = starttag_tag
     token["name"] = tag
     token["data"] = attribs
     if namespace is not None:
       token["namespace"] = namespace
     element = self.tree.insertElementNormal(token)
+    if self.track_offsets_:
+      self.span_starts_.append(self.source_offset())
+    if namespace is None and tag in self.prune_tags_:
+      self.pruned_ = 1
+      return True
+    return False
+
+  def handle_startendtag(self, tag, attrs):
+    if self.pruned_ > 0:
+      return
+    self.start_element(tag, attrs)
+    self.pruned_ = 0
+    self.close_start_element()
+
+  def close_start_element(self):
+    if self.track_offsets_:
+      # The element ends with the start tag
+      self.close_element(self.source_offset() + len(self.get_starttag_text()))
+    else:
+      self.close_element()
+
+  def parse_starttag_xml(self, starttag_text):
+    # Slow path for start tags that parse_starttag() cannot tokenize
+    if starttag_text.endswith('/>'):
+      pass
+    elif starttag_text.endswith('>'):
+      starttag_text = starttag_text[:-1] + '/>'
+    # NOTE: XML parser doesn't handle '<' inside quotes
+    #       https://www.w3.org/TR/2006/REC-xml11-20060816/
+    #       [10]   	AttValue	   ::=   	'"' ([^<&"] | Reference)* '"'
+		#	                               |  "'" ([^<&'] | Reference)* "'"
+    starttag_text = escape_attribute_characters(starttag_text)
+    parser = XmlFragmentParser(namespaceHTMLElements=False)
+    try:
+      parser.Parse(starttag_text, True)
+    except xml.parsers.expat.ExpatError as e:
+      if 'no element found' in str(e):
+        pass
+      else:
+        raise(e)
+    starttag_element = list(parser.getFragment())[0]
+    return (starttag_element.tag, starttag_element.attrib)
 
   def handle_endtag(self, tag):
+    if self.pruned_ > 0:
+      if tag in VOID_ELEMENTS:
+        return
+      self.pruned_ -= 1
+      if self.pruned_ > 0:
+        return
+    elif self.closed_voids_ > 0 and len(self.tree.openElements) == 1:
+      self.flush_data()
+      self.closed_voids_ -= 1
+      return
+    self.close_element()
+
+  def close_element(self, end=None):
+    self.flush_data()
     self.pop_namespace()
     self.pop_default_namespace()
-    self.tree.openElements.pop()
+    element = self.tree.openElements.pop()
+    if self.track_offsets_:
+      self.end_span(element, end)
 
   def handle_data(self, data):
     # svgFound = self.elementInScope('http://www.w3.org/2000/svg','svg')
@@ -232,10 +440,34 @@ class ETreeHTMLParser(HTMLParser):
     # if svgFound == True:
     #   self.tree.insertText(html.escape(data, quote=False))
     # else:
-    self.tree.insertText(escape_html(data))
+    if self.pruned_ > 0:
+      return
+    self.pending_data_.append(data)
+
+  def flush_data(self):
+    # Escaping the joined text makes the tree independent of how the
+    # input was split into feed() calls
+    if len(self.pending_data_) > 0:
+      data = ''.join(self.pending_data_)
+      self.pending_data_ = []
+      if not (self.void_tail_ and data.isspace()):
+        self.tree.insertText(escape_html(data))
+    self.void_tail_ = False
 
   def handle_comment(self, data):
-    self.tree.insertComment({"data": data})
+    if self.pruned_ > 0:
+      return
+    self.flush_data()
+    element = self.tree.insertComment({"data": data})
+    if self.track_offsets_:
+      start = self.source_offset()
+      i = self.rawdata_offset(start)
+      if self.rawdata.startswith('<!--', i):
+        end = self.rawdata.find('-->', i + 4) + 3
+      else:
+        # Bogus comment (e.g. '<!x>' or '</ x>')
+        end = self.rawdata.find('>', i + 2) + 1
+      self.tree.set_source_span(element, start, end - i + start)
 
   def handle_entityref(self, name):
     self.handle_data('&' + name + ';')
@@ -247,6 +479,9 @@ class ETreeHTMLParser(HTMLParser):
     self.handle_data('<!' + data + '>')
 
   def handle_pi(self, data):
+    if self.pruned_ > 0:
+      return
+    self.flush_data()
     parser = XmlFragmentParser(namespaceHTMLElements=False)
     try:
       parser.Parse('<?' + data + '>', True)
@@ -274,6 +509,10 @@ class ETreeHTMLParser(HTMLParser):
     token["namespace"] = "http://www.w3.org/2000/xmlns"
     element = self.tree.insertElementNormal(token)
     self.tree.openElements.pop()
+    if self.track_offsets_:
+      start = self.source_offset()
+      end = self.rawdata.find('>', self.rawdata_offset(start)) + 1 - self.rawdata_offset(0)
+      self.tree.set_source_span(element, start, end)
 
   def unknown_decl(self, data):
     self.handle_data('<![' + data + ']>')
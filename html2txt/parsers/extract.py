@@ -0,0 +1,308 @@
+import re
+
+from . import ast
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Selectors tried in order before the text density heuristic
+DEFAULT_SELECTORS = "main, [role=main], article, #content"
+
+# Simple selector: tag name, ids, classes and attribute tests
+SIMPLE_SELECTOR = re.compile(r'^([A-Za-z][\w-]*|\*)?((?:[#.][\w-]+|\[[\w:-]+(?:=(?:"[^"]*"|\'[^\']*\'|[^\]]*))?\])*)$')
+SELECTOR_PART = re.compile(r'([#.])([\w-]+)|\[([\w:-]+)(=("[^"]*"|\'[^\']*\'|[^\]]*))?\]')
+
+# Containers of the text of a page (scored by the heuristic) and elements
+# that are never the main content
+PARAGRAPH_NODES = frozenset([
+  ast.XhtmlPNode,
+  ast.XhtmlPreNode,
+  ast.XhtmlTdNode,
+  ast.XhtmlBlockquoteNode,
+])
+BOILERPLATE_NODES = frozenset([
+  ast.XhtmlNavNode,
+  ast.XhtmlHeaderNode,
+  ast.XhtmlFooterNode,
+]) | ast.IGNORED_NODES
+
+# Ids and classes of boilerplate (unless they also look like content) and
+# of content
+UNLIKELY_NAMES = re.compile(r'banner|breadcrumb|combx|comment|community|cookie|consent|disqus|extra|foot|header|menu|modal|nav|pager|pagination|popup|related|remark|rss|share|shoutbox|sidebar|skyscraper|social|sponsor|ad-break|agegate', re.IGNORECASE)
+MAYBE_NAMES = re.compile(r'and|article|body|column|main|shadow', re.IGNORECASE)
+POSITIVE_NAMES = re.compile(r'article|body|content|entry|hentry|main|page|post|text|blog|story', re.IGNORECASE)
+
+def parse_selectors(selectors):
+  """
+  Parses a comma separated list of simple selectors (e.g. 'main, div#content,
+  .post, [role=main]') into (tag, ids, classes, attributes) tuples, where
+  attributes is a list of (name, value) and value is None to only test
+  that the attribute is set.
+  """
+  result = []
+  for selector in selectors.split(','):
+    selector = selector.strip()
+    m = SIMPLE_SELECTOR.match(selector)
+    if len(selector) == 0 or m is None:
+      raise ValueError("Unsupported selector: %r" % (selector,))
+    tag = m.group(1)
+    if tag == '*':
+      tag = None
+    elif tag is not None:
+      tag = tag.lower()
+    ids = []
+    classes = []
+    attributes = []
+    for prefix, name, attribute, test, value in SELECTOR_PART.findall(m.group(2)):
+      if prefix == '#':
+        ids.append(name)
+      elif prefix == '.':
+        classes.append(name)
+      elif len(test) == 0:
+        attributes.append((attribute, None))
+      else:
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+          value = value[1:-1]
+        attributes.append((attribute, value))
+    result.append((tag, ids, classes, attributes))
+  return result
+
+def iter_nodes(root):
+  # Yields the nodes of the tree in document order
+  stack = [root]
+  while len(stack) > 0:
+    node = stack.pop()
+    yield node
+    children = node.children_
+    if len(children) > 0:
+      stack.extend(reversed(children))
+
+def has_text(root, min_chars):
+  # Returns True if the text in root has at least min_chars characters
+  # (without surrounding whitespace), stopping as soon as it does
+  chars = 0
+  stack = [root]
+  while chars < min_chars:
+    if len(stack) == 0:
+      return False
+    node = stack.pop()
+    if node is not root and node.tail_ is not None:
+      chars += len(node.tail_.strip())
+    if type(node) in ast.IGNORED_NODES or type(node) is ast.XhtmlCommentNode:
+      continue
+    if node.text_ is not None:
+      chars += len(node.text_.strip())
+    children = node.children_
+    if len(children) > 0:
+      stack.extend(reversed(children))
+  return True
+
+def matches(node, selector):
+  tag, ids, classes, attributes = selector
+  if tag is not None and node.name_ != tag:
+    return False
+  for value in ids:
+    if node.attribute('id') != value:
+      return False
+  if len(classes) > 0:
+    names = (node.attribute('class') or '').split()
+    for value in classes:
+      if value not in names:
+        return False
+  for name, value in attributes:
+    actual = node.attribute(name)
+    if actual is None or (value is not None and actual != value):
+      return False
+  return True
+
+class ContentExtractor(object):
+  """
+  Selects the subtree of an ast.Node tree with the main content of a page
+  (e.g. the article, without navigation, sidebars, banners and footers)
+  so that only it is rendered.
+
+  The selectors are tried in order: the element with the most text among
+  the matches of the first selector that has one with at least min_chars
+  characters is the content. Otherwise, with heuristic, the paragraphs of
+  the page (with at least min_chars characters) are scored by their length
+  and the score goes to their parent and half of it to their grandparent;
+  the element with the best score, less the share of its text in links, is
+  the content. Elements whose id or class looks like boilerplate are not
+  scored. If nothing is found, the whole tree is kept.
+  """
+  def __init__(self, selectors=DEFAULT_SELECTORS, heuristic=True, min_chars=25):
+    self.selectors_ = selectors
+    self.parsed_selectors_ = parse_selectors(selectors) if selectors else []
+    self.heuristic_ = heuristic
+    self.min_chars_ = min_chars
+
+  def extract(self, root):
+    """
+    Returns a new root with the content element as its only child, or root
+    if no content element was found. The content element is moved to the
+    new root without its tail.
+    """
+    node = self.find(root)
+    if node is None or node is root:
+      return root
+    content = ast.Node()
+    node.tail = None
+    content.add_child(node)
+    return content
+
+  def find(self, root):
+    # Returns the content element, or None
+    min_chars = self.min_chars_
+    if len(self.parsed_selectors_) > 0:
+      nodes = [node for node in iter_nodes(root) if type(node) not in ast.IGNORED_NODES]
+      for selector in self.parsed_selectors_:
+        found = [node for node in nodes if matches(node, selector)]
+        if len(found) == 1:
+          if has_text(found[0], min_chars):
+            return found[0]
+        elif len(found) > 1:
+          # Only the text of the matches is measured
+          best = None
+          best_chars = min_chars - 1
+          for node in found:
+            chars = self.measure(node)[0][id(node)]
+            if chars > best_chars:
+              best = node
+              best_chars = chars
+          if best is not None:
+            return best
+    if self.heuristic_:
+      text_chars, link_chars = self.measure(root)
+      return self.best_candidate(root, text_chars, link_chars)
+    return None
+
+  def measure(self, root):
+    """
+    Returns the number of characters (without surrounding whitespace) of
+    the text of each node and of the text in its links, keyed by id(node).
+    Ignored elements (e.g. script) have no text.
+    """
+    text_chars = {}
+    link_chars = {}
+    # Post-order with an explicit stack like MarkdownVisitor.visit()
+    stack = [(root, False)]
+    while len(stack) > 0:
+      node, children_done = stack.pop()
+      if not children_done:
+        stack.append((node, True))
+        for child in reversed(node.children_):
+          stack.append((child, False))
+        continue
+      if type(node) in ast.IGNORED_NODES or type(node) is ast.XhtmlCommentNode:
+        text_chars[id(node)] = 0
+        link_chars[id(node)] = 0
+        continue
+      chars = 0
+      links = 0
+      if node.text_ is not None:
+        chars = len(node.text_.strip())
+      for child in node.children_:
+        chars += text_chars[id(child)]
+        links += link_chars[id(child)]
+        if child.tail_ is not None:
+          chars += len(child.tail_.strip())
+      if type(node) is ast.XhtmlANode:
+        links = chars
+      text_chars[id(node)] = chars
+      link_chars[id(node)] = links
+    return text_chars, link_chars
+
+  def best_candidate(self, root, text_chars, link_chars):
+    min_chars = self.min_chars_
+    scores = {}
+    candidates = {}
+    stack = [(root, None, None)]
+    while len(stack) > 0:
+      node, parent, grandparent = stack.pop()
+      if type(node) in BOILERPLATE_NODES or self.unlikely(node):
+        continue
+      if type(node) in PARAGRAPH_NODES and text_chars[id(node)] >= min_chars:
+        score = 1 + min(text_chars[id(node)] // 100, 3)
+        if parent is not None:
+          scores[id(parent)] = scores.get(id(parent), 0) + score
+          candidates[id(parent)] = parent
+        if grandparent is not None:
+          scores[id(grandparent)] = scores.get(id(grandparent), 0) + score / 2
+          candidates[id(grandparent)] = grandparent
+      for child in reversed(node.children_):
+        stack.append((child, node, parent))
+    best = None
+    best_score = 0
+    for key, node in candidates.items():
+      if node is root:
+        continue
+      chars = text_chars[key]
+      link_density = link_chars[key] / chars if chars > 0 else 1
+      score = (scores[key] + self.name_weight(node)) * (1 - link_density)
+      if score > best_score:
+        best = node
+        best_score = score
+    return best
+
+  def unlikely(self, node):
+    names = self.names(node)
+    return names is not None and UNLIKELY_NAMES.search(names) is not None and MAYBE_NAMES.search(names) is None
+
+  def name_weight(self, node):
+    names = self.names(node)
+    if names is None:
+      return 0
+    weight = 0
+    if POSITIVE_NAMES.search(names) is not None:
+      weight += 25
+    if UNLIKELY_NAMES.search(names) is not None:
+      weight -= 25
+    return weight
+
+  @staticmethod
+  def names(node):
+    # id and class of node, or None
+    node_id = node.attribute('id')
+    node_class = node.attribute('class')
+    if node_id is None and node_class is None:
+      return None
+    return "%s %s" % (node_id or '', node_class or '')
+
+  @property
+  def selectors(self):
+    return self.selectors_
+
+  @property
+  def heuristic(self):
+    return self.heuristic_
+
+  @property
+  def min_chars(self):
+    return self.min_chars_
+
+  @property
+  def settings(self):
+    # Settings that change the output, for cache keys
+    return (self.selectors_, self.heuristic_, self.min_chars_)
@@ -7,11 +7,13 @@ from html2txt import parsers
 
 import html
 from html.parser import HTMLParser
+from types import MappingProxyType
 from xml.etree import ElementTree
 
 from html5lib.treebuilders import getTreeBuilder
 
 from .etreehtmlparser import ETreeHTMLParser
+from .columnar import ColumnarTreeBuilder
 
 #
 # MIT License
@@ -75,12 +77,31 @@ def whitespace_to_space(s):
 
 
 class HtmlParser:
-  def __init__(self):
+  def __init__(self, xml_islands=False, track_offsets=False, prune_ignored=False):
     self.tree_ = None
+    # Keep the content of svg and math elements as XmlIslandNode events
+    # (see AstTreeBuilder)
+    self.xml_islands_ = xml_islands
+    # Set the source span of each element and comment node (see
+    # ast.Node.source_span). Islands are not used then so that every
+    # element has a node.
+    self.track_offsets_ = track_offsets
+    # Skip the content of the elements that MarkdownVisitor ignores (e.g.
+    # script and style). Their nodes are kept for their tails.
+    self.prune_ignored_ = prune_ignored
     self.namespace_map_ = {}
+    # Reverse index of namespace_map_ ('{uri}' -> 'prefix:') and the
+    # translated attribute keys, rebuilt when namespace_map_ changes
+    self.namespace_index_map_ = None
+    self.namespace_index_size_ = 0
+    self.namespace_index_ = {}
+    self.attribute_keys_ = {}
 
     # https://nedbatchelder.com/code/cog/
     # cog -r parser.py
+    #
+    # The tag lists below generate the _parse_* methods and the
+    # NODE_CLASSES and PARSER_METHODS tables at the end of this file.
     '''[[[cog
     import cog
 
@@ -363,297 +384,40 @@ class HtmlParser:
     SVG_NS = "http://www.w3.org/2000/svg"
     MATHML_NS = "http://www.w3.org/1998/Math/MathML"
     upperFirst = lambda s: s[:1].upper() + s[1:] if s else ''
-    cog.outl("""self.parser_methods = {""")
-    for tag in xhtml_tags:
-      namespace = XHTML_NS
-      node_ns   = upperFirst(namespace.split('/')[-1])
-      node_name = upperFirst(tag.replace('-', ''))
-      cog.outl("  '{%s}%s': self._parse_%s_%s, " % (namespace, tag, node_ns, node_name,))
-    for tag in svg_tags:
-      namespace = SVG_NS
-      node_ns   = upperFirst(namespace.split('/')[-1])
-      node_name = upperFirst(tag.replace('-', ''))
-      cog.outl("  '{%s}%s': self._parse_%s_%s, " % (namespace, tag, node_ns, node_name,))
-    for tag in mathml_tags:
-      namespace = MATHML_NS
-      node_ns   = upperFirst(namespace.split('/')[-1])
-      node_name = upperFirst(tag.replace('-', ''))
-      cog.outl("  '{%s}%s': self._parse_%s_%s, " % (namespace, tag, node_ns, node_name,))
-    for tag in xml_tags:
-      namespace = XML_NS
-      node_ns   = upperFirst(namespace.split('/')[-1])
-      node_name = upperFirst(tag.replace('-', ''))
-      cog.outl("  '{%s}%s': self._parse_%s_%s, " % (namespace, tag, node_ns, node_name,))
-    cog.outl("}")
     ]]]'''
-    self.parser_methods = {
-      '{http://www.w3.org/1999/xhtml}comment': self._parse_Xhtml_Comment, 
-      '{http://www.w3.org/1999/xhtml}html': self._parse_Xhtml_Html, 
-      '{http://www.w3.org/1999/xhtml}base': self._parse_Xhtml_Base, 
-      '{http://www.w3.org/1999/xhtml}head': self._parse_Xhtml_Head, 
-      '{http://www.w3.org/1999/xhtml}link': self._parse_Xhtml_Link, 
-      '{http://www.w3.org/1999/xhtml}meta': self._parse_Xhtml_Meta, 
-      '{http://www.w3.org/1999/xhtml}style': self._parse_Xhtml_Style, 
-      '{http://www.w3.org/1999/xhtml}title': self._parse_Xhtml_Title, 
-      '{http://www.w3.org/1999/xhtml}body': self._parse_Xhtml_Body, 
-      '{http://www.w3.org/1999/xhtml}address': self._parse_Xhtml_Address, 
-      '{http://www.w3.org/1999/xhtml}article': self._parse_Xhtml_Article, 
-      '{http://www.w3.org/1999/xhtml}aside': self._parse_Xhtml_Aside, 
-      '{http://www.w3.org/1999/xhtml}footer': self._parse_Xhtml_Footer, 
-      '{http://www.w3.org/1999/xhtml}header': self._parse_Xhtml_Header, 
-      '{http://www.w3.org/1999/xhtml}h1': self._parse_Xhtml_H1, 
-      '{http://www.w3.org/1999/xhtml}h2': self._parse_Xhtml_H2, 
-      '{http://www.w3.org/1999/xhtml}h3': self._parse_Xhtml_H3, 
-      '{http://www.w3.org/1999/xhtml}h4': self._parse_Xhtml_H4, 
-      '{http://www.w3.org/1999/xhtml}h5': self._parse_Xhtml_H5, 
-      '{http://www.w3.org/1999/xhtml}h6': self._parse_Xhtml_H6, 
-      '{http://www.w3.org/1999/xhtml}hgroup': self._parse_Xhtml_Hgroup, 
-      '{http://www.w3.org/1999/xhtml}main': self._parse_Xhtml_Main, 
-      '{http://www.w3.org/1999/xhtml}nav': self._parse_Xhtml_Nav, 
-      '{http://www.w3.org/1999/xhtml}section': self._parse_Xhtml_Section, 
-      '{http://www.w3.org/1999/xhtml}blockquote': self._parse_Xhtml_Blockquote, 
-      '{http://www.w3.org/1999/xhtml}dd': self._parse_Xhtml_Dd, 
-      '{http://www.w3.org/1999/xhtml}div': self._parse_Xhtml_Div, 
-      '{http://www.w3.org/1999/xhtml}dl': self._parse_Xhtml_Dl, 
-      '{http://www.w3.org/1999/xhtml}dt': self._parse_Xhtml_Dt, 
-      '{http://www.w3.org/1999/xhtml}figcaption': self._parse_Xhtml_Figcaption, 
-      '{http://www.w3.org/1999/xhtml}figure': self._parse_Xhtml_Figure, 
-      '{http://www.w3.org/1999/xhtml}hr': self._parse_Xhtml_Hr, 
-      '{http://www.w3.org/1999/xhtml}li': self._parse_Xhtml_Li, 
-      '{http://www.w3.org/1999/xhtml}ol': self._parse_Xhtml_Ol, 
-      '{http://www.w3.org/1999/xhtml}p': self._parse_Xhtml_P, 
-      '{http://www.w3.org/1999/xhtml}pre': self._parse_Xhtml_Pre, 
-      '{http://www.w3.org/1999/xhtml}ul': self._parse_Xhtml_Ul, 
-      '{http://www.w3.org/1999/xhtml}a': self._parse_Xhtml_A, 
-      '{http://www.w3.org/1999/xhtml}abbr': self._parse_Xhtml_Abbr, 
-      '{http://www.w3.org/1999/xhtml}b': self._parse_Xhtml_B, 
-      '{http://www.w3.org/1999/xhtml}bdi': self._parse_Xhtml_Bdi, 
-      '{http://www.w3.org/1999/xhtml}bdo': self._parse_Xhtml_Bdo, 
-      '{http://www.w3.org/1999/xhtml}br': self._parse_Xhtml_Br, 
-      '{http://www.w3.org/1999/xhtml}cite': self._parse_Xhtml_Cite, 
-      '{http://www.w3.org/1999/xhtml}code': self._parse_Xhtml_Code, 
-      '{http://www.w3.org/1999/xhtml}data': self._parse_Xhtml_Data, 
-      '{http://www.w3.org/1999/xhtml}dfn': self._parse_Xhtml_Dfn, 
-      '{http://www.w3.org/1999/xhtml}em': self._parse_Xhtml_Em, 
-      '{http://www.w3.org/1999/xhtml}i': self._parse_Xhtml_I, 
-      '{http://www.w3.org/1999/xhtml}kbd': self._parse_Xhtml_Kbd, 
-      '{http://www.w3.org/1999/xhtml}mark': self._parse_Xhtml_Mark, 
-      '{http://www.w3.org/1999/xhtml}q': self._parse_Xhtml_Q, 
-      '{http://www.w3.org/1999/xhtml}rb': self._parse_Xhtml_Rb, 
-      '{http://www.w3.org/1999/xhtml}rp': self._parse_Xhtml_Rp, 
-      '{http://www.w3.org/1999/xhtml}rt': self._parse_Xhtml_Rt, 
-      '{http://www.w3.org/1999/xhtml}rtc': self._parse_Xhtml_Rtc, 
-      '{http://www.w3.org/1999/xhtml}ruby': self._parse_Xhtml_Ruby, 
-      '{http://www.w3.org/1999/xhtml}s': self._parse_Xhtml_S, 
-      '{http://www.w3.org/1999/xhtml}samp': self._parse_Xhtml_Samp, 
-      '{http://www.w3.org/1999/xhtml}small': self._parse_Xhtml_Small, 
-      '{http://www.w3.org/1999/xhtml}span': self._parse_Xhtml_Span, 
-      '{http://www.w3.org/1999/xhtml}strong': self._parse_Xhtml_Strong, 
-      '{http://www.w3.org/1999/xhtml}sub': self._parse_Xhtml_Sub, 
-      '{http://www.w3.org/1999/xhtml}sup': self._parse_Xhtml_Sup, 
-      '{http://www.w3.org/1999/xhtml}time': self._parse_Xhtml_Time, 
-      '{http://www.w3.org/1999/xhtml}u': self._parse_Xhtml_U, 
-      '{http://www.w3.org/1999/xhtml}var': self._parse_Xhtml_Var, 
-      '{http://www.w3.org/1999/xhtml}wbr': self._parse_Xhtml_Wbr, 
-      '{http://www.w3.org/1999/xhtml}area': self._parse_Xhtml_Area, 
-      '{http://www.w3.org/1999/xhtml}audio': self._parse_Xhtml_Audio, 
-      '{http://www.w3.org/1999/xhtml}img': self._parse_Xhtml_Img, 
-      '{http://www.w3.org/1999/xhtml}map': self._parse_Xhtml_Map, 
-      '{http://www.w3.org/1999/xhtml}track': self._parse_Xhtml_Track, 
-      '{http://www.w3.org/1999/xhtml}video': self._parse_Xhtml_Video, 
-      '{http://www.w3.org/1999/xhtml}embed': self._parse_Xhtml_Embed, 
-      '{http://www.w3.org/1999/xhtml}iframe': self._parse_Xhtml_Iframe, 
-      '{http://www.w3.org/1999/xhtml}object': self._parse_Xhtml_Object, 
-      '{http://www.w3.org/1999/xhtml}param': self._parse_Xhtml_Param, 
-      '{http://www.w3.org/1999/xhtml}picture': self._parse_Xhtml_Picture, 
-      '{http://www.w3.org/1999/xhtml}source': self._parse_Xhtml_Source, 
-      '{http://www.w3.org/1999/xhtml}canvas': self._parse_Xhtml_Canvas, 
-      '{http://www.w3.org/1999/xhtml}noscript': self._parse_Xhtml_Noscript, 
-      '{http://www.w3.org/1999/xhtml}script': self._parse_Xhtml_Script, 
-      '{http://www.w3.org/1999/xhtml}del': self._parse_Xhtml_Del, 
-      '{http://www.w3.org/1999/xhtml}ins': self._parse_Xhtml_Ins, 
-      '{http://www.w3.org/1999/xhtml}caption': self._parse_Xhtml_Caption, 
-      '{http://www.w3.org/1999/xhtml}col': self._parse_Xhtml_Col, 
-      '{http://www.w3.org/1999/xhtml}colgroup': self._parse_Xhtml_Colgroup, 
-      '{http://www.w3.org/1999/xhtml}table': self._parse_Xhtml_Table, 
-      '{http://www.w3.org/1999/xhtml}tbody': self._parse_Xhtml_Tbody, 
-      '{http://www.w3.org/1999/xhtml}td': self._parse_Xhtml_Td, 
-      '{http://www.w3.org/1999/xhtml}tfoot': self._parse_Xhtml_Tfoot, 
-      '{http://www.w3.org/1999/xhtml}th': self._parse_Xhtml_Th, 
-      '{http://www.w3.org/1999/xhtml}thead': self._parse_Xhtml_Thead, 
-      '{http://www.w3.org/1999/xhtml}tr': self._parse_Xhtml_Tr, 
-      '{http://www.w3.org/1999/xhtml}button': self._parse_Xhtml_Button, 
-      '{http://www.w3.org/1999/xhtml}datalist': self._parse_Xhtml_Datalist, 
-      '{http://www.w3.org/1999/xhtml}fieldset': self._parse_Xhtml_Fieldset, 
-      '{http://www.w3.org/1999/xhtml}form': self._parse_Xhtml_Form, 
-      '{http://www.w3.org/1999/xhtml}input': self._parse_Xhtml_Input, 
-      '{http://www.w3.org/1999/xhtml}label': self._parse_Xhtml_Label, 
-      '{http://www.w3.org/1999/xhtml}legend': self._parse_Xhtml_Legend, 
-      '{http://www.w3.org/1999/xhtml}meter': self._parse_Xhtml_Meter, 
-      '{http://www.w3.org/1999/xhtml}optgroup': self._parse_Xhtml_Optgroup, 
-      '{http://www.w3.org/1999/xhtml}option': self._parse_Xhtml_Option, 
-      '{http://www.w3.org/1999/xhtml}output': self._parse_Xhtml_Output, 
-      '{http://www.w3.org/1999/xhtml}progress': self._parse_Xhtml_Progress, 
-      '{http://www.w3.org/1999/xhtml}select': self._parse_Xhtml_Select, 
-      '{http://www.w3.org/1999/xhtml}textarea': self._parse_Xhtml_Textarea, 
-      '{http://www.w3.org/1999/xhtml}details': self._parse_Xhtml_Details, 
-      '{http://www.w3.org/1999/xhtml}dialog': self._parse_Xhtml_Dialog, 
-      '{http://www.w3.org/1999/xhtml}menu': self._parse_Xhtml_Menu, 
-      '{http://www.w3.org/1999/xhtml}summary': self._parse_Xhtml_Summary, 
-      '{http://www.w3.org/1999/xhtml}slot': self._parse_Xhtml_Slot, 
-      '{http://www.w3.org/1999/xhtml}template': self._parse_Xhtml_Template, 
-      '{http://www.w3.org/1999/xhtml}acronym': self._parse_Xhtml_Acronym, 
-      '{http://www.w3.org/1999/xhtml}applet': self._parse_Xhtml_Applet, 
-      '{http://www.w3.org/1999/xhtml}basefont': self._parse_Xhtml_Basefont, 
-      '{http://www.w3.org/1999/xhtml}bgsound': self._parse_Xhtml_Bgsound, 
-      '{http://www.w3.org/1999/xhtml}big': self._parse_Xhtml_Big, 
-      '{http://www.w3.org/1999/xhtml}blink': self._parse_Xhtml_Blink, 
-      '{http://www.w3.org/1999/xhtml}center': self._parse_Xhtml_Center, 
-      '{http://www.w3.org/1999/xhtml}command': self._parse_Xhtml_Command, 
-      '{http://www.w3.org/1999/xhtml}content': self._parse_Xhtml_Content, 
-      '{http://www.w3.org/1999/xhtml}dir': self._parse_Xhtml_Dir, 
-      '{http://www.w3.org/1999/xhtml}element': self._parse_Xhtml_Element, 
-      '{http://www.w3.org/1999/xhtml}font': self._parse_Xhtml_Font, 
-      '{http://www.w3.org/1999/xhtml}frame': self._parse_Xhtml_Frame, 
-      '{http://www.w3.org/1999/xhtml}frameset': self._parse_Xhtml_Frameset, 
-      '{http://www.w3.org/1999/xhtml}image': self._parse_Xhtml_Image, 
-      '{http://www.w3.org/1999/xhtml}isindex': self._parse_Xhtml_Isindex, 
-      '{http://www.w3.org/1999/xhtml}keygen': self._parse_Xhtml_Keygen, 
-      '{http://www.w3.org/1999/xhtml}listing': self._parse_Xhtml_Listing, 
-      '{http://www.w3.org/1999/xhtml}marquee': self._parse_Xhtml_Marquee, 
-      '{http://www.w3.org/1999/xhtml}menuitem': self._parse_Xhtml_Menuitem, 
-      '{http://www.w3.org/1999/xhtml}multicol': self._parse_Xhtml_Multicol, 
-      '{http://www.w3.org/1999/xhtml}nextid': self._parse_Xhtml_Nextid, 
-      '{http://www.w3.org/1999/xhtml}nobr': self._parse_Xhtml_Nobr, 
-      '{http://www.w3.org/1999/xhtml}noembed': self._parse_Xhtml_Noembed, 
-      '{http://www.w3.org/1999/xhtml}noframes': self._parse_Xhtml_Noframes, 
-      '{http://www.w3.org/1999/xhtml}plaintext': self._parse_Xhtml_Plaintext, 
-      '{http://www.w3.org/1999/xhtml}shadow': self._parse_Xhtml_Shadow, 
-      '{http://www.w3.org/1999/xhtml}spacer': self._parse_Xhtml_Spacer, 
-      '{http://www.w3.org/1999/xhtml}strike': self._parse_Xhtml_Strike, 
-      '{http://www.w3.org/1999/xhtml}tt': self._parse_Xhtml_Tt, 
-      '{http://www.w3.org/1999/xhtml}xmp': self._parse_Xhtml_Xmp, 
-      '{http://www.w3.org/1999/xhtml}svg': self._parse_Xhtml_Svg, 
-      '{http://www.w3.org/2000/svg}a': self._parse_Svg_A, 
-      '{http://www.w3.org/2000/svg}animate': self._parse_Svg_Animate, 
-      '{http://www.w3.org/2000/svg}animateMotion': self._parse_Svg_AnimateMotion, 
-      '{http://www.w3.org/2000/svg}animateTransform': self._parse_Svg_AnimateTransform, 
-      '{http://www.w3.org/2000/svg}circle': self._parse_Svg_Circle, 
-      '{http://www.w3.org/2000/svg}clipPath': self._parse_Svg_ClipPath, 
-      '{http://www.w3.org/2000/svg}color-profile': self._parse_Svg_Colorprofile, 
-      '{http://www.w3.org/2000/svg}defs': self._parse_Svg_Defs, 
-      '{http://www.w3.org/2000/svg}desc': self._parse_Svg_Desc, 
-      '{http://www.w3.org/2000/svg}discard': self._parse_Svg_Discard, 
-      '{http://www.w3.org/2000/svg}ellipse': self._parse_Svg_Ellipse, 
-      '{http://www.w3.org/2000/svg}feBlend': self._parse_Svg_FeBlend, 
-      '{http://www.w3.org/2000/svg}feColorMatrix': self._parse_Svg_FeColorMatrix, 
-      '{http://www.w3.org/2000/svg}feComponentTransfer': self._parse_Svg_FeComponentTransfer, 
-      '{http://www.w3.org/2000/svg}feComposite': self._parse_Svg_FeComposite, 
-      '{http://www.w3.org/2000/svg}feConvolveMatrix': self._parse_Svg_FeConvolveMatrix, 
-      '{http://www.w3.org/2000/svg}feDiffuseLighting': self._parse_Svg_FeDiffuseLighting, 
-      '{http://www.w3.org/2000/svg}feDisplacementMap': self._parse_Svg_FeDisplacementMap, 
-      '{http://www.w3.org/2000/svg}feDistantLight': self._parse_Svg_FeDistantLight, 
-      '{http://www.w3.org/2000/svg}feDropShadow': self._parse_Svg_FeDropShadow, 
-      '{http://www.w3.org/2000/svg}feFlood': self._parse_Svg_FeFlood, 
-      '{http://www.w3.org/2000/svg}feFuncA': self._parse_Svg_FeFuncA, 
-      '{http://www.w3.org/2000/svg}feFuncB': self._parse_Svg_FeFuncB, 
-      '{http://www.w3.org/2000/svg}feFuncG': self._parse_Svg_FeFuncG, 
-      '{http://www.w3.org/2000/svg}feFuncR': self._parse_Svg_FeFuncR, 
-      '{http://www.w3.org/2000/svg}feGaussianBlur': self._parse_Svg_FeGaussianBlur, 
-      '{http://www.w3.org/2000/svg}feImage': self._parse_Svg_FeImage, 
-      '{http://www.w3.org/2000/svg}feMerge': self._parse_Svg_FeMerge, 
-      '{http://www.w3.org/2000/svg}feMergeNode': self._parse_Svg_FeMergeNode, 
-      '{http://www.w3.org/2000/svg}feMorphology': self._parse_Svg_FeMorphology, 
-      '{http://www.w3.org/2000/svg}feOffset': self._parse_Svg_FeOffset, 
-      '{http://www.w3.org/2000/svg}fePointLight': self._parse_Svg_FePointLight, 
-      '{http://www.w3.org/2000/svg}feSpecularLighting': self._parse_Svg_FeSpecularLighting, 
-      '{http://www.w3.org/2000/svg}feSpotLight': self._parse_Svg_FeSpotLight, 
-      '{http://www.w3.org/2000/svg}feTile': self._parse_Svg_FeTile, 
-      '{http://www.w3.org/2000/svg}feTurbulence': self._parse_Svg_FeTurbulence, 
-      '{http://www.w3.org/2000/svg}filter': self._parse_Svg_Filter, 
-      '{http://www.w3.org/2000/svg}foreignObject': self._parse_Svg_ForeignObject, 
-      '{http://www.w3.org/2000/svg}g': self._parse_Svg_G, 
-      '{http://www.w3.org/2000/svg}hatch': self._parse_Svg_Hatch, 
-      '{http://www.w3.org/2000/svg}hatchpath': self._parse_Svg_Hatchpath, 
-      '{http://www.w3.org/2000/svg}image': self._parse_Svg_Image, 
-      '{http://www.w3.org/2000/svg}line': self._parse_Svg_Line, 
-      '{http://www.w3.org/2000/svg}linearGradient': self._parse_Svg_LinearGradient, 
-      '{http://www.w3.org/2000/svg}marker': self._parse_Svg_Marker, 
-      '{http://www.w3.org/2000/svg}mask': self._parse_Svg_Mask, 
-      '{http://www.w3.org/2000/svg}mesh': self._parse_Svg_Mesh, 
-      '{http://www.w3.org/2000/svg}meshgradient': self._parse_Svg_Meshgradient, 
-      '{http://www.w3.org/2000/svg}meshpatch': self._parse_Svg_Meshpatch, 
-      '{http://www.w3.org/2000/svg}meshrow': self._parse_Svg_Meshrow, 
-      '{http://www.w3.org/2000/svg}metadata': self._parse_Svg_Metadata, 
-      '{http://www.w3.org/2000/svg}mpath': self._parse_Svg_Mpath, 
-      '{http://www.w3.org/2000/svg}path': self._parse_Svg_Path, 
-      '{http://www.w3.org/2000/svg}pattern': self._parse_Svg_Pattern, 
-      '{http://www.w3.org/2000/svg}polygon': self._parse_Svg_Polygon, 
-      '{http://www.w3.org/2000/svg}polyline': self._parse_Svg_Polyline, 
-      '{http://www.w3.org/2000/svg}radialGradient': self._parse_Svg_RadialGradient, 
-      '{http://www.w3.org/2000/svg}rect': self._parse_Svg_Rect, 
-      '{http://www.w3.org/2000/svg}script': self._parse_Svg_Script, 
-      '{http://www.w3.org/2000/svg}set': self._parse_Svg_Set, 
-      '{http://www.w3.org/2000/svg}solidcolor': self._parse_Svg_Solidcolor, 
-      '{http://www.w3.org/2000/svg}stop': self._parse_Svg_Stop, 
-      '{http://www.w3.org/2000/svg}style': self._parse_Svg_Style, 
-      '{http://www.w3.org/2000/svg}svg': self._parse_Svg_Svg, 
-      '{http://www.w3.org/2000/svg}switch': self._parse_Svg_Switch, 
-      '{http://www.w3.org/2000/svg}symbol': self._parse_Svg_Symbol, 
-      '{http://www.w3.org/2000/svg}text': self._parse_Svg_Text, 
-      '{http://www.w3.org/2000/svg}textPath': self._parse_Svg_TextPath, 
-      '{http://www.w3.org/2000/svg}title': self._parse_Svg_Title, 
-      '{http://www.w3.org/2000/svg}tspan': self._parse_Svg_Tspan, 
-      '{http://www.w3.org/2000/svg}unknown': self._parse_Svg_Unknown, 
-      '{http://www.w3.org/2000/svg}use': self._parse_Svg_Use, 
-      '{http://www.w3.org/2000/svg}view': self._parse_Svg_View, 
-      '{http://www.w3.org/1998/Math/MathML}math': self._parse_MathML_Math, 
-      '{http://www.w3.org/1998/Math/MathML}maction': self._parse_MathML_Maction, 
-      '{http://www.w3.org/1998/Math/MathML}maligngroup': self._parse_MathML_Maligngroup, 
-      '{http://www.w3.org/1998/Math/MathML}malignmark': self._parse_MathML_Malignmark, 
-      '{http://www.w3.org/1998/Math/MathML}menclose': self._parse_MathML_Menclose, 
-      '{http://www.w3.org/1998/Math/MathML}merror': self._parse_MathML_Merror, 
-      '{http://www.w3.org/1998/Math/MathML}mfenced': self._parse_MathML_Mfenced, 
-      '{http://www.w3.org/1998/Math/MathML}mfrac': self._parse_MathML_Mfrac, 
-      '{http://www.w3.org/1998/Math/MathML}mglyph': self._parse_MathML_Mglyph, 
-      '{http://www.w3.org/1998/Math/MathML}mi': self._parse_MathML_Mi, 
-      '{http://www.w3.org/1998/Math/MathML}mlabeledtr': self._parse_MathML_Mlabeledtr, 
-      '{http://www.w3.org/1998/Math/MathML}mlongdiv': self._parse_MathML_Mlongdiv, 
-      '{http://www.w3.org/1998/Math/MathML}mmultiscripts': self._parse_MathML_Mmultiscripts, 
-      '{http://www.w3.org/1998/Math/MathML}mn': self._parse_MathML_Mn, 
-      '{http://www.w3.org/1998/Math/MathML}mo': self._parse_MathML_Mo, 
-      '{http://www.w3.org/1998/Math/MathML}mover': self._parse_MathML_Mover, 
-      '{http://www.w3.org/1998/Math/MathML}mpadded': self._parse_MathML_Mpadded, 
-      '{http://www.w3.org/1998/Math/MathML}mphantom': self._parse_MathML_Mphantom, 
-      '{http://www.w3.org/1998/Math/MathML}mroot': self._parse_MathML_Mroot, 
-      '{http://www.w3.org/1998/Math/MathML}mrow': self._parse_MathML_Mrow, 
-      '{http://www.w3.org/1998/Math/MathML}ms': self._parse_MathML_Ms, 
-      '{http://www.w3.org/1998/Math/MathML}mscarries': self._parse_MathML_Mscarries, 
-      '{http://www.w3.org/1998/Math/MathML}mscarry': self._parse_MathML_Mscarry, 
-      '{http://www.w3.org/1998/Math/MathML}msgroup': self._parse_MathML_Msgroup, 
-      '{http://www.w3.org/1998/Math/MathML}msline': self._parse_MathML_Msline, 
-      '{http://www.w3.org/1998/Math/MathML}mspace': self._parse_MathML_Mspace, 
-      '{http://www.w3.org/1998/Math/MathML}msqrt': self._parse_MathML_Msqrt, 
-      '{http://www.w3.org/1998/Math/MathML}msrow': self._parse_MathML_Msrow, 
-      '{http://www.w3.org/1998/Math/MathML}mstack': self._parse_MathML_Mstack, 
-      '{http://www.w3.org/1998/Math/MathML}mstyle': self._parse_MathML_Mstyle, 
-      '{http://www.w3.org/1998/Math/MathML}msub': self._parse_MathML_Msub, 
-      '{http://www.w3.org/1998/Math/MathML}msup': self._parse_MathML_Msup, 
-      '{http://www.w3.org/1998/Math/MathML}msubsup': self._parse_MathML_Msubsup, 
-      '{http://www.w3.org/1998/Math/MathML}mtable': self._parse_MathML_Mtable, 
-      '{http://www.w3.org/1998/Math/MathML}mtd': self._parse_MathML_Mtd, 
-      '{http://www.w3.org/1998/Math/MathML}mtext': self._parse_MathML_Mtext, 
-      '{http://www.w3.org/1998/Math/MathML}mtr': self._parse_MathML_Mtr, 
-      '{http://www.w3.org/1998/Math/MathML}munder': self._parse_MathML_Munder, 
-      '{http://www.w3.org/1998/Math/MathML}munderover': self._parse_MathML_Munderover, 
-      '{http://www.w3.org/1998/Math/MathML}semantics': self._parse_MathML_Semantics, 
-      '{http://www.w3.org/1998/Math/MathML}annotation': self._parse_MathML_Annotation, 
-      '{http://www.w3.org/1998/Math/MathML}annotation-xml': self._parse_MathML_Annotationxml, 
-      '{http://www.w3.org/2000/xmlns}XML_DECL': self._parse_Xmlns_XML_DECL, 
-    }
   #[[[end]]]
 
   def ns_uri_to_prefix(self, name):
+    namespace_map = self.namespace_map_
+    # namespace_map_ only grows while a document is parsed
+    if namespace_map is not self.namespace_index_map_ or len(namespace_map) != self.namespace_index_size_:
+      self.build_namespace_index()
+    prefixed_name = self.attribute_keys_.get(name)
+    if prefixed_name is None:
+      prefixed_name = self.translate_name(name)
+      self.attribute_keys_[name] = prefixed_name
+    return prefixed_name
+
+  def build_namespace_index(self):
+    namespace_index = {}
+    for key, uri in self.namespace_map_.items():
+      # The first prefix of a URI is the one that replaces it
+      namespace_index.setdefault('{' + uri + '}', key + ':')
+    self.namespace_index_ = namespace_index
+    self.namespace_index_map_ = self.namespace_map_
+    self.namespace_index_size_ = len(self.namespace_map_)
+    self.attribute_keys_ = {}
+
+  def translate_name(self, name):
+    if name.count('{') == 0:
+      return name
+    if name[0] == '{' and name.count('{') == 1 and name.count('}') == 1:
+      end = name.index('}') + 1
+      prefix = self.namespace_index_.get(name[:end])
+      if prefix is None:
+        return name
+      return prefix + name[end:]
+    # Several or embedded namespaces, replaced in the order of the map
     for key in self.namespace_map_.keys():
       search_key = '{' + self.namespace_map_[key] + '}'
       name = name.replace(search_key, key + ':')
@@ -666,19 +430,62 @@ class HtmlParser:
     #self.tree_ = html5lib.parse(data)
     # NOTE: html5-parser strips XML namespace attributes on tags
     #self.tree_ = html5_parser.parse(data, namespace_elements=True, treebuilder="etree", maybe_xhtml=True)
-    etree_parser = ETreeHTMLParser()
+    # NOTE: The ast.Node tree is built directly from the tokenizer events.
+    #       parse_tree() converts an ElementTree built by ETreeHTMLParser()
+    #       to the same ast.Node tree.
+    etree_parser = self.create_parser()
     etree_parser.feed(data)
-    self.tree_ = etree_parser.getFragment()
-    self.namespace_map_ = etree_parser.namespace_uri_map()
-
-    astnode = None
-    if isinstance(self.tree_, xml.etree.ElementTree.Element):
-      astnode = self.parse_tree(self.tree_)
-    elif isinstance(self.tree_, xml.etree.ElementTree.ElementTree):
-      astnode = self.parse_tree(self.tree_.getroot())
+    return etree_parser.getFragment()
+
+  def parse_chunks(self, chunks, columnar=False, stats=None):
+    # Parses HTML from an iterable of string chunks (e.g. a file decoded
+    # incrementally) into an ast.Node tree or a ColumnarTree. stats (a
+    # ConversionStats) gets the time spent reading chunks, in feed() and
+    # in getFragment().
+    if columnar:
+      etree_parser = self.create_parser(ColumnarTreeBuilder(NODE_CLASSES, self.ns_uri_to_prefix))
     else:
-      pass
-    return astnode
+      etree_parser = self.create_parser()
+    if stats is not None:
+      return self.parse_chunks_timed(etree_parser, chunks, stats)
+    for chunk in chunks:
+      etree_parser.feed(chunk)
+    return etree_parser.getFragment()
+
+  def parse_chunks_timed(self, etree_parser, chunks, stats):
+    chunks = iter(chunks)
+    while True:
+      start = stats.clock()
+      chunk = next(chunks, None)
+      stats.add_time('read', start)
+      if chunk is None:
+        break
+      stats.add_chars_in(len(chunk))
+      start = stats.clock()
+      etree_parser.feed(chunk)
+      stats.add_time('feed', start)
+    start = stats.clock()
+    root = etree_parser.getFragment()
+    stats.add_time('close', start)
+    return root
+
+  def parse_columnar(self, data):
+    # Returns a ColumnarTree instead of an ast.Node tree
+    return self.parse_chunks([data], True)
+
+  def create_parser(self, tree=None):
+    # Returns an ETreeHTMLParser that builds the ast.Node tree (or the tree
+    # of the given builder) as it is fed
+    if tree is None:
+      tree = AstTreeBuilder(self.ns_uri_to_prefix, self.xml_islands_ and not self.track_offsets_)
+    prune_tags = None
+    if self.prune_ignored_:
+      prune_tags = PRUNED_TAGS
+    etree_parser = ETreeHTMLParser(tree=tree, track_offsets=self.track_offsets_, prune_tags=prune_tags)
+    # namespace_uri_map() is updated in place while parsing
+    self.namespace_map_ = etree_parser.namespace_uri_map()
+    self.tree_ = None
+    return etree_parser
 
   def parse_tree(self, root):
     astnode = parsers.ast.Node()
@@ -688,9 +495,9 @@ class HtmlParser:
         node_tag = '{http://www.w3.org/1999/xhtml}comment'
       else:
         node_tag = node.tag
-      method = self.parser_methods.get(node_tag)
+      method = PARSER_METHODS.get(node_tag)
       if method is not None:
-        astchild = method(node)
+        astchild = method(self, node)
         if astchild is not None:
           astnode.add_child(astchild)
       else:
@@ -698,6 +505,33 @@ class HtmlParser:
     return astnode
 
   def _parse_node(self, node, astnode):
+    # Converts the subtree with an explicit stack instead of recursion
+    stack = [(node, astnode)]
+    while len(stack) > 0:
+      node, parent = stack.pop()
+      self._parse_element(node, parent)
+      if self.prune_ignored_ and type(parent) in parsers.ast.IGNORED_NODES:
+        continue
+      children = []
+      for child in list(node):
+        if child.tag == xml.etree.ElementTree.Comment:
+          child_tag = '{http://www.w3.org/1999/xhtml}comment'
+        else:
+          child_tag = child.tag
+        node_class = NODE_CLASSES.get(child_tag)
+        if node_class is not None:
+          astchild = node_class()
+        else:
+          astchild = parsers.ast.Node()
+          astchild.name = child.tag.split('}')[-1]
+          astchild.namespace = child.tag.split('}')[-2][1:]
+        parent.add_child(astchild)
+        children.append((child, astchild))
+      children.reverse()
+      stack.extend(children)
+    return astnode
+
+  def _parse_element(self, node, astnode):
     if node.tag != astnode.tag:
       if node.tag == '{http://www.w3.org/1999/xhtml}{http://www.w3.org/2000/svg}svg':
         pass
@@ -719,29 +553,6 @@ class HtmlParser:
       attr_value = node.attrib.get(key)
       attr_key = self.ns_uri_to_prefix(key)
       astnode.set_attribute(attr_key, attr_value)
-    for child in list(node):
-      method = self.parser_methods.get(child.tag)
-      if method is not None:
-        astchild = method(child)
-        if astchild is not None:
-          astnode.add_child(astchild)
-      else:
-        if child.tag == xml.etree.ElementTree.Comment:
-          method = self.parser_methods.get('{http://www.w3.org/1999/xhtml}comment')
-          if method is not None:
-            astchild = method(child)
-            if astchild is not None:
-              astnode.add_child(astchild)
-          else:
-            raise ValueError("no method for %s" % (child.tag,))
-        else:
-          astchild = parsers.ast.Node()
-          astchild.name = child.tag.split('}')[-1]
-          astchild.namespace = child.tag.split('}')[-2][1:]
-          astchild = self._parse_node(child, astchild)
-          if astchild is not None:
-            astnode.add_child(astchild)
-    return astnode
 
   '''[[[cog
   upperFirst = lambda s: s[:1].upper() + s[1:] if s else ''
@@ -1831,3 +1642,768 @@ class HtmlParser:
     return self._parse_node(node, astnode)
 
   #[[[end]]]
+
+'''[[[cog
+cog.outl("""NODE_CLASSES = MappingProxyType({""")
+for namespace, tags in ((XHTML_NS, xhtml_tags), (SVG_NS, svg_tags), (MATHML_NS, mathml_tags), (XML_NS, xml_tags)):
+  node_ns = upperFirst(namespace.split('/')[-1])
+  for tag in tags:
+    node_name = upperFirst(tag.replace('-', ''))
+    cog.outl("  '{%s}%s': parsers.ast.%s%sNode, " % (namespace, tag, node_ns, node_name,))
+cog.outl("""})""")
+cog.outl("""""")
+cog.outl("""# Parser method for each tag, shared by all HtmlParser instances""")
+cog.outl("""PARSER_METHODS = MappingProxyType({""")
+for namespace, tags in ((XHTML_NS, xhtml_tags), (SVG_NS, svg_tags), (MATHML_NS, mathml_tags), (XML_NS, xml_tags)):
+  node_ns = upperFirst(namespace.split('/')[-1])
+  for tag in tags:
+    node_name = upperFirst(tag.replace('-', ''))
+    cog.outl("  '{%s}%s': HtmlParser._parse_%s_%s, " % (namespace, tag, node_ns, node_name,))
+cog.outl("""})""")
+]]]'''
+NODE_CLASSES = MappingProxyType({
+  '{http://www.w3.org/1999/xhtml}comment': parsers.ast.XhtmlCommentNode, 
+  '{http://www.w3.org/1999/xhtml}html': parsers.ast.XhtmlHtmlNode, 
+  '{http://www.w3.org/1999/xhtml}base': parsers.ast.XhtmlBaseNode, 
+  '{http://www.w3.org/1999/xhtml}head': parsers.ast.XhtmlHeadNode, 
+  '{http://www.w3.org/1999/xhtml}link': parsers.ast.XhtmlLinkNode, 
+  '{http://www.w3.org/1999/xhtml}meta': parsers.ast.XhtmlMetaNode, 
+  '{http://www.w3.org/1999/xhtml}style': parsers.ast.XhtmlStyleNode, 
+  '{http://www.w3.org/1999/xhtml}title': parsers.ast.XhtmlTitleNode, 
+  '{http://www.w3.org/1999/xhtml}body': parsers.ast.XhtmlBodyNode, 
+  '{http://www.w3.org/1999/xhtml}address': parsers.ast.XhtmlAddressNode, 
+  '{http://www.w3.org/1999/xhtml}article': parsers.ast.XhtmlArticleNode, 
+  '{http://www.w3.org/1999/xhtml}aside': parsers.ast.XhtmlAsideNode, 
+  '{http://www.w3.org/1999/xhtml}footer': parsers.ast.XhtmlFooterNode, 
+  '{http://www.w3.org/1999/xhtml}header': parsers.ast.XhtmlHeaderNode, 
+  '{http://www.w3.org/1999/xhtml}h1': parsers.ast.XhtmlH1Node, 
+  '{http://www.w3.org/1999/xhtml}h2': parsers.ast.XhtmlH2Node, 
+  '{http://www.w3.org/1999/xhtml}h3': parsers.ast.XhtmlH3Node, 
+  '{http://www.w3.org/1999/xhtml}h4': parsers.ast.XhtmlH4Node, 
+  '{http://www.w3.org/1999/xhtml}h5': parsers.ast.XhtmlH5Node, 
+  '{http://www.w3.org/1999/xhtml}h6': parsers.ast.XhtmlH6Node, 
+  '{http://www.w3.org/1999/xhtml}hgroup': parsers.ast.XhtmlHgroupNode, 
+  '{http://www.w3.org/1999/xhtml}main': parsers.ast.XhtmlMainNode, 
+  '{http://www.w3.org/1999/xhtml}nav': parsers.ast.XhtmlNavNode, 
+  '{http://www.w3.org/1999/xhtml}section': parsers.ast.XhtmlSectionNode, 
+  '{http://www.w3.org/1999/xhtml}blockquote': parsers.ast.XhtmlBlockquoteNode, 
+  '{http://www.w3.org/1999/xhtml}dd': parsers.ast.XhtmlDdNode, 
+  '{http://www.w3.org/1999/xhtml}div': parsers.ast.XhtmlDivNode, 
+  '{http://www.w3.org/1999/xhtml}dl': parsers.ast.XhtmlDlNode, 
+  '{http://www.w3.org/1999/xhtml}dt': parsers.ast.XhtmlDtNode, 
+  '{http://www.w3.org/1999/xhtml}figcaption': parsers.ast.XhtmlFigcaptionNode, 
+  '{http://www.w3.org/1999/xhtml}figure': parsers.ast.XhtmlFigureNode, 
+  '{http://www.w3.org/1999/xhtml}hr': parsers.ast.XhtmlHrNode, 
+  '{http://www.w3.org/1999/xhtml}li': parsers.ast.XhtmlLiNode, 
+  '{http://www.w3.org/1999/xhtml}ol': parsers.ast.XhtmlOlNode, 
+  '{http://www.w3.org/1999/xhtml}p': parsers.ast.XhtmlPNode, 
+  '{http://www.w3.org/1999/xhtml}pre': parsers.ast.XhtmlPreNode, 
+  '{http://www.w3.org/1999/xhtml}ul': parsers.ast.XhtmlUlNode, 
+  '{http://www.w3.org/1999/xhtml}a': parsers.ast.XhtmlANode, 
+  '{http://www.w3.org/1999/xhtml}abbr': parsers.ast.XhtmlAbbrNode, 
+  '{http://www.w3.org/1999/xhtml}b': parsers.ast.XhtmlBNode, 
+  '{http://www.w3.org/1999/xhtml}bdi': parsers.ast.XhtmlBdiNode, 
+  '{http://www.w3.org/1999/xhtml}bdo': parsers.ast.XhtmlBdoNode, 
+  '{http://www.w3.org/1999/xhtml}br': parsers.ast.XhtmlBrNode, 
+  '{http://www.w3.org/1999/xhtml}cite': parsers.ast.XhtmlCiteNode, 
+  '{http://www.w3.org/1999/xhtml}code': parsers.ast.XhtmlCodeNode, 
+  '{http://www.w3.org/1999/xhtml}data': parsers.ast.XhtmlDataNode, 
+  '{http://www.w3.org/1999/xhtml}dfn': parsers.ast.XhtmlDfnNode, 
+  '{http://www.w3.org/1999/xhtml}em': parsers.ast.XhtmlEmNode, 
+  '{http://www.w3.org/1999/xhtml}i': parsers.ast.XhtmlINode, 
+  '{http://www.w3.org/1999/xhtml}kbd': parsers.ast.XhtmlKbdNode, 
+  '{http://www.w3.org/1999/xhtml}mark': parsers.ast.XhtmlMarkNode, 
+  '{http://www.w3.org/1999/xhtml}q': parsers.ast.XhtmlQNode, 
+  '{http://www.w3.org/1999/xhtml}rb': parsers.ast.XhtmlRbNode, 
+  '{http://www.w3.org/1999/xhtml}rp': parsers.ast.XhtmlRpNode, 
+  '{http://www.w3.org/1999/xhtml}rt': parsers.ast.XhtmlRtNode, 
+  '{http://www.w3.org/1999/xhtml}rtc': parsers.ast.XhtmlRtcNode, 
+  '{http://www.w3.org/1999/xhtml}ruby': parsers.ast.XhtmlRubyNode, 
+  '{http://www.w3.org/1999/xhtml}s': parsers.ast.XhtmlSNode, 
+  '{http://www.w3.org/1999/xhtml}samp': parsers.ast.XhtmlSampNode, 
+  '{http://www.w3.org/1999/xhtml}small': parsers.ast.XhtmlSmallNode, 
+  '{http://www.w3.org/1999/xhtml}span': parsers.ast.XhtmlSpanNode, 
+  '{http://www.w3.org/1999/xhtml}strong': parsers.ast.XhtmlStrongNode, 
+  '{http://www.w3.org/1999/xhtml}sub': parsers.ast.XhtmlSubNode, 
+  '{http://www.w3.org/1999/xhtml}sup': parsers.ast.XhtmlSupNode, 
+  '{http://www.w3.org/1999/xhtml}time': parsers.ast.XhtmlTimeNode, 
+  '{http://www.w3.org/1999/xhtml}u': parsers.ast.XhtmlUNode, 
+  '{http://www.w3.org/1999/xhtml}var': parsers.ast.XhtmlVarNode, 
+  '{http://www.w3.org/1999/xhtml}wbr': parsers.ast.XhtmlWbrNode, 
+  '{http://www.w3.org/1999/xhtml}area': parsers.ast.XhtmlAreaNode, 
+  '{http://www.w3.org/1999/xhtml}audio': parsers.ast.XhtmlAudioNode, 
+  '{http://www.w3.org/1999/xhtml}img': parsers.ast.XhtmlImgNode, 
+  '{http://www.w3.org/1999/xhtml}map': parsers.ast.XhtmlMapNode, 
+  '{http://www.w3.org/1999/xhtml}track': parsers.ast.XhtmlTrackNode, 
+  '{http://www.w3.org/1999/xhtml}video': parsers.ast.XhtmlVideoNode, 
+  '{http://www.w3.org/1999/xhtml}embed': parsers.ast.XhtmlEmbedNode, 
+  '{http://www.w3.org/1999/xhtml}iframe': parsers.ast.XhtmlIframeNode, 
+  '{http://www.w3.org/1999/xhtml}object': parsers.ast.XhtmlObjectNode, 
+  '{http://www.w3.org/1999/xhtml}param': parsers.ast.XhtmlParamNode, 
+  '{http://www.w3.org/1999/xhtml}picture': parsers.ast.XhtmlPictureNode, 
+  '{http://www.w3.org/1999/xhtml}source': parsers.ast.XhtmlSourceNode, 
+  '{http://www.w3.org/1999/xhtml}canvas': parsers.ast.XhtmlCanvasNode, 
+  '{http://www.w3.org/1999/xhtml}noscript': parsers.ast.XhtmlNoscriptNode, 
+  '{http://www.w3.org/1999/xhtml}script': parsers.ast.XhtmlScriptNode, 
+  '{http://www.w3.org/1999/xhtml}del': parsers.ast.XhtmlDelNode, 
+  '{http://www.w3.org/1999/xhtml}ins': parsers.ast.XhtmlInsNode, 
+  '{http://www.w3.org/1999/xhtml}caption': parsers.ast.XhtmlCaptionNode, 
+  '{http://www.w3.org/1999/xhtml}col': parsers.ast.XhtmlColNode, 
+  '{http://www.w3.org/1999/xhtml}colgroup': parsers.ast.XhtmlColgroupNode, 
+  '{http://www.w3.org/1999/xhtml}table': parsers.ast.XhtmlTableNode, 
+  '{http://www.w3.org/1999/xhtml}tbody': parsers.ast.XhtmlTbodyNode, 
+  '{http://www.w3.org/1999/xhtml}td': parsers.ast.XhtmlTdNode, 
+  '{http://www.w3.org/1999/xhtml}tfoot': parsers.ast.XhtmlTfootNode, 
+  '{http://www.w3.org/1999/xhtml}th': parsers.ast.XhtmlThNode, 
+  '{http://www.w3.org/1999/xhtml}thead': parsers.ast.XhtmlTheadNode, 
+  '{http://www.w3.org/1999/xhtml}tr': parsers.ast.XhtmlTrNode, 
+  '{http://www.w3.org/1999/xhtml}button': parsers.ast.XhtmlButtonNode, 
+  '{http://www.w3.org/1999/xhtml}datalist': parsers.ast.XhtmlDatalistNode, 
+  '{http://www.w3.org/1999/xhtml}fieldset': parsers.ast.XhtmlFieldsetNode, 
+  '{http://www.w3.org/1999/xhtml}form': parsers.ast.XhtmlFormNode, 
+  '{http://www.w3.org/1999/xhtml}input': parsers.ast.XhtmlInputNode, 
+  '{http://www.w3.org/1999/xhtml}label': parsers.ast.XhtmlLabelNode, 
+  '{http://www.w3.org/1999/xhtml}legend': parsers.ast.XhtmlLegendNode, 
+  '{http://www.w3.org/1999/xhtml}meter': parsers.ast.XhtmlMeterNode, 
+  '{http://www.w3.org/1999/xhtml}optgroup': parsers.ast.XhtmlOptgroupNode, 
+  '{http://www.w3.org/1999/xhtml}option': parsers.ast.XhtmlOptionNode, 
+  '{http://www.w3.org/1999/xhtml}output': parsers.ast.XhtmlOutputNode, 
+  '{http://www.w3.org/1999/xhtml}progress': parsers.ast.XhtmlProgressNode, 
+  '{http://www.w3.org/1999/xhtml}select': parsers.ast.XhtmlSelectNode, 
+  '{http://www.w3.org/1999/xhtml}textarea': parsers.ast.XhtmlTextareaNode, 
+  '{http://www.w3.org/1999/xhtml}details': parsers.ast.XhtmlDetailsNode, 
+  '{http://www.w3.org/1999/xhtml}dialog': parsers.ast.XhtmlDialogNode, 
+  '{http://www.w3.org/1999/xhtml}menu': parsers.ast.XhtmlMenuNode, 
+  '{http://www.w3.org/1999/xhtml}summary': parsers.ast.XhtmlSummaryNode, 
+  '{http://www.w3.org/1999/xhtml}slot': parsers.ast.XhtmlSlotNode, 
+  '{http://www.w3.org/1999/xhtml}template': parsers.ast.XhtmlTemplateNode, 
+  '{http://www.w3.org/1999/xhtml}acronym': parsers.ast.XhtmlAcronymNode, 
+  '{http://www.w3.org/1999/xhtml}applet': parsers.ast.XhtmlAppletNode, 
+  '{http://www.w3.org/1999/xhtml}basefont': parsers.ast.XhtmlBasefontNode, 
+  '{http://www.w3.org/1999/xhtml}bgsound': parsers.ast.XhtmlBgsoundNode, 
+  '{http://www.w3.org/1999/xhtml}big': parsers.ast.XhtmlBigNode, 
+  '{http://www.w3.org/1999/xhtml}blink': parsers.ast.XhtmlBlinkNode, 
+  '{http://www.w3.org/1999/xhtml}center': parsers.ast.XhtmlCenterNode, 
+  '{http://www.w3.org/1999/xhtml}command': parsers.ast.XhtmlCommandNode, 
+  '{http://www.w3.org/1999/xhtml}content': parsers.ast.XhtmlContentNode, 
+  '{http://www.w3.org/1999/xhtml}dir': parsers.ast.XhtmlDirNode, 
+  '{http://www.w3.org/1999/xhtml}element': parsers.ast.XhtmlElementNode, 
+  '{http://www.w3.org/1999/xhtml}font': parsers.ast.XhtmlFontNode, 
+  '{http://www.w3.org/1999/xhtml}frame': parsers.ast.XhtmlFrameNode, 
+  '{http://www.w3.org/1999/xhtml}frameset': parsers.ast.XhtmlFramesetNode, 
+  '{http://www.w3.org/1999/xhtml}image': parsers.ast.XhtmlImageNode, 
+  '{http://www.w3.org/1999/xhtml}isindex': parsers.ast.XhtmlIsindexNode, 
+  '{http://www.w3.org/1999/xhtml}keygen': parsers.ast.XhtmlKeygenNode, 
+  '{http://www.w3.org/1999/xhtml}listing': parsers.ast.XhtmlListingNode, 
+  '{http://www.w3.org/1999/xhtml}marquee': parsers.ast.XhtmlMarqueeNode, 
+  '{http://www.w3.org/1999/xhtml}menuitem': parsers.ast.XhtmlMenuitemNode, 
+  '{http://www.w3.org/1999/xhtml}multicol': parsers.ast.XhtmlMulticolNode, 
+  '{http://www.w3.org/1999/xhtml}nextid': parsers.ast.XhtmlNextidNode, 
+  '{http://www.w3.org/1999/xhtml}nobr': parsers.ast.XhtmlNobrNode, 
+  '{http://www.w3.org/1999/xhtml}noembed': parsers.ast.XhtmlNoembedNode, 
+  '{http://www.w3.org/1999/xhtml}noframes': parsers.ast.XhtmlNoframesNode, 
+  '{http://www.w3.org/1999/xhtml}plaintext': parsers.ast.XhtmlPlaintextNode, 
+  '{http://www.w3.org/1999/xhtml}shadow': parsers.ast.XhtmlShadowNode, 
+  '{http://www.w3.org/1999/xhtml}spacer': parsers.ast.XhtmlSpacerNode, 
+  '{http://www.w3.org/1999/xhtml}strike': parsers.ast.XhtmlStrikeNode, 
+  '{http://www.w3.org/1999/xhtml}tt': parsers.ast.XhtmlTtNode, 
+  '{http://www.w3.org/1999/xhtml}xmp': parsers.ast.XhtmlXmpNode, 
+  '{http://www.w3.org/1999/xhtml}svg': parsers.ast.XhtmlSvgNode, 
+  '{http://www.w3.org/2000/svg}a': parsers.ast.SvgANode, 
+  '{http://www.w3.org/2000/svg}animate': parsers.ast.SvgAnimateNode, 
+  '{http://www.w3.org/2000/svg}animateMotion': parsers.ast.SvgAnimateMotionNode, 
+  '{http://www.w3.org/2000/svg}animateTransform': parsers.ast.SvgAnimateTransformNode, 
+  '{http://www.w3.org/2000/svg}circle': parsers.ast.SvgCircleNode, 
+  '{http://www.w3.org/2000/svg}clipPath': parsers.ast.SvgClipPathNode, 
+  '{http://www.w3.org/2000/svg}color-profile': parsers.ast.SvgColorprofileNode, 
+  '{http://www.w3.org/2000/svg}defs': parsers.ast.SvgDefsNode, 
+  '{http://www.w3.org/2000/svg}desc': parsers.ast.SvgDescNode, 
+  '{http://www.w3.org/2000/svg}discard': parsers.ast.SvgDiscardNode, 
+  '{http://www.w3.org/2000/svg}ellipse': parsers.ast.SvgEllipseNode, 
+  '{http://www.w3.org/2000/svg}feBlend': parsers.ast.SvgFeBlendNode, 
+  '{http://www.w3.org/2000/svg}feColorMatrix': parsers.ast.SvgFeColorMatrixNode, 
+  '{http://www.w3.org/2000/svg}feComponentTransfer': parsers.ast.SvgFeComponentTransferNode, 
+  '{http://www.w3.org/2000/svg}feComposite': parsers.ast.SvgFeCompositeNode, 
+  '{http://www.w3.org/2000/svg}feConvolveMatrix': parsers.ast.SvgFeConvolveMatrixNode, 
+  '{http://www.w3.org/2000/svg}feDiffuseLighting': parsers.ast.SvgFeDiffuseLightingNode, 
+  '{http://www.w3.org/2000/svg}feDisplacementMap': parsers.ast.SvgFeDisplacementMapNode, 
+  '{http://www.w3.org/2000/svg}feDistantLight': parsers.ast.SvgFeDistantLightNode, 
+  '{http://www.w3.org/2000/svg}feDropShadow': parsers.ast.SvgFeDropShadowNode, 
+  '{http://www.w3.org/2000/svg}feFlood': parsers.ast.SvgFeFloodNode, 
+  '{http://www.w3.org/2000/svg}feFuncA': parsers.ast.SvgFeFuncANode, 
+  '{http://www.w3.org/2000/svg}feFuncB': parsers.ast.SvgFeFuncBNode, 
+  '{http://www.w3.org/2000/svg}feFuncG': parsers.ast.SvgFeFuncGNode, 
+  '{http://www.w3.org/2000/svg}feFuncR': parsers.ast.SvgFeFuncRNode, 
+  '{http://www.w3.org/2000/svg}feGaussianBlur': parsers.ast.SvgFeGaussianBlurNode, 
+  '{http://www.w3.org/2000/svg}feImage': parsers.ast.SvgFeImageNode, 
+  '{http://www.w3.org/2000/svg}feMerge': parsers.ast.SvgFeMergeNode, 
+  '{http://www.w3.org/2000/svg}feMergeNode': parsers.ast.SvgFeMergeNodeNode, 
+  '{http://www.w3.org/2000/svg}feMorphology': parsers.ast.SvgFeMorphologyNode, 
+  '{http://www.w3.org/2000/svg}feOffset': parsers.ast.SvgFeOffsetNode, 
+  '{http://www.w3.org/2000/svg}fePointLight': parsers.ast.SvgFePointLightNode, 
+  '{http://www.w3.org/2000/svg}feSpecularLighting': parsers.ast.SvgFeSpecularLightingNode, 
+  '{http://www.w3.org/2000/svg}feSpotLight': parsers.ast.SvgFeSpotLightNode, 
+  '{http://www.w3.org/2000/svg}feTile': parsers.ast.SvgFeTileNode, 
+  '{http://www.w3.org/2000/svg}feTurbulence': parsers.ast.SvgFeTurbulenceNode, 
+  '{http://www.w3.org/2000/svg}filter': parsers.ast.SvgFilterNode, 
+  '{http://www.w3.org/2000/svg}foreignObject': parsers.ast.SvgForeignObjectNode, 
+  '{http://www.w3.org/2000/svg}g': parsers.ast.SvgGNode, 
+  '{http://www.w3.org/2000/svg}hatch': parsers.ast.SvgHatchNode, 
+  '{http://www.w3.org/2000/svg}hatchpath': parsers.ast.SvgHatchpathNode, 
+  '{http://www.w3.org/2000/svg}image': parsers.ast.SvgImageNode, 
+  '{http://www.w3.org/2000/svg}line': parsers.ast.SvgLineNode, 
+  '{http://www.w3.org/2000/svg}linearGradient': parsers.ast.SvgLinearGradientNode, 
+  '{http://www.w3.org/2000/svg}marker': parsers.ast.SvgMarkerNode, 
+  '{http://www.w3.org/2000/svg}mask': parsers.ast.SvgMaskNode, 
+  '{http://www.w3.org/2000/svg}mesh': parsers.ast.SvgMeshNode, 
+  '{http://www.w3.org/2000/svg}meshgradient': parsers.ast.SvgMeshgradientNode, 
+  '{http://www.w3.org/2000/svg}meshpatch': parsers.ast.SvgMeshpatchNode, 
+  '{http://www.w3.org/2000/svg}meshrow': parsers.ast.SvgMeshrowNode, 
+  '{http://www.w3.org/2000/svg}metadata': parsers.ast.SvgMetadataNode, 
+  '{http://www.w3.org/2000/svg}mpath': parsers.ast.SvgMpathNode, 
+  '{http://www.w3.org/2000/svg}path': parsers.ast.SvgPathNode, 
+  '{http://www.w3.org/2000/svg}pattern': parsers.ast.SvgPatternNode, 
+  '{http://www.w3.org/2000/svg}polygon': parsers.ast.SvgPolygonNode, 
+  '{http://www.w3.org/2000/svg}polyline': parsers.ast.SvgPolylineNode, 
+  '{http://www.w3.org/2000/svg}radialGradient': parsers.ast.SvgRadialGradientNode, 
+  '{http://www.w3.org/2000/svg}rect': parsers.ast.SvgRectNode, 
+  '{http://www.w3.org/2000/svg}script': parsers.ast.SvgScriptNode, 
+  '{http://www.w3.org/2000/svg}set': parsers.ast.SvgSetNode, 
+  '{http://www.w3.org/2000/svg}solidcolor': parsers.ast.SvgSolidcolorNode, 
+  '{http://www.w3.org/2000/svg}stop': parsers.ast.SvgStopNode, 
+  '{http://www.w3.org/2000/svg}style': parsers.ast.SvgStyleNode, 
+  '{http://www.w3.org/2000/svg}svg': parsers.ast.SvgSvgNode, 
+  '{http://www.w3.org/2000/svg}switch': parsers.ast.SvgSwitchNode, 
+  '{http://www.w3.org/2000/svg}symbol': parsers.ast.SvgSymbolNode, 
+  '{http://www.w3.org/2000/svg}text': parsers.ast.SvgTextNode, 
+  '{http://www.w3.org/2000/svg}textPath': parsers.ast.SvgTextPathNode, 
+  '{http://www.w3.org/2000/svg}title': parsers.ast.SvgTitleNode, 
+  '{http://www.w3.org/2000/svg}tspan': parsers.ast.SvgTspanNode, 
+  '{http://www.w3.org/2000/svg}unknown': parsers.ast.SvgUnknownNode, 
+  '{http://www.w3.org/2000/svg}use': parsers.ast.SvgUseNode, 
+  '{http://www.w3.org/2000/svg}view': parsers.ast.SvgViewNode, 
+  '{http://www.w3.org/1998/Math/MathML}math': parsers.ast.MathMLMathNode, 
+  '{http://www.w3.org/1998/Math/MathML}maction': parsers.ast.MathMLMactionNode, 
+  '{http://www.w3.org/1998/Math/MathML}maligngroup': parsers.ast.MathMLMaligngroupNode, 
+  '{http://www.w3.org/1998/Math/MathML}malignmark': parsers.ast.MathMLMalignmarkNode, 
+  '{http://www.w3.org/1998/Math/MathML}menclose': parsers.ast.MathMLMencloseNode, 
+  '{http://www.w3.org/1998/Math/MathML}merror': parsers.ast.MathMLMerrorNode, 
+  '{http://www.w3.org/1998/Math/MathML}mfenced': parsers.ast.MathMLMfencedNode, 
+  '{http://www.w3.org/1998/Math/MathML}mfrac': parsers.ast.MathMLMfracNode, 
+  '{http://www.w3.org/1998/Math/MathML}mglyph': parsers.ast.MathMLMglyphNode, 
+  '{http://www.w3.org/1998/Math/MathML}mi': parsers.ast.MathMLMiNode, 
+  '{http://www.w3.org/1998/Math/MathML}mlabeledtr': parsers.ast.MathMLMlabeledtrNode, 
+  '{http://www.w3.org/1998/Math/MathML}mlongdiv': parsers.ast.MathMLMlongdivNode, 
+  '{http://www.w3.org/1998/Math/MathML}mmultiscripts': parsers.ast.MathMLMmultiscriptsNode, 
+  '{http://www.w3.org/1998/Math/MathML}mn': parsers.ast.MathMLMnNode, 
+  '{http://www.w3.org/1998/Math/MathML}mo': parsers.ast.MathMLMoNode, 
+  '{http://www.w3.org/1998/Math/MathML}mover': parsers.ast.MathMLMoverNode, 
+  '{http://www.w3.org/1998/Math/MathML}mpadded': parsers.ast.MathMLMpaddedNode, 
+  '{http://www.w3.org/1998/Math/MathML}mphantom': parsers.ast.MathMLMphantomNode, 
+  '{http://www.w3.org/1998/Math/MathML}mroot': parsers.ast.MathMLMrootNode, 
+  '{http://www.w3.org/1998/Math/MathML}mrow': parsers.ast.MathMLMrowNode, 
+  '{http://www.w3.org/1998/Math/MathML}ms': parsers.ast.MathMLMsNode, 
+  '{http://www.w3.org/1998/Math/MathML}mscarries': parsers.ast.MathMLMscarriesNode, 
+  '{http://www.w3.org/1998/Math/MathML}mscarry': parsers.ast.MathMLMscarryNode, 
+  '{http://www.w3.org/1998/Math/MathML}msgroup': parsers.ast.MathMLMsgroupNode, 
+  '{http://www.w3.org/1998/Math/MathML}msline': parsers.ast.MathMLMslineNode, 
+  '{http://www.w3.org/1998/Math/MathML}mspace': parsers.ast.MathMLMspaceNode, 
+  '{http://www.w3.org/1998/Math/MathML}msqrt': parsers.ast.MathMLMsqrtNode, 
+  '{http://www.w3.org/1998/Math/MathML}msrow': parsers.ast.MathMLMsrowNode, 
+  '{http://www.w3.org/1998/Math/MathML}mstack': parsers.ast.MathMLMstackNode, 
+  '{http://www.w3.org/1998/Math/MathML}mstyle': parsers.ast.MathMLMstyleNode, 
+  '{http://www.w3.org/1998/Math/MathML}msub': parsers.ast.MathMLMsubNode, 
+  '{http://www.w3.org/1998/Math/MathML}msup': parsers.ast.MathMLMsupNode, 
+  '{http://www.w3.org/1998/Math/MathML}msubsup': parsers.ast.MathMLMsubsupNode, 
+  '{http://www.w3.org/1998/Math/MathML}mtable': parsers.ast.MathMLMtableNode, 
+  '{http://www.w3.org/1998/Math/MathML}mtd': parsers.ast.MathMLMtdNode, 
+  '{http://www.w3.org/1998/Math/MathML}mtext': parsers.ast.MathMLMtextNode, 
+  '{http://www.w3.org/1998/Math/MathML}mtr': parsers.ast.MathMLMtrNode, 
+  '{http://www.w3.org/1998/Math/MathML}munder': parsers.ast.MathMLMunderNode, 
+  '{http://www.w3.org/1998/Math/MathML}munderover': parsers.ast.MathMLMunderoverNode, 
+  '{http://www.w3.org/1998/Math/MathML}semantics': parsers.ast.MathMLSemanticsNode, 
+  '{http://www.w3.org/1998/Math/MathML}annotation': parsers.ast.MathMLAnnotationNode, 
+  '{http://www.w3.org/1998/Math/MathML}annotation-xml': parsers.ast.MathMLAnnotationxmlNode, 
+  '{http://www.w3.org/2000/xmlns}XML_DECL': parsers.ast.XmlnsXML_DECLNode, 
+})
+
+# Parser method for each tag, shared by all HtmlParser instances
+PARSER_METHODS = MappingProxyType({
+  '{http://www.w3.org/1999/xhtml}comment': HtmlParser._parse_Xhtml_Comment, 
+  '{http://www.w3.org/1999/xhtml}html': HtmlParser._parse_Xhtml_Html, 
+  '{http://www.w3.org/1999/xhtml}base': HtmlParser._parse_Xhtml_Base, 
+  '{http://www.w3.org/1999/xhtml}head': HtmlParser._parse_Xhtml_Head, 
+  '{http://www.w3.org/1999/xhtml}link': HtmlParser._parse_Xhtml_Link, 
+  '{http://www.w3.org/1999/xhtml}meta': HtmlParser._parse_Xhtml_Meta, 
+  '{http://www.w3.org/1999/xhtml}style': HtmlParser._parse_Xhtml_Style, 
+  '{http://www.w3.org/1999/xhtml}title': HtmlParser._parse_Xhtml_Title, 
+  '{http://www.w3.org/1999/xhtml}body': HtmlParser._parse_Xhtml_Body, 
+  '{http://www.w3.org/1999/xhtml}address': HtmlParser._parse_Xhtml_Address, 
+  '{http://www.w3.org/1999/xhtml}article': HtmlParser._parse_Xhtml_Article, 
+  '{http://www.w3.org/1999/xhtml}aside': HtmlParser._parse_Xhtml_Aside, 
+  '{http://www.w3.org/1999/xhtml}footer': HtmlParser._parse_Xhtml_Footer, 
+  '{http://www.w3.org/1999/xhtml}header': HtmlParser._parse_Xhtml_Header, 
+  '{http://www.w3.org/1999/xhtml}h1': HtmlParser._parse_Xhtml_H1, 
+  '{http://www.w3.org/1999/xhtml}h2': HtmlParser._parse_Xhtml_H2, 
+  '{http://www.w3.org/1999/xhtml}h3': HtmlParser._parse_Xhtml_H3, 
+  '{http://www.w3.org/1999/xhtml}h4': HtmlParser._parse_Xhtml_H4, 
+  '{http://www.w3.org/1999/xhtml}h5': HtmlParser._parse_Xhtml_H5, 
+  '{http://www.w3.org/1999/xhtml}h6': HtmlParser._parse_Xhtml_H6, 
+  '{http://www.w3.org/1999/xhtml}hgroup': HtmlParser._parse_Xhtml_Hgroup, 
+  '{http://www.w3.org/1999/xhtml}main': HtmlParser._parse_Xhtml_Main, 
+  '{http://www.w3.org/1999/xhtml}nav': HtmlParser._parse_Xhtml_Nav, 
+  '{http://www.w3.org/1999/xhtml}section': HtmlParser._parse_Xhtml_Section, 
+  '{http://www.w3.org/1999/xhtml}blockquote': HtmlParser._parse_Xhtml_Blockquote, 
+  '{http://www.w3.org/1999/xhtml}dd': HtmlParser._parse_Xhtml_Dd, 
+  '{http://www.w3.org/1999/xhtml}div': HtmlParser._parse_Xhtml_Div, 
+  '{http://www.w3.org/1999/xhtml}dl': HtmlParser._parse_Xhtml_Dl, 
+  '{http://www.w3.org/1999/xhtml}dt': HtmlParser._parse_Xhtml_Dt, 
+  '{http://www.w3.org/1999/xhtml}figcaption': HtmlParser._parse_Xhtml_Figcaption, 
+  '{http://www.w3.org/1999/xhtml}figure': HtmlParser._parse_Xhtml_Figure, 
+  '{http://www.w3.org/1999/xhtml}hr': HtmlParser._parse_Xhtml_Hr, 
+  '{http://www.w3.org/1999/xhtml}li': HtmlParser._parse_Xhtml_Li, 
+  '{http://www.w3.org/1999/xhtml}ol': HtmlParser._parse_Xhtml_Ol, 
+  '{http://www.w3.org/1999/xhtml}p': HtmlParser._parse_Xhtml_P, 
+  '{http://www.w3.org/1999/xhtml}pre': HtmlParser._parse_Xhtml_Pre, 
+  '{http://www.w3.org/1999/xhtml}ul': HtmlParser._parse_Xhtml_Ul, 
+  '{http://www.w3.org/1999/xhtml}a': HtmlParser._parse_Xhtml_A, 
+  '{http://www.w3.org/1999/xhtml}abbr': HtmlParser._parse_Xhtml_Abbr, 
+  '{http://www.w3.org/1999/xhtml}b': HtmlParser._parse_Xhtml_B, 
+  '{http://www.w3.org/1999/xhtml}bdi': HtmlParser._parse_Xhtml_Bdi, 
+  '{http://www.w3.org/1999/xhtml}bdo': HtmlParser._parse_Xhtml_Bdo, 
+  '{http://www.w3.org/1999/xhtml}br': HtmlParser._parse_Xhtml_Br, 
+  '{http://www.w3.org/1999/xhtml}cite': HtmlParser._parse_Xhtml_Cite, 
+  '{http://www.w3.org/1999/xhtml}code': HtmlParser._parse_Xhtml_Code, 
+  '{http://www.w3.org/1999/xhtml}data': HtmlParser._parse_Xhtml_Data, 
+  '{http://www.w3.org/1999/xhtml}dfn': HtmlParser._parse_Xhtml_Dfn, 
+  '{http://www.w3.org/1999/xhtml}em': HtmlParser._parse_Xhtml_Em, 
+  '{http://www.w3.org/1999/xhtml}i': HtmlParser._parse_Xhtml_I, 
+  '{http://www.w3.org/1999/xhtml}kbd': HtmlParser._parse_Xhtml_Kbd, 
+  '{http://www.w3.org/1999/xhtml}mark': HtmlParser._parse_Xhtml_Mark, 
+  '{http://www.w3.org/1999/xhtml}q': HtmlParser._parse_Xhtml_Q, 
+  '{http://www.w3.org/1999/xhtml}rb': HtmlParser._parse_Xhtml_Rb, 
+  '{http://www.w3.org/1999/xhtml}rp': HtmlParser._parse_Xhtml_Rp, 
+  '{http://www.w3.org/1999/xhtml}rt': HtmlParser._parse_Xhtml_Rt, 
+  '{http://www.w3.org/1999/xhtml}rtc': HtmlParser._parse_Xhtml_Rtc, 
+  '{http://www.w3.org/1999/xhtml}ruby': HtmlParser._parse_Xhtml_Ruby, 
+  '{http://www.w3.org/1999/xhtml}s': HtmlParser._parse_Xhtml_S, 
+  '{http://www.w3.org/1999/xhtml}samp': HtmlParser._parse_Xhtml_Samp, 
+  '{http://www.w3.org/1999/xhtml}small': HtmlParser._parse_Xhtml_Small, 
+  '{http://www.w3.org/1999/xhtml}span': HtmlParser._parse_Xhtml_Span, 
+  '{http://www.w3.org/1999/xhtml}strong': HtmlParser._parse_Xhtml_Strong, 
+  '{http://www.w3.org/1999/xhtml}sub': HtmlParser._parse_Xhtml_Sub, 
+  '{http://www.w3.org/1999/xhtml}sup': HtmlParser._parse_Xhtml_Sup, 
+  '{http://www.w3.org/1999/xhtml}time': HtmlParser._parse_Xhtml_Time, 
+  '{http://www.w3.org/1999/xhtml}u': HtmlParser._parse_Xhtml_U, 
+  '{http://www.w3.org/1999/xhtml}var': HtmlParser._parse_Xhtml_Var, 
+  '{http://www.w3.org/1999/xhtml}wbr': HtmlParser._parse_Xhtml_Wbr, 
+  '{http://www.w3.org/1999/xhtml}area': HtmlParser._parse_Xhtml_Area, 
+  '{http://www.w3.org/1999/xhtml}audio': HtmlParser._parse_Xhtml_Audio, 
+  '{http://www.w3.org/1999/xhtml}img': HtmlParser._parse_Xhtml_Img, 
+  '{http://www.w3.org/1999/xhtml}map': HtmlParser._parse_Xhtml_Map, 
+  '{http://www.w3.org/1999/xhtml}track': HtmlParser._parse_Xhtml_Track, 
+  '{http://www.w3.org/1999/xhtml}video': HtmlParser._parse_Xhtml_Video, 
+  '{http://www.w3.org/1999/xhtml}embed': HtmlParser._parse_Xhtml_Embed, 
+  '{http://www.w3.org/1999/xhtml}iframe': HtmlParser._parse_Xhtml_Iframe, 
+  '{http://www.w3.org/1999/xhtml}object': HtmlParser._parse_Xhtml_Object, 
+  '{http://www.w3.org/1999/xhtml}param': HtmlParser._parse_Xhtml_Param, 
+  '{http://www.w3.org/1999/xhtml}picture': HtmlParser._parse_Xhtml_Picture, 
+  '{http://www.w3.org/1999/xhtml}source': HtmlParser._parse_Xhtml_Source, 
+  '{http://www.w3.org/1999/xhtml}canvas': HtmlParser._parse_Xhtml_Canvas, 
+  '{http://www.w3.org/1999/xhtml}noscript': HtmlParser._parse_Xhtml_Noscript, 
+  '{http://www.w3.org/1999/xhtml}script': HtmlParser._parse_Xhtml_Script, 
+  '{http://www.w3.org/1999/xhtml}del': HtmlParser._parse_Xhtml_Del, 
+  '{http://www.w3.org/1999/xhtml}ins': HtmlParser._parse_Xhtml_Ins, 
+  '{http://www.w3.org/1999/xhtml}caption': HtmlParser._parse_Xhtml_Caption, 
+  '{http://www.w3.org/1999/xhtml}col': HtmlParser._parse_Xhtml_Col, 
+  '{http://www.w3.org/1999/xhtml}colgroup': HtmlParser._parse_Xhtml_Colgroup, 
+  '{http://www.w3.org/1999/xhtml}table': HtmlParser._parse_Xhtml_Table, 
+  '{http://www.w3.org/1999/xhtml}tbody': HtmlParser._parse_Xhtml_Tbody, 
+  '{http://www.w3.org/1999/xhtml}td': HtmlParser._parse_Xhtml_Td, 
+  '{http://www.w3.org/1999/xhtml}tfoot': HtmlParser._parse_Xhtml_Tfoot, 
+  '{http://www.w3.org/1999/xhtml}th': HtmlParser._parse_Xhtml_Th, 
+  '{http://www.w3.org/1999/xhtml}thead': HtmlParser._parse_Xhtml_Thead, 
+  '{http://www.w3.org/1999/xhtml}tr': HtmlParser._parse_Xhtml_Tr, 
+  '{http://www.w3.org/1999/xhtml}button': HtmlParser._parse_Xhtml_Button, 
+  '{http://www.w3.org/1999/xhtml}datalist': HtmlParser._parse_Xhtml_Datalist, 
+  '{http://www.w3.org/1999/xhtml}fieldset': HtmlParser._parse_Xhtml_Fieldset, 
+  '{http://www.w3.org/1999/xhtml}form': HtmlParser._parse_Xhtml_Form, 
+  '{http://www.w3.org/1999/xhtml}input': HtmlParser._parse_Xhtml_Input, 
+  '{http://www.w3.org/1999/xhtml}label': HtmlParser._parse_Xhtml_Label, 
+  '{http://www.w3.org/1999/xhtml}legend': HtmlParser._parse_Xhtml_Legend, 
+  '{http://www.w3.org/1999/xhtml}meter': HtmlParser._parse_Xhtml_Meter, 
+  '{http://www.w3.org/1999/xhtml}optgroup': HtmlParser._parse_Xhtml_Optgroup, 
+  '{http://www.w3.org/1999/xhtml}option': HtmlParser._parse_Xhtml_Option, 
+  '{http://www.w3.org/1999/xhtml}output': HtmlParser._parse_Xhtml_Output, 
+  '{http://www.w3.org/1999/xhtml}progress': HtmlParser._parse_Xhtml_Progress, 
+  '{http://www.w3.org/1999/xhtml}select': HtmlParser._parse_Xhtml_Select, 
+  '{http://www.w3.org/1999/xhtml}textarea': HtmlParser._parse_Xhtml_Textarea, 
+  '{http://www.w3.org/1999/xhtml}details': HtmlParser._parse_Xhtml_Details, 
+  '{http://www.w3.org/1999/xhtml}dialog': HtmlParser._parse_Xhtml_Dialog, 
+  '{http://www.w3.org/1999/xhtml}menu': HtmlParser._parse_Xhtml_Menu, 
+  '{http://www.w3.org/1999/xhtml}summary': HtmlParser._parse_Xhtml_Summary, 
+  '{http://www.w3.org/1999/xhtml}slot': HtmlParser._parse_Xhtml_Slot, 
+  '{http://www.w3.org/1999/xhtml}template': HtmlParser._parse_Xhtml_Template, 
+  '{http://www.w3.org/1999/xhtml}acronym': HtmlParser._parse_Xhtml_Acronym, 
+  '{http://www.w3.org/1999/xhtml}applet': HtmlParser._parse_Xhtml_Applet, 
+  '{http://www.w3.org/1999/xhtml}basefont': HtmlParser._parse_Xhtml_Basefont, 
+  '{http://www.w3.org/1999/xhtml}bgsound': HtmlParser._parse_Xhtml_Bgsound, 
+  '{http://www.w3.org/1999/xhtml}big': HtmlParser._parse_Xhtml_Big, 
+  '{http://www.w3.org/1999/xhtml}blink': HtmlParser._parse_Xhtml_Blink, 
+  '{http://www.w3.org/1999/xhtml}center': HtmlParser._parse_Xhtml_Center, 
+  '{http://www.w3.org/1999/xhtml}command': HtmlParser._parse_Xhtml_Command, 
+  '{http://www.w3.org/1999/xhtml}content': HtmlParser._parse_Xhtml_Content, 
+  '{http://www.w3.org/1999/xhtml}dir': HtmlParser._parse_Xhtml_Dir, 
+  '{http://www.w3.org/1999/xhtml}element': HtmlParser._parse_Xhtml_Element, 
+  '{http://www.w3.org/1999/xhtml}font': HtmlParser._parse_Xhtml_Font, 
+  '{http://www.w3.org/1999/xhtml}frame': HtmlParser._parse_Xhtml_Frame, 
+  '{http://www.w3.org/1999/xhtml}frameset': HtmlParser._parse_Xhtml_Frameset, 
+  '{http://www.w3.org/1999/xhtml}image': HtmlParser._parse_Xhtml_Image, 
+  '{http://www.w3.org/1999/xhtml}isindex': HtmlParser._parse_Xhtml_Isindex, 
+  '{http://www.w3.org/1999/xhtml}keygen': HtmlParser._parse_Xhtml_Keygen, 
+  '{http://www.w3.org/1999/xhtml}listing': HtmlParser._parse_Xhtml_Listing, 
+  '{http://www.w3.org/1999/xhtml}marquee': HtmlParser._parse_Xhtml_Marquee, 
+  '{http://www.w3.org/1999/xhtml}menuitem': HtmlParser._parse_Xhtml_Menuitem, 
+  '{http://www.w3.org/1999/xhtml}multicol': HtmlParser._parse_Xhtml_Multicol, 
+  '{http://www.w3.org/1999/xhtml}nextid': HtmlParser._parse_Xhtml_Nextid, 
+  '{http://www.w3.org/1999/xhtml}nobr': HtmlParser._parse_Xhtml_Nobr, 
+  '{http://www.w3.org/1999/xhtml}noembed': HtmlParser._parse_Xhtml_Noembed, 
+  '{http://www.w3.org/1999/xhtml}noframes': HtmlParser._parse_Xhtml_Noframes, 
+  '{http://www.w3.org/1999/xhtml}plaintext': HtmlParser._parse_Xhtml_Plaintext, 
+  '{http://www.w3.org/1999/xhtml}shadow': HtmlParser._parse_Xhtml_Shadow, 
+  '{http://www.w3.org/1999/xhtml}spacer': HtmlParser._parse_Xhtml_Spacer, 
+  '{http://www.w3.org/1999/xhtml}strike': HtmlParser._parse_Xhtml_Strike, 
+  '{http://www.w3.org/1999/xhtml}tt': HtmlParser._parse_Xhtml_Tt, 
+  '{http://www.w3.org/1999/xhtml}xmp': HtmlParser._parse_Xhtml_Xmp, 
+  '{http://www.w3.org/1999/xhtml}svg': HtmlParser._parse_Xhtml_Svg, 
+  '{http://www.w3.org/2000/svg}a': HtmlParser._parse_Svg_A, 
+  '{http://www.w3.org/2000/svg}animate': HtmlParser._parse_Svg_Animate, 
+  '{http://www.w3.org/2000/svg}animateMotion': HtmlParser._parse_Svg_AnimateMotion, 
+  '{http://www.w3.org/2000/svg}animateTransform': HtmlParser._parse_Svg_AnimateTransform, 
+  '{http://www.w3.org/2000/svg}circle': HtmlParser._parse_Svg_Circle, 
+  '{http://www.w3.org/2000/svg}clipPath': HtmlParser._parse_Svg_ClipPath, 
+  '{http://www.w3.org/2000/svg}color-profile': HtmlParser._parse_Svg_Colorprofile, 
+  '{http://www.w3.org/2000/svg}defs': HtmlParser._parse_Svg_Defs, 
+  '{http://www.w3.org/2000/svg}desc': HtmlParser._parse_Svg_Desc, 
+  '{http://www.w3.org/2000/svg}discard': HtmlParser._parse_Svg_Discard, 
+  '{http://www.w3.org/2000/svg}ellipse': HtmlParser._parse_Svg_Ellipse, 
+  '{http://www.w3.org/2000/svg}feBlend': HtmlParser._parse_Svg_FeBlend, 
+  '{http://www.w3.org/2000/svg}feColorMatrix': HtmlParser._parse_Svg_FeColorMatrix, 
+  '{http://www.w3.org/2000/svg}feComponentTransfer': HtmlParser._parse_Svg_FeComponentTransfer, 
+  '{http://www.w3.org/2000/svg}feComposite': HtmlParser._parse_Svg_FeComposite, 
+  '{http://www.w3.org/2000/svg}feConvolveMatrix': HtmlParser._parse_Svg_FeConvolveMatrix, 
+  '{http://www.w3.org/2000/svg}feDiffuseLighting': HtmlParser._parse_Svg_FeDiffuseLighting, 
+  '{http://www.w3.org/2000/svg}feDisplacementMap': HtmlParser._parse_Svg_FeDisplacementMap, 
+  '{http://www.w3.org/2000/svg}feDistantLight': HtmlParser._parse_Svg_FeDistantLight, 
+  '{http://www.w3.org/2000/svg}feDropShadow': HtmlParser._parse_Svg_FeDropShadow, 
+  '{http://www.w3.org/2000/svg}feFlood': HtmlParser._parse_Svg_FeFlood, 
+  '{http://www.w3.org/2000/svg}feFuncA': HtmlParser._parse_Svg_FeFuncA, 
+  '{http://www.w3.org/2000/svg}feFuncB': HtmlParser._parse_Svg_FeFuncB, 
+  '{http://www.w3.org/2000/svg}feFuncG': HtmlParser._parse_Svg_FeFuncG, 
+  '{http://www.w3.org/2000/svg}feFuncR': HtmlParser._parse_Svg_FeFuncR, 
+  '{http://www.w3.org/2000/svg}feGaussianBlur': HtmlParser._parse_Svg_FeGaussianBlur, 
+  '{http://www.w3.org/2000/svg}feImage': HtmlParser._parse_Svg_FeImage, 
+  '{http://www.w3.org/2000/svg}feMerge': HtmlParser._parse_Svg_FeMerge, 
+  '{http://www.w3.org/2000/svg}feMergeNode': HtmlParser._parse_Svg_FeMergeNode, 
+  '{http://www.w3.org/2000/svg}feMorphology': HtmlParser._parse_Svg_FeMorphology, 
+  '{http://www.w3.org/2000/svg}feOffset': HtmlParser._parse_Svg_FeOffset, 
+  '{http://www.w3.org/2000/svg}fePointLight': HtmlParser._parse_Svg_FePointLight, 
+  '{http://www.w3.org/2000/svg}feSpecularLighting': HtmlParser._parse_Svg_FeSpecularLighting, 
+  '{http://www.w3.org/2000/svg}feSpotLight': HtmlParser._parse_Svg_FeSpotLight, 
+  '{http://www.w3.org/2000/svg}feTile': HtmlParser._parse_Svg_FeTile, 
+  '{http://www.w3.org/2000/svg}feTurbulence': HtmlParser._parse_Svg_FeTurbulence, 
+  '{http://www.w3.org/2000/svg}filter': HtmlParser._parse_Svg_Filter, 
+  '{http://www.w3.org/2000/svg}foreignObject': HtmlParser._parse_Svg_ForeignObject, 
+  '{http://www.w3.org/2000/svg}g': HtmlParser._parse_Svg_G, 
+  '{http://www.w3.org/2000/svg}hatch': HtmlParser._parse_Svg_Hatch, 
+  '{http://www.w3.org/2000/svg}hatchpath': HtmlParser._parse_Svg_Hatchpath, 
+  '{http://www.w3.org/2000/svg}image': HtmlParser._parse_Svg_Image, 
+  '{http://www.w3.org/2000/svg}line': HtmlParser._parse_Svg_Line, 
+  '{http://www.w3.org/2000/svg}linearGradient': HtmlParser._parse_Svg_LinearGradient, 
+  '{http://www.w3.org/2000/svg}marker': HtmlParser._parse_Svg_Marker, 
+  '{http://www.w3.org/2000/svg}mask': HtmlParser._parse_Svg_Mask, 
+  '{http://www.w3.org/2000/svg}mesh': HtmlParser._parse_Svg_Mesh, 
+  '{http://www.w3.org/2000/svg}meshgradient': HtmlParser._parse_Svg_Meshgradient, 
+  '{http://www.w3.org/2000/svg}meshpatch': HtmlParser._parse_Svg_Meshpatch, 
+  '{http://www.w3.org/2000/svg}meshrow': HtmlParser._parse_Svg_Meshrow, 
+  '{http://www.w3.org/2000/svg}metadata': HtmlParser._parse_Svg_Metadata, 
+  '{http://www.w3.org/2000/svg}mpath': HtmlParser._parse_Svg_Mpath, 
+  '{http://www.w3.org/2000/svg}path': HtmlParser._parse_Svg_Path, 
+  '{http://www.w3.org/2000/svg}pattern': HtmlParser._parse_Svg_Pattern, 
+  '{http://www.w3.org/2000/svg}polygon': HtmlParser._parse_Svg_Polygon, 
+  '{http://www.w3.org/2000/svg}polyline': HtmlParser._parse_Svg_Polyline, 
+  '{http://www.w3.org/2000/svg}radialGradient': HtmlParser._parse_Svg_RadialGradient, 
+  '{http://www.w3.org/2000/svg}rect': HtmlParser._parse_Svg_Rect, 
+  '{http://www.w3.org/2000/svg}script': HtmlParser._parse_Svg_Script, 
+  '{http://www.w3.org/2000/svg}set': HtmlParser._parse_Svg_Set, 
+  '{http://www.w3.org/2000/svg}solidcolor': HtmlParser._parse_Svg_Solidcolor, 
+  '{http://www.w3.org/2000/svg}stop': HtmlParser._parse_Svg_Stop, 
+  '{http://www.w3.org/2000/svg}style': HtmlParser._parse_Svg_Style, 
+  '{http://www.w3.org/2000/svg}svg': HtmlParser._parse_Svg_Svg, 
+  '{http://www.w3.org/2000/svg}switch': HtmlParser._parse_Svg_Switch, 
+  '{http://www.w3.org/2000/svg}symbol': HtmlParser._parse_Svg_Symbol, 
+  '{http://www.w3.org/2000/svg}text': HtmlParser._parse_Svg_Text, 
+  '{http://www.w3.org/2000/svg}textPath': HtmlParser._parse_Svg_TextPath, 
+  '{http://www.w3.org/2000/svg}title': HtmlParser._parse_Svg_Title, 
+  '{http://www.w3.org/2000/svg}tspan': HtmlParser._parse_Svg_Tspan, 
+  '{http://www.w3.org/2000/svg}unknown': HtmlParser._parse_Svg_Unknown, 
+  '{http://www.w3.org/2000/svg}use': HtmlParser._parse_Svg_Use, 
+  '{http://www.w3.org/2000/svg}view': HtmlParser._parse_Svg_View, 
+  '{http://www.w3.org/1998/Math/MathML}math': HtmlParser._parse_MathML_Math, 
+  '{http://www.w3.org/1998/Math/MathML}maction': HtmlParser._parse_MathML_Maction, 
+  '{http://www.w3.org/1998/Math/MathML}maligngroup': HtmlParser._parse_MathML_Maligngroup, 
+  '{http://www.w3.org/1998/Math/MathML}malignmark': HtmlParser._parse_MathML_Malignmark, 
+  '{http://www.w3.org/1998/Math/MathML}menclose': HtmlParser._parse_MathML_Menclose, 
+  '{http://www.w3.org/1998/Math/MathML}merror': HtmlParser._parse_MathML_Merror, 
+  '{http://www.w3.org/1998/Math/MathML}mfenced': HtmlParser._parse_MathML_Mfenced, 
+  '{http://www.w3.org/1998/Math/MathML}mfrac': HtmlParser._parse_MathML_Mfrac, 
+  '{http://www.w3.org/1998/Math/MathML}mglyph': HtmlParser._parse_MathML_Mglyph, 
+  '{http://www.w3.org/1998/Math/MathML}mi': HtmlParser._parse_MathML_Mi, 
+  '{http://www.w3.org/1998/Math/MathML}mlabeledtr': HtmlParser._parse_MathML_Mlabeledtr, 
+  '{http://www.w3.org/1998/Math/MathML}mlongdiv': HtmlParser._parse_MathML_Mlongdiv, 
+  '{http://www.w3.org/1998/Math/MathML}mmultiscripts': HtmlParser._parse_MathML_Mmultiscripts, 
+  '{http://www.w3.org/1998/Math/MathML}mn': HtmlParser._parse_MathML_Mn, 
+  '{http://www.w3.org/1998/Math/MathML}mo': HtmlParser._parse_MathML_Mo, 
+  '{http://www.w3.org/1998/Math/MathML}mover': HtmlParser._parse_MathML_Mover, 
+  '{http://www.w3.org/1998/Math/MathML}mpadded': HtmlParser._parse_MathML_Mpadded, 
+  '{http://www.w3.org/1998/Math/MathML}mphantom': HtmlParser._parse_MathML_Mphantom, 
+  '{http://www.w3.org/1998/Math/MathML}mroot': HtmlParser._parse_MathML_Mroot, 
+  '{http://www.w3.org/1998/Math/MathML}mrow': HtmlParser._parse_MathML_Mrow, 
+  '{http://www.w3.org/1998/Math/MathML}ms': HtmlParser._parse_MathML_Ms, 
+  '{http://www.w3.org/1998/Math/MathML}mscarries': HtmlParser._parse_MathML_Mscarries, 
+  '{http://www.w3.org/1998/Math/MathML}mscarry': HtmlParser._parse_MathML_Mscarry, 
+  '{http://www.w3.org/1998/Math/MathML}msgroup': HtmlParser._parse_MathML_Msgroup, 
+  '{http://www.w3.org/1998/Math/MathML}msline': HtmlParser._parse_MathML_Msline, 
+  '{http://www.w3.org/1998/Math/MathML}mspace': HtmlParser._parse_MathML_Mspace, 
+  '{http://www.w3.org/1998/Math/MathML}msqrt': HtmlParser._parse_MathML_Msqrt, 
+  '{http://www.w3.org/1998/Math/MathML}msrow': HtmlParser._parse_MathML_Msrow, 
+  '{http://www.w3.org/1998/Math/MathML}mstack': HtmlParser._parse_MathML_Mstack, 
+  '{http://www.w3.org/1998/Math/MathML}mstyle': HtmlParser._parse_MathML_Mstyle, 
+  '{http://www.w3.org/1998/Math/MathML}msub': HtmlParser._parse_MathML_Msub, 
+  '{http://www.w3.org/1998/Math/MathML}msup': HtmlParser._parse_MathML_Msup, 
+  '{http://www.w3.org/1998/Math/MathML}msubsup': HtmlParser._parse_MathML_Msubsup, 
+  '{http://www.w3.org/1998/Math/MathML}mtable': HtmlParser._parse_MathML_Mtable, 
+  '{http://www.w3.org/1998/Math/MathML}mtd': HtmlParser._parse_MathML_Mtd, 
+  '{http://www.w3.org/1998/Math/MathML}mtext': HtmlParser._parse_MathML_Mtext, 
+  '{http://www.w3.org/1998/Math/MathML}mtr': HtmlParser._parse_MathML_Mtr, 
+  '{http://www.w3.org/1998/Math/MathML}munder': HtmlParser._parse_MathML_Munder, 
+  '{http://www.w3.org/1998/Math/MathML}munderover': HtmlParser._parse_MathML_Munderover, 
+  '{http://www.w3.org/1998/Math/MathML}semantics': HtmlParser._parse_MathML_Semantics, 
+  '{http://www.w3.org/1998/Math/MathML}annotation': HtmlParser._parse_MathML_Annotation, 
+  '{http://www.w3.org/1998/Math/MathML}annotation-xml': HtmlParser._parse_MathML_Annotationxml, 
+  '{http://www.w3.org/2000/xmlns}XML_DECL': HtmlParser._parse_Xmlns_XML_DECL, 
+})
+#[[[end]]]
+
+# Names of the HTML elements whose content HtmlParser(prune_ignored=True)
+# skips
+PRUNED_TAGS = frozenset(cls.name_ for cls in parsers.ast.IGNORED_NODES if cls.namespace_ == XHTML_NS)
+
+# Elements whose content can be an island (see AstTreeBuilder). They
+# start the svg and math scopes of MarkdownVisitor.
+ISLAND_ROOTS = frozenset([
+  parsers.ast.XhtmlSvgNode,
+  parsers.ast.SvgSvgNode,
+  parsers.ast.MathMLMathNode,
+])
+
+# Elements of an island that MarkdownVisitor renders as markup with
+# format_html_tag() in the svg and math scopes: those that are always
+# rendered as markup, nested scopes and title. Comments are markup too.
+ISLAND_CLASSES = parsers.ast.MARKUP_NODES | ISLAND_ROOTS | frozenset([parsers.ast.XhtmlTitleNode])
+
+# Entry of openElements for an element in an island
+ISLAND_ELEMENT = parsers.ast.Node()
+
+class AstTreeBuilder:
+  """
+  Tree builder for ETreeHTMLParser that creates ast.Node objects directly
+  instead of an ElementTree, producing the same tree as HtmlParser.parse_tree.
+  """
+  def __init__(self, attribute_key=None, xml_islands=False):
+    self.openElements = []
+    # Last element (attached or not) under each open element, used to
+    # place text in the tail of the previous sibling like ElementTree.
+    self.last_child_ = []
+    self.attribute_key_ = attribute_key
+    # With xml_islands the content of svg and math elements is kept as the
+    # events of an XmlIslandNode while it has only elements that are
+    # serialized back to markup, so no nodes are created for it. Island
+    # elements are ISLAND_ELEMENT in openElements.
+    self.xml_islands_ = xml_islands
+    self.island_root_ = None
+    self.island_classes_ = None
+    self.island_node_ = None
+    self.island_depth_ = 0
+    self.island_open_ = 0
+
+  def insertRoot(self, token):
+    self.openElements = [parsers.ast.Node()]
+    self.last_child_ = [None]
+
+  def getFragment(self):
+    self.sync_open_elements()
+    # Like html5lib, fails if the root was popped by unbalanced end tags
+    return self.openElements[0]
+
+  def sync_open_elements(self):
+    # ETreeHTMLParser pops openElements directly
+    del self.last_child_[len(self.openElements):]
+    if self.island_root_ is not None:
+      self.sync_island()
+
+  def create_node(self, tag):
+    cls = NODE_CLASSES.get(tag)
+    if cls is not None:
+      return cls()
+    if len(self.openElements) == 1:
+      # parse_tree skips unknown elements at the top level
+      return None
+    astnode = parsers.ast.Node()
+    astnode.name = tag.split('}')[-1]
+    astnode.namespace = tag.split('}')[-2][1:]
+    return astnode
+
+  def append_node(self, astnode, element):
+    self.sync_open_elements()
+    if astnode is not None:
+      self.openElements[-1].add_child(astnode)
+    self.last_child_[-1] = element
+
+  def insertElementNormal(self, token):
+    name = token["name"]
+    namespace = token.get("namespace", XHTML_NS)
+    if namespace is None:
+      tag = name
+    else:
+      tag = "{%s}%s" % (namespace, name)
+    attributes = token["data"]
+    attribute_key = self.attribute_key_
+    if attribute_key is not None and len(attributes) > 0:
+      attributes = {attribute_key(key): value for key, value in attributes.items()}
+    if self.island_root_ is not None:
+      self.sync_open_elements()
+      if self.island_root_ is not None:
+        if self.add_island_element(tag, attributes):
+          return ISLAND_ELEMENT
+        self.end_island()
+    return self.insert_element(tag, attributes)
+
+  def insert_element(self, tag, attributes):
+    astnode = self.create_node(tag)
+    element = astnode
+    if element is None:
+      # Placeholder that receives the content of a skipped element
+      element = parsers.ast.Node()
+    for key, value in attributes.items():
+      element.set_attribute(key, value)
+    self.append_node(astnode, element)
+    self.openElements.append(element)
+    self.last_child_.append(None)
+    if self.xml_islands_:
+      if type(astnode) in ISLAND_ROOTS:
+        self.start_island(astnode, ISLAND_CLASSES)
+      elif type(astnode) is parsers.ast.Node and astnode.name_ == 'math':
+        # MathML without a namespace is rendered like unknown elements,
+        # outside of the math scope
+        self.start_island(astnode, parsers.ast.MARKUP_NODES)
+    return element
+
+  def insertComment(self, token, parent=None):
+    if self.island_root_ is not None:
+      self.sync_open_elements()
+      if self.island_root_ is not None:
+        if self.island_classes_ is ISLAND_CLASSES:
+          self.island_events().append((None, token["data"]))
+          return None
+        self.end_island()
+    astnode = parsers.ast.XhtmlCommentNode()
+    astnode.text = token["data"]
+    self.append_node(astnode, astnode)
+    return astnode
+
+  def set_source_span(self, element, start, end):
+    if element is not None and element is not ISLAND_ELEMENT:
+      element.set_source_span(start, end)
+
+  def insertText(self, data, parent=None):
+    self.sync_open_elements()
+    if self.island_node_ is not None:
+      self.island_node_.events_.append(data)
+      return
+    last_child = self.last_child_[-1]
+    if last_child is not None:
+      if not last_child.tail:
+        last_child.tail = ""
+      last_child.tail += data
+    elif len(self.openElements) > 1:
+      element = self.openElements[-1]
+      if not element.text:
+        element.text = ""
+      element.text += data
+
+  def start_island(self, root, island_classes):
+    self.island_root_ = root
+    self.island_classes_ = island_classes
+    self.island_node_ = None
+    self.island_depth_ = len(self.openElements)
+    self.island_open_ = 0
+
+  def island_events(self):
+    if self.island_node_ is None:
+      self.island_node_ = parsers.ast.XmlIslandNode()
+      self.island_root_.add_child(self.island_node_)
+    return self.island_node_.events_
+
+  def sync_island(self):
+    # Ends the island elements (and the island) popped by the parser
+    depth = len(self.openElements)
+    while self.island_open_ > 0 and depth < self.island_depth_ + self.island_open_:
+      self.island_node_.events_.append(None)
+      self.island_open_ -= 1
+    if depth < self.island_depth_:
+      self.island_root_ = None
+      self.island_node_ = None
+
+  def add_island_element(self, tag, attributes):
+    # Returns False for an element that is not only serialized back to
+    # markup in an island
+    cls = NODE_CLASSES.get(tag)
+    if cls is None:
+      name = tag.split('}')[-1]
+    elif cls in self.island_classes_:
+      name = cls.name_
+    else:
+      return False
+    self.island_events().append((name, attributes, tag))
+    self.openElements.append(ISLAND_ELEMENT)
+    self.last_child_.append(None)
+    self.island_open_ += 1
+    return True
+
+  def end_island(self):
+    # Replaces the island with nodes for an element that renders as
+    # markdown (e.g. a link), replaying its events
+    root = self.island_root_
+    node = self.island_node_
+    depth = self.island_depth_
+    self.island_root_ = None
+    self.island_node_ = None
+    if node is None:
+      return
+    root.children_ = parsers.ast.EMPTY_CHILDREN
+    del self.openElements[depth:]
+    del self.last_child_[depth:]
+    self.last_child_[-1] = None
+    xml_islands = self.xml_islands_
+    self.xml_islands_ = False
+    for event in node.events_:
+      if event is None:
+        self.openElements.pop()
+      elif type(event) is str:
+        self.insertText(event)
+      elif event[0] is None:
+        self.insertComment({"data": event[1]})
+      else:
+        self.insert_element(event[2], event[1])
+    self.xml_islands_ = xml_islands
@@ -0,0 +1,155 @@
+import time
+
+from .ast import MarkdownVisitor
+
+#
+# MIT License
+#
+# https://opensource.org/licenses/MIT
+#
+# Copyright 2020 Rene Sugar
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Prefixes of the MarkdownVisitor helpers called by the tag handlers
+HELPER_PREFIXES = ('format_', 'preclose_', 'post_')
+
+class TagProfile(object):
+  """
+  Cost of rendering by ast node class and by MarkdownVisitor helper,
+  accumulated over any number of conversions. Each entry has the number
+  of calls, the inclusive time (with the children of the node), the
+  exclusive time (only its own handlers) in seconds, and the number of
+  characters written (or returned, for helpers).
+  """
+  def __init__(self, entries=None):
+    # {name: [calls, inclusive, exclusive, chars]}
+    self.entries_ = {}
+    if entries is not None:
+      self.merge(entries)
+
+  def add(self, name, inclusive, exclusive, chars):
+    entry = self.entries_.get(name)
+    if entry is None:
+      self.entries_[name] = [1, inclusive, exclusive, chars]
+    else:
+      entry[0] += 1
+      entry[1] += inclusive
+      entry[2] += exclusive
+      entry[3] += chars
+
+  def merge(self, other):
+    # Adds the entries of another TagProfile or of its as_dict()
+    if isinstance(other, TagProfile):
+      other = other.entries_
+    for name, (calls, inclusive, exclusive, chars) in other.items():
+      entry = self.entries_.get(name)
+      if entry is None:
+        self.entries_[name] = [calls, inclusive, exclusive, chars]
+      else:
+        entry[0] += calls
+        entry[1] += inclusive
+        entry[2] += exclusive
+        entry[3] += chars
+
+  def as_dict(self):
+    # Plain lists, to return a profile from a worker process
+    return {name: list(entry) for name, entry in self.entries_.items()}
+
+  def report(self, limit=None, sort='exclusive'):
+    """
+    Returns a table of the entries, most expensive first by sort
+    ('calls', 'inclusive', 'exclusive' or 'chars').
+    """
+    column = ['calls', 'inclusive', 'exclusive', 'chars'].index(sort)
+    entries = sorted(self.entries_.items(), key=lambda item: (-item[1][column], item[0]))
+    if limit is not None:
+      entries = entries[:limit]
+    lines = ["%-36s %10s %12s %12s %12s" % ("name", "calls", "inclusive s", "exclusive s", "chars")]
+    for name, (calls, inclusive, exclusive, chars) in entries:
+      lines.append("%-36s %10d %12.6f %12.6f %12d" % (name, calls, inclusive, exclusive, chars))
+    return "\n".join(lines)
+
+  @property
+  def entries(self):
+    return self.entries_
+
+  def __len__(self):
+    return len(self.entries_)
+
+class ProfilingMarkdownVisitor(MarkdownVisitor):
+  """
+  MarkdownVisitor that records the cost of each node class and helper in
+  a TagProfile. The markdown is the same as with MarkdownVisitor.
+  """
+  def __init__(self, profile=None, sink=None, encoding=None):
+    MarkdownVisitor.__init__(self, sink, encoding)
+    if profile is None:
+      profile = TagProfile()
+    self.profile_ = profile
+    self.chars_written_ = 0
+    for name in dir(MarkdownVisitor):
+      if name.startswith(HELPER_PREFIXES):
+        setattr(self, name, self.profile_helper(name, getattr(self, name)))
+
+  def profile_helper(self, name, method):
+    profile = self.profile_
+    def helper(*args):
+      chars = self.chars_written_
+      start = time.perf_counter()
+      result = method(*args)
+      elapsed = time.perf_counter() - start
+      chars = self.chars_written_ - chars
+      if isinstance(result, str):
+        chars += len(result)
+      elif isinstance(result, tuple):
+        chars += sum(len(s) for s in result if isinstance(s, str))
+      profile.add(name, elapsed, elapsed, chars)
+      return result
+    return helper
+
+  def write_data(self, data=''):
+    if data is None:
+      return
+    self.chars_written_ += len(data)
+    self.data_[-1].write(data)
+
+  def visit_enter(self, node):
+    chars = self.chars_written_
+    start = time.perf_counter()
+    state = MarkdownVisitor.visit_enter(self, node)
+    end = time.perf_counter()
+    if state is None:
+      self.profile_.add(type(node).__name__, end - start, end - start, self.chars_written_ - chars)
+      return None
+    # The exit handler adds its own time and output to these
+    return (state, start, end - start, chars, self.chars_written_ - chars)
+
+  def visit_exit(self, node, state):
+    state, enter_start, enter_time, enter_chars, own_chars = state
+    chars = self.chars_written_
+    start = time.perf_counter()
+    MarkdownVisitor.visit_exit(self, node, state)
+    end = time.perf_counter()
+    own_chars += self.chars_written_ - chars
+    self.profile_.add(type(node).__name__, end - enter_start, enter_time + end - start, own_chars)
+
+  @property
+  def profile(self):
+    return self.profile_
@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 
 import inspect
+from types import MethodType
 
 __all__ = ['on', 'when']
 
@@ -32,6 +33,8 @@ def on(param_name):
 
 
 def when(param_type):
+  # Prefer @<dispatcher>.when(param_type), which does not inspect the
+  # caller's frame to find the dispatcher
   def f(fn):
     frame = inspect.currentframe().f_back
     func_name = fn.func_name if 'func_name' in dir(fn) else fn.__name__
@@ -39,34 +42,56 @@ def when(param_type):
     if not isinstance(dispatcher, Dispatcher):
       dispatcher = dispatcher.dispatcher
     dispatcher.add_target(param_type, fn)
-    def ff(*args, **kw):
-      return dispatcher(*args, **kw)
-    ff.dispatcher = dispatcher
-    return ff
+    return dispatcher
   return f
 
 
 class Dispatcher(object):
   def __init__(self, param_name, fn):
-    frame = inspect.currentframe().f_back.f_back
-    top_level = frame.f_locals == frame.f_globals
     self.param_index = self.__argspec(fn).args.index(param_name)
     self.param_name = param_name
     self.targets = {}
+    # Target resolved for each class seen, including subclasses
+    self.cache = {}
+
+  def __get__(self, obj, objtype=None):
+    # Bind like a function so the dispatcher can be used as a method
+    if obj is None:
+      return self
+    return MethodType(self, obj)
 
   def __call__(self, *args, **kw):
     typ = args[self.param_index].__class__
-    d = self.targets.get(typ)
-    if d is not None:
-      return d(*args, **kw)
+    d = self.cache.get(typ)
+    if d is None:
+      d = self.resolve(typ)
+    return d(*args, **kw)
+
+  def resolve(self, typ):
+    # The closest class in the MRO with a target wins
+    t = self.targets
+    for k in typ.__mro__:
+      d = t.get(k)
+      if d is not None:
+        break
     else:
-      issub = issubclass
-      t = self.targets
-      ks = iter(t)
-      return [t[k](*args, **kw) for k in ks if issub(typ, k)]
+      d = self.no_target
+    self.cache[typ] = d
+    return d
+
+  @staticmethod
+  def no_target(*args, **kw):
+    return []
+
+  def when(self, param_type):
+    def f(fn):
+      self.add_target(param_type, fn)
+      return self
+    return f
 
   def add_target(self, typ, target):
     self.targets[typ] = target
+    self.cache.clear()
 
   @staticmethod
   def __argspec(fn):
@@ -74,7 +74,7 @@ setup(
   keywords = "markdown HTML converter ast",
   platforms=["any"],
   namespace_packages=['html2txt'],
-  packages=find_packages(),
+  packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
   requires = [],
   install_requires=install_requires,
   tests_require=tests_require,
@@ -0,0 +1,129 @@
+import time
+import asyncio
+import threading
+import pytest
+from html2txt import converters
+from html2txt.converters import asyncconverter
+
+html = '<h1>Title</h1><p>Some <b>bold</b> text</p>'
+
+def run(coroutine):
+  loop = asyncio.new_event_loop()
+  try:
+    return loop.run_until_complete(coroutine)
+  finally:
+    loop.close()
+
+def test_convert():
+  async def main():
+    async with converters.AsyncHtml2Markdown(max_workers=2) as converter:
+      results = await asyncio.gather(*[converter.convert(html) for i in range(10)])
+      return results, converter.stats()
+  results, stats = run(main())
+  assert results == [converters.Html2Markdown().convert(html)] * 10
+  assert stats['completed'] == 10
+  assert stats['in_flight'] == 0 and stats['waiting'] == 0
+
+def test_convert_in_processes():
+  async def main():
+    async with converters.AsyncHtml2Markdown(max_workers=2, processes=True) as converter:
+      return await converter.convert(html)
+  assert run(main()) == converters.Html2Markdown().convert(html)
+
+def test_max_in_flight(monkeypatch):
+  lock = threading.Lock()
+  running = [0, 0]
+  def slow_convert(settings, data):
+    with lock:
+      running[0] += 1
+      running[1] = max(running[1], running[0])
+    time.sleep(0.02)
+    with lock:
+      running[0] -= 1
+    return data
+  monkeypatch.setattr(asyncconverter, 'run_convert', slow_convert)
+  async def main():
+    converter = converters.AsyncHtml2Markdown(max_workers=8, max_in_flight=2)
+    tasks = [asyncio.ensure_future(converter.convert(str(i))) for i in range(8)]
+    await asyncio.sleep(0.01)
+    waiting = converter.waiting
+    results = await asyncio.gather(*tasks)
+    converter.shutdown()
+    return results, waiting
+  results, waiting = run(main())
+  assert results == [str(i) for i in range(8)]
+  assert running[1] == 2
+  assert waiting == 6
+
+def test_timeout_keeps_slot_until_job_ends(monkeypatch):
+  release = threading.Event()
+  def blocked_convert(settings, data):
+    release.wait(5)
+    return data
+  monkeypatch.setattr(asyncconverter, 'run_convert', blocked_convert)
+  async def main():
+    converter = converters.AsyncHtml2Markdown(max_workers=2, max_in_flight=1)
+    with pytest.raises(asyncio.TimeoutError):
+      await converter.convert('a', timeout=0.05)
+    assert converter.timed_out == 1
+    assert converter.in_flight == 1
+    release.set()
+    result = await converter.convert('b', timeout=5)
+    converter.shutdown()
+    return result, converter.in_flight
+  assert run(main()) == ('b', 0)
+
+def test_errors_are_counted():
+  async def main():
+    converter = converters.AsyncHtml2Markdown(max_workers=1)
+    with pytest.raises(IndexError):
+      # Unbalanced end tags close the root like in Html2Markdown
+      await converter.convert('<p>a</p></div>')
+    converter.shutdown()
+    return converter.stats()
+  stats = run(main())
+  assert stats['failed'] == 1 and stats['in_flight'] == 0
+
+def test_cancel_waiting_call(monkeypatch):
+  release = threading.Event()
+  def blocked_convert(settings, data):
+    release.wait(5)
+    return data
+  monkeypatch.setattr(asyncconverter, 'run_convert', blocked_convert)
+  async def main():
+    converter = converters.AsyncHtml2Markdown(max_workers=1, max_in_flight=1)
+    first = asyncio.ensure_future(converter.convert('a'))
+    second = asyncio.ensure_future(converter.convert('b'))
+    await asyncio.sleep(0.01)
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+      await second
+    release.set()
+    result = await first
+    converter.shutdown()
+    return result, converter.stats()
+  result, stats = run(main())
+  assert result == 'a'
+  assert stats['cancelled'] == 1 and stats['completed'] == 1 and stats['waiting'] == 0
+
+def test_job_ends_after_loop_closed(monkeypatch):
+  started = threading.Event()
+  release = threading.Event()
+  def blocked_convert(settings, data):
+    started.set()
+    release.wait(5)
+    return data
+  monkeypatch.setattr(asyncconverter, 'run_convert', blocked_convert)
+  converter = converters.AsyncHtml2Markdown(max_workers=1)
+  async def main():
+    task = asyncio.ensure_future(converter.convert('a'))
+    while not started.is_set():
+      await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+      await task
+  run(main())
+  assert converter.in_flight == 1
+  release.set()
+  converter.shutdown()
+  assert converter.in_flight == 0
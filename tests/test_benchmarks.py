@@ -0,0 +1,30 @@
+import os
+import json
+from benchmarks import suite
+from html2txt import converters
+
+def test_suite_writes_results(tmp_path):
+  output = str(tmp_path / 'results.json')
+  path = os.path.join(os.path.dirname(__file__))
+  assert suite.main(['--path', path, '--corpus', 'html2txt', '--repeat', '1', '--output', output]) == 0
+  with open(output) as f:
+    results = json.load(f)
+  result = results['corpora']['html2txt']
+  assert result['documents'] > 0 and result['errors'] == 0
+  assert set(result['phases']) == set(suite.PHASES)
+  assert result['phases']['total']['peak_mb'] > 0
+  # Html2Markdown() parses with the options of the 'defaults' configuration
+  defaults = results['corpora']['html2txt+defaults']
+  assert defaults['documents'] == result['documents'] and defaults['errors'] == 0
+  parser = converters.Html2Markdown().parser_
+  options = dict(suite.CONFIGURATIONS)['defaults']
+  assert all(getattr(parser, name + '_') == value for name, value in options.items())
+  # The results compare equal to themselves
+  assert suite.main(['--path', path, '--corpus', 'html2txt', '--repeat', '1', '--no-memory', '--baseline', output, '--threshold', '1000']) == 0
+
+def test_compare_flags_regressions():
+  baseline = {'corpora': {'a': {'phases': {'parse': {'seconds': 1.0, 'p50_ms': 2.0, 'mb_per_s': 10.0}}}}}
+  results = {'corpora': {'a': {'phases': {'parse': {'seconds': 1.05, 'p50_ms': 3.0, 'mb_per_s': 1.0}}},
+                         'b': {'phases': {'parse': {'seconds': 9.0}}}}}
+  assert suite.compare(results, baseline, 0.1) == [('a', 'parse', 'p50_ms', 2.0, 3.0)]
+  assert suite.compare(results, baseline, 0.6) == []
@@ -0,0 +1,48 @@
+import pytest
+from html2txt import converters
+from html2txt import parsers
+
+def email_thread(depth, lines=3):
+  # Each reply quotes the previous one
+  html = ''
+  for level in range(depth):
+    body = '<br>'.join('reply %d line %d' % (level, line) for line in range(lines))
+    html = '<p>%s</p><blockquote>%s</blockquote>' % (body, html)
+  return '<div>%s</div>' % (html,)
+
+def render_nested(html):
+  # Renders every blockquote by re-quoting the lines of its nested ones
+  m = parsers.MarkdownVisitor()
+  render = parsers.QuoteBuffer.render
+  parsers.QuoteBuffer.render = parsers.QuoteBuffer.render_nested
+  try:
+    m.visit(parsers.HtmlParser().parse(html))
+  finally:
+    parsers.QuoteBuffer.render = render
+  return m.text
+
+@pytest.mark.parametrize("depth", [1, 2, 5, 20, 50])
+def test_email_thread(depth):
+  html = email_thread(depth)
+  assert converters.Html2Markdown().convert(html) == render_nested(html)
+
+@pytest.mark.parametrize("html", [
+  '<blockquote>a<blockquote>b\nc</blockquote>d</blockquote>',
+  '<blockquote><blockquote></blockquote>x</blockquote>',
+  '<blockquote>a\r\nb<blockquote>c\rd</blockquote>\x0ce</blockquote>',
+  '<blockquote><pre>a<blockquote>b</blockquote></pre></blockquote>',
+])
+def test_line_breaks(html):
+  assert converters.Html2Markdown().convert(html) == render_nested(html)
+
+def test_quote_buffer_parts():
+  quote = parsers.QuoteBuffer()
+  quote.write('a\nb')
+  nested = parsers.QuoteBuffer()
+  nested.write('c')
+  nested.depth_ = 2
+  quote.add_quote(nested)
+  quote.depth_ = 1
+  assert quote.getvalue() == 'a\nb>>c\n'
+  assert quote.render() == '>a\n>b>>c\n'
+  assert quote.render() == quote.render_nested()
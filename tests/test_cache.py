@@ -0,0 +1,69 @@
+import os
+from html2txt import converters
+
+def test_memory_cache_hits_and_misses():
+  cache = converters.ConversionCache(max_entries=2)
+  h = converters.Html2Markdown(cache=cache)
+  expected = converters.Html2Markdown().convert('<p>one</p>')
+  assert h.convert('<p>one</p>') == expected
+  assert h.convert('<p>one</p>') == expected
+  assert (h.cache_hits, h.cache_misses) == (1, 1)
+
+def test_memory_cache_evicts_least_recently_used():
+  cache = converters.ConversionCache(max_entries=2)
+  h = converters.Html2Markdown(cache=cache)
+  h.convert('<p>one</p>')
+  h.convert('<p>two</p>')
+  h.convert('<p>one</p>')
+  h.convert('<p>three</p>')
+  assert len(cache) == 2
+  h.convert('<p>two</p>')
+  assert (h.cache_hits, h.cache_misses) == (1, 4)
+
+def test_cache_key_includes_settings():
+  cache = converters.ConversionCache()
+  html = '<p>line</p>'
+  unix = converters.Html2Markdown(newline_char='\n', cache=cache).convert(html)
+  windows = converters.Html2Markdown(newline_char='\r\n', cache=cache).convert(html)
+  assert cache.misses == 2
+  assert windows == converters.Html2Markdown(newline_char='\r\n').convert(html)
+  assert unix == converters.Html2Markdown(newline_char='\n').convert(html)
+
+def test_disk_cache_is_shared(tmp_path):
+  html = '<h1>Title</h1><p>text\r\nwith\rline ends</p>'
+  expected = converters.Html2Markdown().convert(html)
+  h = converters.Html2Markdown(cache=converters.ConversionCache(path=str(tmp_path)))
+  assert h.convert(html) == expected
+  h = converters.Html2Markdown(cache=converters.ConversionCache(path=str(tmp_path)))
+  assert h.convert(html) == expected
+  assert (h.cache_hits, h.cache_misses) == (1, 0)
+
+def test_disk_cache_is_size_bounded(tmp_path):
+  cache = converters.ConversionCache(max_entries=1, path=str(tmp_path), max_disk_bytes=4096)
+  h = converters.Html2Markdown(cache=cache)
+  for i in range(100):
+    h.convert('<p>%s</p>' % ('x%d' % (i,) * 20,))
+  size = sum(os.path.getsize(os.path.join(path, x)) for path, subdirs, files in os.walk(str(tmp_path)) for x in files)
+  assert size <= 4096
+
+def test_disk_cache_overwrite_and_stale_files(tmp_path):
+  # The cache is full with three entries, so overwriting one must not
+  # evict the others
+  def entries():
+    return sorted((x, os.path.getsize(os.path.join(path, x))) for path, subdirs, files in os.walk(str(tmp_path)) for x in files)
+  cache = converters.ConversionCache(max_entries=1, path=str(tmp_path), max_disk_bytes=300)
+  for key in ['ab', 'cd', 'ef']:
+    cache.put(key, 'x' * 100)
+  for i in range(2):
+    cache.put('ef', 'y' * 100)
+  assert entries() == [('ab.md', 100), ('cd.md', 100), ('ef.md', 100)]
+  stale = os.path.join(str(tmp_path), 'ab', 'ab.md.tmp')
+  recent = os.path.join(str(tmp_path), 'cd', 'cd.md.tmp')
+  for filename in [stale, recent]:
+    with open(filename, 'w') as f:
+      f.write('partial')
+  os.utime(stale, (0, 0))
+  cache = converters.ConversionCache(max_entries=1, path=str(tmp_path), max_disk_bytes=300)
+  assert entries() == [('ab.md', 100), ('cd.md', 100), ('cd.md.tmp', 7), ('ef.md', 100)]
+  cache.put('ef', 'z' * 100)
+  assert [cache.get(key) for key in ['ab', 'cd', 'ef']] == ['x' * 100, 'x' * 100, 'z' * 100]
@@ -0,0 +1,70 @@
+import pytest
+from html2txt import parsers
+from html2txt import converters
+
+documents = [
+  '<p>Hello <b>world</b> tail</p> more',
+  '<ul><li>one<!-- note --> after</li><li>two</li></ul>',
+  '<div><custom-tag a="1">x</custom-tag>y</div>',
+  '<custom-tag>skipped <b>bold</b></custom-tag><p>kept</p>',
+  '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"><use xlink:href="#a"/></svg>',
+  '<html><body><h1>Title</h1><section><p>a</p><table><tr><td>1</td><td>2</td></tr></table></section>text</body></html>',
+]
+
+def dump(node):
+  return (type(node).__name__, node.name, node.namespace, list(node.attributes.items()),
+          node.text, node.tail, [dump(child) for child in node.children])
+
+def walk(node):
+  stack = [node]
+  while len(stack) > 0:
+    node = stack.pop()
+    yield node
+    stack.extend(reversed(node.children))
+
+@pytest.mark.parametrize("html", documents)
+def test_materialize_matches_parse(html):
+  tree = parsers.HtmlParser().parse_columnar(html)
+  assert dump(tree.materialize()) == dump(parsers.HtmlParser().parse(html))
+
+@pytest.mark.parametrize("html", documents)
+def test_convert_matches(html):
+  assert converters.Html2Markdown(columnar=True).convert(html) == converters.Html2Markdown().convert(html)
+
+def test_count_find():
+  html = documents[-1]
+  tree = parsers.HtmlParser().parse_columnar(html)
+  nodes = list(walk(parsers.HtmlParser().parse(html)))
+  assert tree.count() == len(nodes)
+  assert tree.count(parsers.XhtmlTdNode) == 2
+  assert [tree.text(i) for i in tree.find(parsers.XhtmlTdNode)] == ['1', '2']
+  assert [tree.tag(i) for i in tree.find(parsers.XhtmlH1Node)] == ['{http://www.w3.org/1999/xhtml}h1']
+
+def test_prune():
+  html = '<div><p>a</p><table><tr><td>1</td></tr></table>tail<p>b</p></div>'
+  tree = parsers.HtmlParser().parse_columnar(html)
+  assert tree.prune(parsers.XhtmlTableNode) == 3
+  assert tree.count(parsers.XhtmlTdNode) == 0
+  div = tree.find(parsers.XhtmlDivNode)[0]
+  assert [tree.name(i) for i in tree.children(div)] == ['p', 'p']
+  assert [child.name for child in tree.materialize(div).children] == ['p', 'p']
+
+def test_unbalanced_end_tag():
+  with pytest.raises(IndexError):
+    parsers.HtmlParser().parse_columnar('<p>a</p></div>')
+
+def test_text_is_interned_once():
+  builder = parsers.ColumnarTreeBuilder(parsers.NODE_CLASSES)
+  builder.insertRoot({"name": "DOCUMENT_ROOT", "data": {}})
+  p = builder.insertElementNormal({"name": "p", "data": {}})
+  for i in range(100):
+    builder.insertText('x')
+  builder.insertElementNormal({"name": "b", "data": {}})
+  builder.insertText('bold')
+  builder.openElements.pop()
+  builder.insertText('t')
+  builder.insertText('ail')
+  tree = builder.getFragment()
+  assert tree.text(p) == 'x' * 100
+  assert tree.tail(p + 1) == 'tail'
+  assert sorted(tree.strings_) == sorted(['x' * 100, 'bold', 'tail'])
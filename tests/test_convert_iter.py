@@ -0,0 +1,32 @@
+import pytest
+from html2txt import converters
+
+documents = [
+  '<html><head><title>T</title></head><body><h1>Title</h1><p>One &amp;ouml; two</p>\n<ul><li>a</li><li>b</li></ul>tail</body></html>',
+  '<main><article><section><p>x</p><blockquote><p>quoted</p></blockquote></section>after</article></main>',
+  '<table><tr><th>h</th></tr><tr><td>c</td></tr></table><pre><code>a &lt; b</code></pre>',
+  '<p>text <custom-tag a="1">inner</custom-tag> more</p><!-- comment -->',
+]
+
+@pytest.mark.parametrize("html", documents)
+@pytest.mark.parametrize("size", [1, 3, 16, 1024])
+def test_convert_iter_matches_convert(html, size):
+  chunks = [html[i:i + size] for i in range(0, len(html), size)]
+  expected = converters.Html2Markdown().convert(html)
+  assert ''.join(converters.Html2Markdown().convert_iter(chunks)) == expected
+
+def test_convert_iter_releases_completed_blocks():
+  blocks = ['<p>paragraph %d</p>\n' % (i,) for i in range(1000)]
+  h = converters.Html2Markdown()
+  def chunks():
+    yield '<html><body><main>'
+    for block in blocks:
+      yield block
+      # Only the open path and the last block are kept
+      main = h.root.children[0].children[0].children[0]
+      assert len(main.children) <= 2
+    yield '</main></body></html>'
+  output = list(h.convert_iter(chunks()))
+  assert len(output) >= 1000
+  html = '<html><body><main>' + ''.join(blocks) + '</main></body></html>'
+  assert ''.join(output) == converters.Html2Markdown().convert(html)
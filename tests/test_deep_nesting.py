@@ -0,0 +1,38 @@
+from html2txt import converters
+from html2txt import parsers
+from html2txt.parsers.etreehtmlparser import ETreeHTMLParser
+
+DEPTH = 100000
+
+def nested(tag, depth, text):
+  return ('<%s>' % (tag,)) * depth + text + ('</%s>' % (tag,)) * depth
+
+def test_convert_deep_nesting():
+  html = nested('div', DEPTH, 'deep') + '<p>after</p>'
+  md = converters.Html2Markdown().convert(html)
+  assert 'deep' in md
+  assert md.endswith('after\n')
+
+def test_convert_deep_blockquotes():
+  html = nested('blockquote', 200, '<p>quoted</p>')
+  md = converters.Html2Markdown().convert(html)
+  assert '>' * 200 + 'quoted' in md
+
+def test_convert_iter_deep_nesting():
+  html = nested('section', DEPTH, '<p>deep</p>') + '<p>after</p>'
+  chunks = [html[i:i + 65536] for i in range(0, len(html), 65536)]
+  md = ''.join(converters.Html2Markdown().convert_iter(chunks))
+  assert md == converters.Html2Markdown().convert(html)
+
+def test_parse_tree_deep_nesting():
+  etree_parser = ETreeHTMLParser()
+  etree_parser.feed(nested('span', DEPTH, 'deep'))
+  p = parsers.HtmlParser()
+  p.namespace_map_ = etree_parser.namespace_uri_map()
+  node = p.parse_tree(etree_parser.getFragment())
+  depth = 0
+  while len(node.children) > 0:
+    node = node.children[0]
+    depth += 1
+  assert depth == DEPTH
+  assert node.text == 'deep'
@@ -0,0 +1,28 @@
+import pytest
+from html2txt.parsers.etreehtmlparser import ETreeHTMLParser, parse_starttag
+
+starttags = [
+  '<p>',
+  '<br/>',
+  '<DIV CLASS="Row">',
+  '<a href="/x?a=1&amp;b=2" title=\'say "hi"\'>',
+  '<p title="a\r\nb\tc <d>">',
+  '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 10 10">',
+  '<use xlink:href="#a" svg:x="1" xml:lang="en"/>',
+  '<math xmlns="http://www.w3.org/1998/Math/MathML" mathml:display="block">',
+  '<x xmlns="urn:example" example:y="1">',
+]
+
+@pytest.mark.parametrize("starttag_text", starttags)
+def test_parse_starttag_matches_xml_parser(starttag_text):
+  tag, attribs = ETreeHTMLParser().parse_starttag_xml(starttag_text)
+  assert parse_starttag(starttag_text) == (tag, dict(attribs))
+
+@pytest.mark.parametrize("starttag_text", [
+  '<input type="checkbox" checked>',
+  '<a href=foo>',
+  '<a b="1" b="2">',
+  '<a xmlns_b="1">',
+])
+def test_parse_starttag_falls_back(starttag_text):
+  assert parse_starttag(starttag_text) is None
@@ -0,0 +1,47 @@
+import pytest
+from html2txt import parsers
+from html2txt import converters
+
+PARAGRAPH = '<p>' + 'Some words of the article, with enough text to count as a paragraph. ' * 3 + '</p>'
+
+PAGE = ('<html><body><div id="nav-bar"><a href="/">Home</a> <a href="/about">About</a></div>'
+        '<div class="cookie-banner"><p>We use cookies to make this site work, please accept them.</p></div>'
+        '<div class="wrapper"><h1>Title</h1>' + PARAGRAPH * 3 + '</div>'
+        '<footer><p>Copyright and a long list of links that nobody reads at all.</p></footer></body></html>')
+
+def test_selectors():
+  html = '<div>menu</div><main id="m"><h1>Title</h1><p>text</p></main>tail<div>footer</div>'
+  root = parsers.ContentExtractor(min_chars=1).extract(parsers.HtmlParser().parse(html))
+  main, = root.children
+  assert (main.name, main.tail) == ('main', None)
+  h = converters.Html2Markdown(extractor=parsers.ContentExtractor('#m', min_chars=1))
+  assert h.convert(html) == converters.Html2Markdown().convert('<main><h1>Title</h1><p>text</p></main>')
+
+def test_parse_selectors():
+  assert parsers.parse_selectors('main, div#a.b.c[role=main][hidden]') == [
+    ('main', [], [], []),
+    ('div', ['a'], ['b', 'c'], [('role', 'main'), ('hidden', None)]),
+  ]
+  with pytest.raises(ValueError):
+    parsers.parse_selectors('div > p')
+
+def test_text_density():
+  h = converters.Html2Markdown(extractor=parsers.ContentExtractor())
+  text = h.convert(PAGE)
+  assert h.root.children[0].attribute('class') == 'wrapper'
+  assert 'Title' in text and 'cookies' not in text and 'Home' not in text and 'Copyright' not in text
+  assert len(text) < len(converters.Html2Markdown().convert(PAGE))
+
+def test_nothing_found():
+  html = '<p>short</p>'
+  h = converters.Html2Markdown(extractor=parsers.ContentExtractor())
+  assert h.convert(html) == converters.Html2Markdown().convert(html)
+
+def test_columnar_and_cache():
+  extractor = parsers.ContentExtractor()
+  expected = converters.Html2Markdown(extractor=extractor).convert(PAGE)
+  assert converters.Html2Markdown(extractor=extractor, columnar=True).convert(PAGE) == expected
+  assert ''.join(converters.Html2Markdown(extractor=extractor).convert_iter([PAGE[:50], PAGE[50:]])) == expected
+  cache = converters.ConversionCache()
+  assert converters.Html2Markdown(cache=cache).convert(PAGE) != expected
+  assert converters.Html2Markdown(cache=cache, extractor=extractor).convert(PAGE) == expected
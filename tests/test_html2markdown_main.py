@@ -0,0 +1,64 @@
+import os
+from html2txt.converters import html2markdown
+
+def write(path, data):
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  with open(path, 'w') as f:
+    f.write(data)
+
+def test_main_jobs_output(tmp_path, capsys):
+  input_path = str(tmp_path / 'in')
+  output_path = str(tmp_path / 'out')
+  write(os.path.join(input_path, 'a.html'), '<p>hello</p>')
+  write(os.path.join(input_path, 'sub', 'b.html'), '<h1>title</h1>')
+  rc = html2markdown.main(['--path', input_path, '--jobs', '2', '--output', output_path,
+                           '--root', input_path, '--prefix', '/site'])
+  assert rc == 0
+  with open(os.path.join(output_path, 'a.md')) as f:
+    assert f.read() == html2markdown.html_to_markdown('<p>hello</p>')
+  with open(os.path.join(output_path, 'sub', 'b.md')) as f:
+    assert f.read() == html2markdown.html_to_markdown('<h1>title</h1>')
+  out = capsys.readouterr().out
+  assert 'file = /site/a.html' in out
+  assert 'file = /site/sub/b.html' in out
+
+def test_main_reports_failures(tmp_path, capsys):
+  input_path = str(tmp_path / 'in')
+  output_path = str(tmp_path / 'out')
+  write(os.path.join(input_path, 'good.html'), '<p>hello</p>')
+  # Unbalanced end tags close the document root
+  write(os.path.join(input_path, 'bad.html'), '<p>a</p></p></p>b')
+  rc = html2markdown.main(['--path', input_path, '--jobs', '2', '--output', output_path])
+  assert rc == 1
+  assert os.path.exists(os.path.join(output_path, 'good.md'))
+  assert not os.path.exists(os.path.join(output_path, 'bad.md'))
+  assert 'error = ' in capsys.readouterr().err
+
+def test_main_output_utf8(tmp_path):
+  input_path = str(tmp_path / 'in')
+  output_path = str(tmp_path / 'out')
+  html = '<p>caf\u00e9 \u2192 \U0001f600</p><p>b</p>'
+  os.makedirs(input_path)
+  with open(os.path.join(input_path, 'a.html'), 'wb') as f:
+    f.write(html.encode('utf-8'))
+  assert html2markdown.main(['--path', input_path, '--output', output_path]) == 0
+  with open(os.path.join(output_path, 'a.md'), 'rb') as f:
+    assert f.read() == html2markdown.html_to_markdown(html).encode('utf-8')
+
+def test_main_profile_tags(tmp_path, capsys):
+  input_path = str(tmp_path / 'in')
+  write(os.path.join(input_path, 'a.html'), '<p><a href="x">link</a></p>')
+  write(os.path.join(input_path, 'b.html'), '<p><a href="y">link</a></p>')
+  rc = html2markdown.main(['--path', input_path, '--jobs', '2', '--profile-tags'])
+  assert rc == 0
+  err = capsys.readouterr().err
+  assert any(line.split()[:2] == ['XhtmlANode', '2'] for line in err.splitlines())
+  assert 'format_link' in err
+
+def test_main_content(tmp_path, capsys):
+  input_path = str(tmp_path / 'in')
+  write(os.path.join(input_path, 'a.html'), '<nav>menu</nav><div id="post"><p>article text that is long enough</p></div>')
+  rc = html2markdown.main(['--path', input_path, '--main-content', '#post'])
+  assert rc == 0
+  out = capsys.readouterr().out
+  assert 'article text' in out and 'menu' not in out
@@ -0,0 +1,55 @@
+import io
+import bz2
+import gzip
+import lzma
+import pytest
+from html2txt import converters
+
+html = '<html><head><title>Café</title></head><body><p>naïve “quotes”</p>\n<pre>a\nb</pre></body></html>'
+
+def write(tmp_path, name, data):
+  path = tmp_path / name
+  path.write_bytes(data)
+  return str(path)
+
+def test_sniff_encoding():
+  assert converters.sniff_encoding(b'\xef\xbb\xbf<p>') == ('utf-8', 3)
+  assert converters.sniff_encoding(b'\xff\xfe<\x00') == ('utf-16-le', 2)
+  assert converters.sniff_encoding(b'<meta charset="ISO-8859-1">') == ('cp1252', 0)
+  assert converters.sniff_encoding(b'<meta http-equiv="Content-Type" content="text/html; charset=koi8-r">') == ('koi8-r', 0)
+  assert converters.sniff_encoding(b'<meta charset="utf-16">') == ('utf-8', 0)
+  assert converters.sniff_encoding(b'<p>no charset</p>') == ('utf-8', 0)
+
+@pytest.mark.parametrize("name, data", [
+  ('utf8.html', html.encode('utf-8')),
+  ('bom.html', b'\xef\xbb\xbf' + html.encode('utf-8')),
+  ('utf16.html', b'\xff\xfe' + html.encode('utf-16-le')),
+  ('meta.html', ('<meta charset="windows-1252">' + html.replace('“', '"').replace('”', '"')).encode('cp1252')),
+  ('crlf.html', html.replace('\n', '\r\n').encode('utf-8')),
+  ('page.html.gz', gzip.compress(html.encode('utf-8'))),
+  ('page.html.bz2', bz2.compress(html.encode('utf-8'))),
+  ('page.html.xz', lzma.compress(html.encode('utf-8'))),
+])
+def test_convert_file(tmp_path, name, data):
+  path = write(tmp_path, name, data)
+  expected = html
+  if name == 'meta.html':
+    expected = '<meta charset="windows-1252">' + html.replace('“', '"').replace('”', '"')
+  assert converters.Html2Markdown().convert_file(path) == converters.Html2Markdown().convert(expected)
+
+def test_read_in_blocks(tmp_path):
+  data = ('<p>é%d</p>\r\n' * 2000) % tuple(range(2000))
+  path = write(tmp_path, 'blocks.html', data.encode('utf-8'))
+  chunks = list(converters.read_html_file(path, block_size=1001))
+  assert len(chunks) > 1
+  assert ''.join(chunks) == data.replace('\r\n', '\n')
+
+def test_convert_file_to_sink(tmp_path):
+  path = write(tmp_path, 'page.html', html.encode('utf-8'))
+  sink = io.BytesIO()
+  converters.Html2Markdown().convert_file(path, sink)
+  assert sink.getvalue() == converters.Html2Markdown().convert(html).encode('utf-8')
+
+def test_empty_file(tmp_path):
+  path = write(tmp_path, 'empty.html', b'')
+  assert converters.Html2Markdown().convert_file(path) == converters.Html2Markdown().convert('')
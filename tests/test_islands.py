@@ -0,0 +1,38 @@
+import pytest
+from html2txt import parsers
+from html2txt import converters
+
+CASES = [
+  '<p>x<svg xmlns="http://www.w3.org/2000/svg" width="10"><g id="a"><circle r="1"/>  <path d="M 0 0"></path></g><!-- c --><title>T</title>tail</svg>after</p>',
+  '<svg><g><a href="x">l<circle/></a></g><rect/></svg>z',
+  '<div><svg>t<svg><g/></svg><?xml version="1.0"?><g/></svg></div>',
+  '<blockquote><svg><g a="' + 'x' * 90 + '" b="' + 'y' * 90 + '"><h/></g></svg></blockquote>',
+  '<table><tr><th><math xmlns="http://www.w3.org/1998/Math/MathML"><mi>x</mi><mo>=</mo></math></th></tr></table>',
+  '<ul><li><svg><g><!--c--><style>s</style><g/></g>t</svg></li></ul>',
+  '<p><math><mtable><mtr><mtd><mtext>a &amp; b</mtext></mtd></mtr></mtable></math>t</p>',
+  '<div><math><mi>x</mi><!--c--></math></div>',
+]
+
+@pytest.mark.parametrize('html', CASES)
+def test_islands_render_like_nodes(html):
+  expected = converters.Html2Markdown(xml_islands=False).convert(html)
+  assert converters.Html2Markdown().convert(html) == expected
+  assert converters.Html2Markdown(memoize=True).convert(html) == expected
+  for i in range(0, len(html), 7):
+    assert ''.join(converters.Html2Markdown().convert_iter([html[:i], html[i:]])) == expected
+
+def test_island_events():
+  root = parsers.HtmlParser(xml_islands=True).parse('<svg><g id="a">t</g><!--c--><rect/></svg>')
+  svg, = root.children
+  island, = svg.children
+  assert type(island) is parsers.XmlIslandNode
+  assert island.events == [('g', {'id': 'a'}, '{http://www.w3.org/1999/xhtml}g'), 't', None, (None, 'c'),
+                           ('rect', {}, '{http://www.w3.org/1999/xhtml}rect'), None]
+
+def test_island_falls_back_to_nodes():
+  html = '<svg><g><circle/><a href="x">link</a></g></svg>'
+  root = parsers.HtmlParser(xml_islands=True).parse(html)
+  svg, = root.children
+  g, = svg.children
+  assert [type(n) for n in g.children] == [parsers.Node, parsers.XhtmlANode]
+  assert parsers.HtmlParser().parse(html).children[0].children[0].name == 'g'
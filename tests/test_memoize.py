@@ -0,0 +1,26 @@
+from html2txt import converters
+
+row = '<tr><td><a href="/x">link</a></td><td><b>bold</b> text</td></tr>'
+nav = '<ul><li><a href="/a">A</a></li><li><a href="/b">B</a></li></ul>'
+
+documents = [
+  '<table><thead><tr><th>a</th><th>b</th></tr></thead><tbody>' + row * 20 + '</tbody></table>',
+  (nav + '<p>para</p>') * 10,
+  '<blockquote>' + nav * 3 + '</blockquote>' + nav * 3,
+  '<ol><li>' + nav + '</li><li>' + nav + '</li></ol>' + nav,
+  # Repeated header tables depend on the column count of the enclosing table
+  '<table><tr><td><table><thead><tr><th>h</th></tr></thead></table></td>'
+  '<td><table><thead><tr><th>h</th></tr></thead></table></td></tr></table>' * 3,
+]
+
+def test_memoize_matches_visit():
+  for html in documents:
+    expected = converters.Html2Markdown().convert(html)
+    h = converters.Html2Markdown(memoize=True)
+    assert h.convert(html) == expected
+
+def test_memoize_skips_repeated_rows():
+  h = converters.Html2Markdown(memoize=True)
+  h.convert(documents[0])
+  assert h.visitor.memo_hits == 19
+  assert h.visitor.memo_skipped_nodes == 19 * 5
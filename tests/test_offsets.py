@@ -0,0 +1,43 @@
+import pytest
+from html2txt import parsers
+from html2txt import converters
+
+HTML = 'a\n<p class="x">Hi <b>there</b><br/>\n<!-- c --><pre>x\n  y &amp; z</pre><svg><g id="g"/></svg><div><span>open'
+
+def spans(node):
+  result = [(node.name, node.source_span)]
+  for child in node.children:
+    result.extend(spans(child))
+  return result
+
+def test_source_spans():
+  root = parsers.HtmlParser(track_offsets=True).parse(HTML)
+  markup = {name: HTML[start:end] for name, (start, end) in spans(root)}
+  assert root.source_span == (0, len(HTML))
+  assert markup['b'] == '<b>there</b>'
+  assert markup['br'] == '<br/>'
+  assert markup['comment'] == '<!-- c -->'
+  assert markup['pre'] == '<pre>x\n  y &amp; z</pre>'
+  assert markup['g'] == '<g id="g"/>'
+  assert markup['span'] == '<span>open'
+  assert markup['p'] == HTML[2:]
+
+def test_source_spans_not_tracked():
+  root = parsers.HtmlParser().parse(HTML)
+  assert all(span is None for name, span in spans(root))
+
+@pytest.mark.parametrize('size', [1, 2, 5, 16])
+def test_source_spans_chunks(size):
+  expected = spans(parsers.HtmlParser(track_offsets=True).parse(HTML))
+  chunks = [HTML[i:i + size] for i in range(0, len(HTML), size)]
+  assert spans(parsers.HtmlParser(track_offsets=True).parse_chunks(chunks)) == expected
+  tree = parsers.HtmlParser(track_offsets=True).parse_chunks(chunks, True)
+  assert spans(tree.materialize()) == expected
+  assert tree.source_span(tree.find(parsers.XhtmlPreNode)[0]) == dict(expected)['pre']
+
+def test_source_spans_html2markdown():
+  converter = converters.Html2Markdown(track_offsets=True)
+  assert converter.convert(HTML) == converters.Html2Markdown().convert(HTML)
+  svg = [node for node in converter.root.children[0].children if node.name == 'svg'][0]
+  start, end = svg.source_span
+  assert HTML[start:end] == '<svg><g id="g"/></svg>'
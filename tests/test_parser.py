@@ -0,0 +1,90 @@
+import pytest
+from html2txt import parsers
+from html2txt.parsers.etreehtmlparser import ETreeHTMLParser
+
+documents = [
+  '<p>Hello <b>world</b> tail</p> more',
+  '<ul><li>one<!-- note --> after</li><li>two</li></ul>',
+  '<div><custom-tag a="1">x</custom-tag>y</div>',
+  '<custom-tag>skipped</custom-tag><p>kept</p>',
+  '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"><use xlink:href="#a"/></svg>',
+  '<table><tr><td>1</td><td>2</td></tr></table>text',
+]
+
+def dump(node):
+  return (type(node).__name__, node.name, node.namespace, list(node.attributes.items()),
+          node.text, node.tail, [dump(child) for child in node.children])
+
+@pytest.mark.parametrize("html", documents)
+def test_parse_matches_parse_tree(html):
+  etree_parser = ETreeHTMLParser()
+  etree_parser.feed(html)
+  p = parsers.HtmlParser()
+  p.namespace_map_ = etree_parser.namespace_uri_map()
+  expected = p.parse_tree(etree_parser.getFragment())
+  assert dump(parsers.HtmlParser().parse(html)) == dump(expected)
+
+def test_node_containers_are_allocated_on_first_write():
+  node = parsers.XhtmlPNode()
+  assert not hasattr(node, '__dict__') or len(node.__dict__) == 0
+  assert node.name == "p" and node.tag == "{http://www.w3.org/1999/xhtml}p"
+  assert node.attributes_ is None and len(node.attributes) == 0
+  assert node.attribute("class") is None
+  assert len(node.children) == 0
+  node.set_attribute("class", "x")
+  node.add_child(parsers.XhtmlBNode())
+  assert node.attribute("class") == "x"
+  assert [child.name for child in node.children] == ["b"]
+  assert node.children[0].parent is node
+  # Containers of other nodes are not shared
+  assert len(parsers.XhtmlPNode().children) == 0
+  assert len(parsers.XhtmlPNode().attributes) == 0
+
+def test_node_containers_are_mutable():
+  node = parsers.XhtmlPNode()
+  node.attributes["class"] = "x"
+  child = parsers.XhtmlBNode()
+  node.children.append(child)
+  node.add_child(parsers.XhtmlINode())
+  assert node.attribute("class") == "x"
+  assert [n.name for n in node.children] == ["b", "i"]
+  # Rendering does not allocate the containers of leaves
+  root = parsers.HtmlParser().parse('<p>a<br/>b</p>')
+  visitor = parsers.MarkdownVisitor()
+  visitor.visit(root)
+  br, = root.children_[0].children_
+  assert br.attributes_ is None and br.children_ is parsers.EMPTY_CHILDREN
+
+def test_generic_node_name():
+  root = parsers.HtmlParser().parse('<div><custom-tag>x</custom-tag></div>')
+  custom = root.children[0].children[0]
+  assert type(custom) is parsers.Node
+  assert custom.tag == "{http://www.w3.org/1999/xhtml}custom-tag"
+  # The name of an unknown tag does not change the class default
+  assert parsers.Node().name == "Node"
+
+def ns_uri_to_prefix_loop(namespace_map, name):
+  for key in namespace_map.keys():
+    name = name.replace('{' + namespace_map[key] + '}', key + ':')
+  return name
+
+def test_ns_uri_to_prefix_matches_loop():
+  p = parsers.HtmlParser()
+  p.namespace_map_ = {
+    "xlink": "http://www.w3.org/1999/xlink",
+    "svg": "http://www.w3.org/2000/svg",
+    "other": "http://www.w3.org/2000/svg",
+  }
+  names = [
+    "href",
+    "{http://www.w3.org/1999/xlink}href",
+    "{http://www.w3.org/2000/svg}width",
+    "{http://example.com/ns}attr",
+    "a{http://www.w3.org/1999/xlink}b",
+    "{http://www.w3.org/1999/xlink}{http://www.w3.org/2000/svg}x",
+  ]
+  for name in names:
+    assert p.ns_uri_to_prefix(name) == ns_uri_to_prefix_loop(p.namespace_map_, name)
+  # The index follows namespaces added while parsing
+  p.namespace_map_["example"] = "http://example.com/ns"
+  assert p.ns_uri_to_prefix("{http://example.com/ns}attr") == "example:attr"
@@ -0,0 +1,34 @@
+from html2txt import parsers
+from html2txt import converters
+
+HTML = '<h1>Title</h1><p>see <a href="x">x</a> and <a href="y">y</a></p><blockquote><p>quote</p></blockquote><script>s</script>'
+
+def test_profiling_visitor_output_is_unchanged():
+  profile = parsers.TagProfile()
+  for kwargs in [{}, {'columnar': True}, {'memoize': True}]:
+    expected = converters.Html2Markdown(**kwargs).convert(HTML)
+    assert converters.Html2Markdown(profile=profile, **kwargs).convert(HTML) == expected
+  assert profile.entries['XhtmlANode'][0] == 6
+
+def test_profile_entries():
+  m = parsers.ProfilingMarkdownVisitor()
+  m.visit(parsers.HtmlParser().parse(HTML))
+  entries = m.profile.entries
+  calls, inclusive, exclusive, chars = entries['XhtmlANode']
+  assert calls == 2 and inclusive >= exclusive > 0
+  assert entries['format_link'][0] == 2
+  assert entries['XhtmlScriptNode'][0] == 1
+  # The root includes everything
+  assert entries['Node'][1] >= entries['XhtmlBlockquoteNode'][1]
+  assert entries['XhtmlH1Node'][3] == len('# Title')
+
+def test_profiles_merge():
+  a = parsers.TagProfile()
+  a.add('XhtmlPNode', 2.0, 1.0, 10)
+  b = parsers.TagProfile(a.as_dict())
+  b.add('XhtmlPNode', 1.0, 1.0, 5)
+  b.add('format_p_tag', 0.5, 0.5, 1)
+  a.merge(b)
+  assert a.entries == {'XhtmlPNode': [3, 5.0, 3.0, 25], 'format_p_tag': [1, 0.5, 0.5, 1]}
+  report = a.report(limit=1, sort='chars').splitlines()
+  assert len(report) == 2 and report[1].startswith('XhtmlPNode')
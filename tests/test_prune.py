@@ -0,0 +1,50 @@
+from html2txt import parsers
+from html2txt import converters
+
+HTML = ('<p>a<script>if (a < b) { document.write("<p>x</p>"); }</script>b'
+        '<form><input name="q"/><button>Go <b>now</b></button></form>c'
+        '<style>p { color: red; }</style>d<!-- e --></p>')
+
+def test_prune_ignored_keeps_tails():
+  root = parsers.HtmlParser(prune_ignored=True).parse(HTML)
+  p, = root.children
+  assert [(type(n), n.tail) for n in p.children] == [
+    (parsers.XhtmlScriptNode, 'b'),
+    (parsers.XhtmlFormNode, 'c'),
+    (parsers.XhtmlStyleNode, 'd'),
+    (parsers.XhtmlCommentNode, None),
+  ]
+  assert all(len(n.children) == 0 and n.text is None for n in p.children[:3])
+
+def test_prune_ignored_same_markdown():
+  expected = converters.Html2Markdown(prune_ignored=False).convert(HTML)
+  assert converters.Html2Markdown().convert(HTML) == expected
+  assert converters.Html2Markdown(columnar=True).convert(HTML) == expected
+  assert ''.join(converters.Html2Markdown().convert_iter([HTML[:20], HTML[20:70], HTML[70:]])) == expected
+
+def test_prune_ignored_unbalanced_tags():
+  # Void elements in pruned content have no end tag, so </form> ends the
+  # form and the rest of the div is kept
+  html = '<div><form><input></form>x<br/>y</div>z<p>t</p>'
+  root = parsers.HtmlParser(prune_ignored=True).parse(html)
+  div, p = root.children
+  form, br = div.children
+  assert (type(form), form.tail, len(form.children)) == (parsers.XhtmlFormNode, 'x', 0)
+  assert (type(br), br.tail, div.tail, p.text) == (parsers.XhtmlBrNode, 'y', 'z', 't')
+
+def test_prune_ignored_void_elements():
+  # Pruned void elements without an end tag do not prune what follows them
+  for html, kept in [
+      ('<div><p>one</p><link rel="x" href="y"><p>two</p></div>', 'two'),
+      ('<p>a<meta charset="utf-8">b</p><p>after</p>', 'b'),
+      ('<head><meta charset="utf-8"><link rel="x"><title>t</title></head><body>main</body>', 'main')]:
+    assert kept in converters.Html2Markdown().convert(html)
+    assert kept in converters.Html2Markdown(columnar=True).convert(html)
+  root = parsers.HtmlParser(prune_ignored=True).parse('<p>a<meta charset="utf-8">b</p>')
+  p, = root.children
+  meta, = p.children
+  assert (p.text, type(meta), meta.tail) == ('a', parsers.XhtmlMetaNode, 'b')
+  # Without pruning the open link takes the first </div>, so the second one
+  # does not pop the root
+  html = '<div><link rel="x"><p>t</p></div></div>tail'
+  assert converters.Html2Markdown().convert(html) == 't\n\ntail'
@@ -0,0 +1,66 @@
+import io
+import socket
+import pytest
+from html2txt import converters
+from html2txt import parsers
+
+html = ('<h1>Title</h1><p>café <b>bold</b></p>'
+        '<blockquote><p>quoted</p><blockquote><p>nested</p></blockquote></blockquote>'
+        '<table><thead><tr><th>a</th><th>b</th></tr></thead><tr><td>1</td><td>2</td></tr></table>'
+        '<ul><li>one</li><li>two</li></ul>') * 20
+
+def test_text_sink():
+  sink = io.StringIO()
+  count = converters.Html2Markdown().convert_to(html, sink)
+  expected = converters.Html2Markdown().convert(html)
+  assert sink.getvalue() == expected
+  assert count == len(expected)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_binary_sink(columnar):
+  sink = io.BytesIO()
+  writer = io.BufferedWriter(sink)
+  converters.Html2Markdown(columnar=columnar).convert_to(html, writer)
+  assert sink.getvalue() == converters.Html2Markdown().convert(html).encode('utf-8')
+
+def test_encoding():
+  sink = io.BytesIO()
+  converters.Html2Markdown().convert_to(html, sink, encoding='utf-16-le')
+  assert sink.getvalue() == converters.Html2Markdown().convert(html).encode('utf-16-le')
+
+def test_sink_writes_in_blocks():
+  writes = []
+  class Sink:
+    def write(self, data):
+      writes.append(data)
+  m = parsers.MarkdownVisitor(Sink())
+  m.data_[0].buffer_size_ = 100
+  m.visit(parsers.HtmlParser().parse(html))
+  m.flush_data()
+  assert len(writes) > 1
+  assert ''.join(writes) == converters.Html2Markdown().convert(html)
+  assert m.text == ''
+
+def test_socket_sink():
+  a, b = socket.socketpair()
+  try:
+    converters.Html2Markdown().convert_to('<p>over a socket</p>', a)
+    a.close()
+    data = b''
+    while True:
+      chunk = b.recv(4096)
+      if len(chunk) == 0:
+        break
+      data += chunk
+  finally:
+    b.close()
+  assert data == converters.Html2Markdown().convert('<p>over a socket</p>').encode('utf-8')
+
+def test_cached_sink():
+  cache = converters.ConversionCache()
+  converter = converters.Html2Markdown(cache=cache)
+  for i in range(2):
+    sink = io.StringIO()
+    converter.convert_to(html, sink)
+    assert sink.getvalue() == converters.Html2Markdown().convert(html)
+  assert converter.cache_hits == 1
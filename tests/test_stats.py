@@ -0,0 +1,47 @@
+import io
+from html2txt import converters
+
+HTML = '<h1>Title</h1><table><tr><th>a</th></tr><tr><td>1</td></tr></table><blockquote><p>quote</p></blockquote>'
+
+def test_stats_are_off_by_default():
+  h = converters.Html2Markdown()
+  h.convert(HTML)
+  assert h.stats is None
+
+def test_stats_of_convert():
+  h = converters.Html2Markdown(stats=True)
+  text = h.convert(HTML)
+  assert text == converters.Html2Markdown().convert(HTML)
+  stats = h.stats
+  assert set(stats.phases) == set(['read', 'feed', 'close', 'count', 'render'])
+  assert stats.wall_time() >= stats.wall_time('feed') > 0
+  assert stats.cpu_time('render') >= 0
+  assert stats.nodes == {None: 1, 'http://www.w3.org/1999/xhtml': 8}
+  assert stats.max_depth == 3
+  assert (stats.chars_in, stats.chars_out) == (len(HTML), len(text))
+  # th cell and blockquote
+  assert stats.buffer_pushes == 2
+  assert not stats.cached
+
+def test_columnar_stats_count_the_same_nodes():
+  h = converters.Html2Markdown(stats=True)
+  h.convert(HTML)
+  c = converters.Html2Markdown(stats=True, columnar=True)
+  c.convert(HTML)
+  assert (c.stats.nodes, c.stats.max_depth) == (h.stats.nodes, h.stats.max_depth)
+
+def test_stats_of_sink_and_iter():
+  h = converters.Html2Markdown(stats=True)
+  sink = io.StringIO()
+  count = h.convert_to(HTML, sink)
+  assert h.stats.chars_out == count == len(sink.getvalue())
+  text = ''.join(h.convert_iter([HTML[:20], HTML[20:]]))
+  assert h.stats.chars_out == len(text)
+  assert h.stats.node_count == 0
+
+def test_stats_of_cache_hit():
+  h = converters.Html2Markdown(stats=True, cache=converters.ConversionCache())
+  h.convert(HTML)
+  h.convert(HTML)
+  assert h.stats.cached
+  assert list(h.stats.phases) == ['cache']
@@ -0,0 +1,30 @@
+from html2txt import converters
+from html2txt import parsers
+
+def test_header_rows_wrap_around():
+  table_state = parsers.TableState()
+  table_state.header_ = ['a', 'b', 'c', 'd', 'e']
+  table_state.alignment_ = [':---', None, '---:']
+  table_state.columns_ = 2
+  # Cells past the last column go below the first ones
+  assert table_state.header_rows() == '|a<br>c<br>e|b<br>d|\n|---:||\n'
+  assert table_state.header_ == ['a', 'b', 'c', 'd', 'e', '', '', '']
+
+def test_th_cell_buffer_is_reused():
+  html = '<table><tr>' + '<th>h</th>' * 100 + '</tr><tr><td>1</td></tr></table>'
+  m = parsers.MarkdownVisitor()
+  m.visit(parsers.HtmlParser().parse(html))
+  assert len(m.cell_buffers_) == 1
+  assert m.text.startswith('\n|' + 'h|' * 100 + '\n|' + '---|' * 100 + '\n|1|\n')
+
+def test_convert_iter_emits_rows_before_table_closes():
+  html = ['<table><thead><tr><th>a</th><th>b</th></tr></thead><tbody>']
+  html += ['<tr><td>%d</td><td>x</td></tr>' % (row,) for row in range(100)]
+  html += ['</tbody></table>tail']
+  texts = []
+  for text in converters.Html2Markdown().convert_iter(html):
+    texts.append(text)
+    if '|50|x|' in ''.join(texts):
+      break
+  assert len(texts) < len(html) - 1
+  assert ''.join(converters.Html2Markdown().convert_iter(html)) == converters.Html2Markdown().convert(''.join(html))
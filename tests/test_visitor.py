@@ -0,0 +1,56 @@
+from html2txt.parsers import visitor as v
+
+class Base:
+  pass
+
+class Derived(Base):
+  pass
+
+class MoreDerived(Derived):
+  pass
+
+class Other:
+  pass
+
+class NameVisitor:
+  @v.on('node')
+  def visit(self, node):
+    pass
+
+  @visit.when(Base)
+  def visit(self, node):
+    return 'Base'
+
+  @visit.when(Derived)
+  def visit(self, node):
+    return 'Derived'
+
+  @v.when(Other)
+  def visit(self, node):
+    return 'Other'
+
+def test_dispatch_exact_type():
+  assert NameVisitor().visit(Base()) == 'Base'
+  assert NameVisitor().visit(Derived()) == 'Derived'
+  assert NameVisitor().visit(Other()) == 'Other'
+
+def test_dispatch_uses_closest_base_class():
+  assert NameVisitor().visit(MoreDerived()) == 'Derived'
+  assert NameVisitor.visit.cache[MoreDerived] is NameVisitor.visit.targets[Derived]
+
+def test_dispatch_without_target():
+  assert NameVisitor().visit(object()) == []
+
+def test_add_target_clears_cache():
+  class Visitor:
+    @v.on('node')
+    def visit(self, node):
+      pass
+
+    @visit.when(Base)
+    def visit(self, node):
+      return 'Base'
+
+  assert Visitor().visit(MoreDerived()) == 'Base'
+  Visitor.visit.add_target(MoreDerived, lambda self, node: 'MoreDerived')
+  assert Visitor().visit(MoreDerived()) == 'MoreDerived'